@@ -0,0 +1,4 @@
+# Benchmarks package
+# Bu paket, modüllerin performansını ölçen benchmark script'lerini içerir.
+# Script'ler proje kök klasöründen modül olarak çalıştırılır:
+#   python -m benchmarks.bench_augmentation
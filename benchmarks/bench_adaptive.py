@@ -0,0 +1,124 @@
+# ============================================================================
+# BENCHMARK: HEDEF DOĞRULUĞA ULAŞMA SÜRESİ (SABİT vs UYARLANABİLİR BATCH)
+# ============================================================================
+# Aynı sentetik veri ve aynı başlangıç ağırlıklarıyla iki eğitimi karşılaştırır:
+#   'fixed'   : train_model() ile sabit batch boyutu, doğrulama epoch sonunda
+#   'adaptive': train_adaptive() ile her N adımda alt örnek doğrulaması,
+#               gradyan gürültüsüne göre büyüyen batch ve erken durma
+# Her ikisi de hedef val_accuracy'ye ulaşınca durur; duvar saati süresi,
+# işlenen görüntü sayısı ve son doğruluk raporlanır.
+#
+# Kullanım:
+#   python -m benchmarks.bench_adaptive --target 0.97
+#   python -m benchmarks.bench_adaptive --model semih --samples 32768 --output adaptive.json
+# ============================================================================
+
+import argparse
+import json
+import time
+
+
+def _fixed_batch_run(model, X_train, Y_train, X_val, Y_val, epochs, batch_size, target):
+    """Sabit batch ile eğitir; her epoch sonunda hedef doğruluk kontrol edilir."""
+    from tensorflow.keras.callbacks import Callback
+    from modules.model_trainer import train_model
+
+    class TargetStop(Callback):
+        def on_train_begin(self, logs=None):
+            self.start, self.time_to_target = time.perf_counter(), None
+
+        def on_epoch_end(self, epoch, logs=None):
+            if (logs or {}).get('val_accuracy', 0.0) >= target:
+                self.time_to_target = time.perf_counter() - self.start
+                self.model.stop_training = True
+
+    stopper = TargetStop()
+    start = time.perf_counter()
+    history = train_model(model, X_train, Y_train, X_val, Y_val, epochs=epochs,
+                          batch_size=batch_size, use_augmentation=False,
+                          callbacks=[stopper], verbose=0)
+    wall_s = time.perf_counter() - start
+    epochs_seen = len(history.history['loss'])
+    return {
+        'wall_s': wall_s,
+        'time_to_target_s': stopper.time_to_target,
+        'epochs_seen': float(epochs_seen),
+        'images_seen': epochs_seen * len(X_train),
+        'final_batch_size': batch_size,
+        'val_accuracy': float(history.history['val_accuracy'][-1]),
+    }
+
+
+def run_benchmark(model_type='simple', num_samples=16384, num_val=2048, epochs=10,
+                  batch_size=32, max_batch_size=1024, target=0.97, eval_every=50,
+                  lr_scaling='sqrt'):
+    """
+    Sabit ve uyarlanabilir batch ile hedef doğruluğa ulaşma süresini ölçer.
+
+    Döndürür:
+    --------
+    dict
+        Yöntem adı -> {'wall_s', 'time_to_target_s', 'epochs_seen', 'images_seen',
+        'final_batch_size', 'val_accuracy'}
+    """
+    from benchmarks.synthetic import make_synthetic_mnist
+    from modules.adaptive_trainer import train_adaptive
+    from modules.model_builder import create_cnn_model
+    import config
+
+    X, Y = make_synthetic_mnist(num_samples + num_val, compact_dtypes=True)
+    X_train, Y_train, X_val, Y_val = X[:num_samples], Y[:num_samples], X[num_samples:], Y[num_samples:]
+
+    model = create_cnn_model(config.INPUT_SHAPE, config.NUM_CLASSES, model_type,
+                             compact_dtypes=True, summary=False)
+    initial_weights = model.get_weights()
+
+    results = {'fixed': _fixed_batch_run(model, X_train, Y_train, X_val, Y_val,
+                                         epochs, batch_size, target)}
+
+    model = create_cnn_model(config.INPUT_SHAPE, config.NUM_CLASSES, model_type,
+                             compact_dtypes=True, summary=False)
+    model.set_weights(initial_weights)
+    _, history = train_adaptive(model, X_train, Y_train, X_val, Y_val, epochs=epochs,
+                                batch_size=batch_size, max_batch_size=max_batch_size,
+                                eval_every=eval_every, val_samples=num_val,
+                                target_accuracy=target, lr_scaling=lr_scaling,
+                                use_augmentation=False, seed=config.RANDOM_STATE)
+    results['adaptive'] = {key: history.summary[key] for key in results['fixed']}
+
+    print("\n" + "="*78)
+    print(f"HEDEF DOĞRULUĞA ULAŞMA ({model_type}, hedef val_accuracy {target}, "
+          f"{num_samples} eğitim görüntüsü)")
+    print("="*78)
+    print(f"{'Yöntem':<10}{'Süre':>10}{'Hedefe':>10}{'Epoch':>8}{'Son batch':>11}{'Accuracy':>10}")
+    for name, r in results.items():
+        to_target = f"{r['time_to_target_s']:.1f}s" if r['time_to_target_s'] is not None else "-"
+        print(f"{name:<10}{r['wall_s']:>9.1f}s{to_target:>10}{r['epochs_seen']:>8.2f}"
+              f"{r['final_batch_size']:>11}{r['val_accuracy']:>10.4f}")
+    fixed, adaptive = results['fixed']['time_to_target_s'], results['adaptive']['time_to_target_s']
+    if fixed and adaptive:
+        print(f"\nHedefe ulaşma hızlanması: {fixed / adaptive:.2f}x")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sabit ve uyarlanabilir batch ile hedef doğruluk süresi")
+    parser.add_argument("--model", default='simple', choices=['simple', 'standard', 'deep', 'semih'])
+    parser.add_argument("--samples", type=int, default=16384)
+    parser.add_argument("--val-samples", type=int, default=2048)
+    parser.add_argument("--epochs", type=int, default=10, help="En fazla epoch (bütçe)")
+    parser.add_argument("--batch-size", type=int, default=32, help="Başlangıç batch boyutu")
+    parser.add_argument("--max-batch-size", type=int, default=1024)
+    parser.add_argument("--target", type=float, default=0.97, help="Hedef val_accuracy")
+    parser.add_argument("--eval-every", type=int, default=50)
+    parser.add_argument("--lr-scaling", default='sqrt', choices=['linear', 'sqrt', 'none'])
+    parser.add_argument("--output", default=None, help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.model, args.samples, args.val_samples, args.epochs,
+                            args.batch_size, args.max_batch_size, args.target,
+                            args.eval_every, args.lr_scaling)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Sonuçlar kaydedildi: {args.output}")
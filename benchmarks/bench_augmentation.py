@@ -0,0 +1,96 @@
+# ============================================================================
+# BENCHMARK: VERİ ARTIRMA HIZI (ImageDataGenerator.flow vs tf.data vs NumPy)
+# ============================================================================
+# Kullanım:
+#   python -m benchmarks.bench_augmentation --samples 8192 --batches 200
+#   python -m benchmarks.bench_augmentation --workers 0 1 2 4 8
+# ============================================================================
+
+import argparse
+import os
+import time
+
+from benchmarks.synthetic import make_synthetic_mnist
+from modules.data_augmentation_module import (create_data_generator, create_train_generator,
+                                              create_tf_dataset)
+import config
+
+
+def _images_per_second(iterator, num_batches, batch_size, warmup=5):
+    """Iterator'dan num_batches batch çeker ve saniyedeki görüntü sayısını döndürür."""
+    for _ in range(warmup):
+        next(iterator)
+    start = time.perf_counter()
+    for _ in range(num_batches):
+        next(iterator)
+    elapsed = time.perf_counter() - start
+    return num_batches * batch_size / elapsed
+
+
+def _sequence_iterator(sequence):
+    """Sequence nesnesini epoch'lar boyunca sonsuz bir iterator'a çevirir."""
+    while True:
+        for index in range(len(sequence)):
+            yield sequence[index]
+        sequence.on_epoch_end()
+
+
+def run_benchmark(num_samples=8192, num_batches=200, batch_size=32, worker_counts=(0,)):
+    """
+    Keras ImageDataGenerator.flow, tf.data pipeline'ı ve NumPy motorunun
+    (farklı işçi sayılarıyla) augmentation hızını (görüntü/saniye) karşılaştırır.
+    
+    Döndürür:
+    --------
+    dict
+        Her altyapı için görüntü/saniye değerleri
+    """
+    X, Y = make_synthetic_mnist(num_samples)
+    aug = dict(rotation_range=config.ROTATION_RANGE,
+               width_shift_range=config.WIDTH_SHIFT_RANGE,
+               height_shift_range=config.HEIGHT_SHIFT_RANGE,
+               zoom_range=config.ZOOM_RANGE)
+    
+    datagen = create_data_generator(**aug)
+    keras_iterator = create_train_generator(datagen, X, Y, batch_size)
+    keras_ips = _images_per_second(keras_iterator, num_batches, batch_size)
+    
+    dataset = create_tf_dataset(X, Y, batch_size, **aug).repeat()
+    tfdata_ips = _images_per_second(iter(dataset), num_batches, batch_size)
+    
+    results = {'keras': keras_ips, 'tfdata': tfdata_ips}
+    
+    for workers in worker_counts:
+        numpy_gen = create_data_generator(**aug, backend='numpy', num_workers=workers,
+                                          prefetch_batches=max(2 * workers, 2))
+        sequence = numpy_gen.flow(X, Y, batch_size=batch_size)
+        try:
+            results[f'numpy_{workers}'] = _images_per_second(
+                _sequence_iterator(sequence), num_batches, batch_size)
+        finally:
+            sequence.close()
+    
+    print("\n" + "="*60)
+    print("VERİ ARTIRMA BENCHMARK SONUÇLARI")
+    print("="*60)
+    print(f"  - ImageDataGenerator.flow: {keras_ips:,.0f} görüntü/sn")
+    print(f"  - tf.data pipeline'ı:      {tfdata_ips:,.0f} görüntü/sn")
+    print(f"  - Hızlanma: {tfdata_ips / keras_ips:.2f}x")
+    for workers in worker_counts:
+        ips = results[f'numpy_{workers}']
+        print(f"  - NumPy motoru ({workers} işçi): {ips:,.0f} görüntü/sn "
+              f"({ips / keras_ips:.2f}x)")
+    
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Veri artırma hız karşılaştırması")
+    parser.add_argument("--samples", type=int, default=8192)
+    parser.add_argument("--batches", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=config.BATCH_SIZE)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[0, 1, 2, os.cpu_count() or 1],
+                        help="NumPy motoru için denenecek işçi süreç sayıları")
+    args = parser.parse_args()
+    run_benchmark(args.samples, args.batches, args.batch_size, tuple(args.workers))
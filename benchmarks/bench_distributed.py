@@ -0,0 +1,94 @@
+# ============================================================================
+# BENCHMARK: ÇOK SÜREÇLİ VERİ PARALEL CPU EĞİTİMİ ÖLÇEKLENMESİ
+# ============================================================================
+# 1/2/4/8 işçi süreciyle (MultiWorkerMirroredStrategy, localhost) eğitim
+# throughput'unu ölçer. İşçi başına batch sabittir, global batch işçi
+# sayısıyla büyür; çekirdekler işçilere eşit bölünür.
+#
+# Kullanım:
+#   python -m benchmarks.bench_distributed --workers 1 2 4 8 --samples 16384
+#   python -m benchmarks.bench_distributed --model simple --output scaling.json
+# ============================================================================
+
+import argparse
+import json
+import os
+import tempfile
+
+import numpy as np
+
+
+def run_benchmark(worker_counts=(1, 2, 4, 8), num_samples=16384, model_type='semih',
+                  epochs=3, per_worker_batch_size=64, use_augmentation=False):
+    """
+    Her işçi sayısı için epoch süresi, throughput ve ölçeklenme verimini ölçer.
+
+    Döndürür:
+    --------
+    list
+        Her işçi sayısı için sonuç sözlükleri
+    """
+    from benchmarks.synthetic import make_synthetic_mnist
+    from modules.distributed_trainer import launch_workers
+
+    X, Y = make_synthetic_mnist(num_samples, compact_dtypes=True)
+    split = int(num_samples * 0.9)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='bench_distributed_') as work_dir:
+        data_dir = os.path.join(work_dir, 'data')
+        os.makedirs(data_dir)
+        for name, array in (('X_train', X[:split]), ('Y_train', Y[:split]),
+                            ('X_val', X[split:]), ('Y_val', Y[split:])):
+            np.save(os.path.join(data_dir, f'{name}.npy'), array)
+
+        for num_workers in worker_counts:
+            print(f"\n--- {num_workers} işçi ---")
+            result = launch_workers(num_workers, data_dir, os.path.join(work_dir, f'run_{num_workers}'),
+                                    model_type=model_type, epochs=epochs,
+                                    per_worker_batch_size=per_worker_batch_size,
+                                    use_augmentation=use_augmentation)
+            results.append({
+                'num_workers': num_workers,
+                'global_batch_size': result['global_batch_size'],
+                'first_epoch_s': result['epoch_seconds'][0],
+                'epoch_s': result['epoch_seconds_mean'],
+                'images_per_s': result['images_per_second'],
+                'val_accuracy': max(result['history']['val_accuracy']),
+            })
+
+    baseline = results[0]['images_per_s'] / results[0]['num_workers']
+    for r in results:
+        r['speedup'] = r['images_per_s'] / baseline
+        r['efficiency'] = r['speedup'] / r['num_workers']
+
+    print("\n" + "="*80)
+    print(f"VERİ PARALEL EĞİTİM ÖLÇEKLENMESİ ({model_type}, işçi başına batch {per_worker_batch_size}, "
+          f"{os.cpu_count()} çekirdek)")
+    print("="*80)
+    print(f"{'İşçi':<6}{'Global batch':>14}{'İlk epoch':>12}{'Epoch':>10}{'Görüntü/s':>12}"
+          f"{'Hızlanma':>10}{'Verim':>8}{'Val acc':>10}")
+    for r in results:
+        print(f"{r['num_workers']:<6}{r['global_batch_size']:>14}{r['first_epoch_s']:>11.2f}s"
+              f"{r['epoch_s']:>9.2f}s{r['images_per_s']:>12.0f}{r['speedup']:>9.2f}x"
+              f"{r['efficiency']:>8.0%}{r['val_accuracy']:>10.4f}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Çok süreçli veri paralel eğitim ölçeklenme benchmark'ı")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--samples", type=int, default=16384)
+    parser.add_argument("--model", default='semih', choices=['simple', 'standard', 'deep', 'semih'])
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--per-worker-batch-size", type=int, default=64)
+    parser.add_argument("--augment", action="store_true")
+    parser.add_argument("--output", default=None, help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    results = run_benchmark(tuple(args.workers), args.samples, args.model, args.epochs,
+                            args.per_worker_batch_size, args.augment)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Sonuçlar kaydedildi: {args.output}")
@@ -0,0 +1,68 @@
+# ============================================================================
+# BENCHMARK: ENSEMBLE TAHMİN GECİKMESİ
+# ============================================================================
+# 'standard', 'deep' ve 'semih' modellerini sentetik veriyle kısa süre
+# eğitir (veya --models ile verilen checkpoint'leri yükler) ve ağırlıklı
+# ortalama ensemble'ını üç yöntemle zamanlar: model başına ayrı geçiş
+# (sıralı), tek graph ('fused') ve thread havuzu ('threads').
+#
+# Kullanım:
+#   python -m benchmarks.bench_ensemble --samples 8192 --eval-samples 4096
+#   python -m benchmarks.bench_ensemble --checkpoints standardbest_model.keras deepbest_model.keras
+# ============================================================================
+
+import argparse
+import json
+
+
+def run_benchmark(model_types=('standard', 'deep', 'semih'), checkpoints=None, num_samples=8192,
+                  num_eval=4096, epochs=1, batch_size=256, weights=None):
+    """
+    Ensemble yöntemlerinin gecikmesini ve doğruluğunu ölçer.
+
+    Döndürür:
+    --------
+    dict
+        compare_ensemble_latency() çıktısı
+    """
+    from benchmarks.synthetic import make_synthetic_mnist
+    from modules.ensemble import compare_ensemble_latency, load_ensemble_members
+    import config
+
+    X, Y = make_synthetic_mnist(num_samples + num_eval, compact_dtypes=True)
+    X_eval, Y_eval = X[num_samples:], Y[num_samples:]
+
+    if checkpoints:
+        members = load_ensemble_members(checkpoints)
+    else:
+        from modules.model_builder import create_cnn_model
+        members = []
+        for model_type in model_types:
+            model = create_cnn_model(config.INPUT_SHAPE, config.NUM_CLASSES, model_type,
+                                     compact_dtypes=True, summary=False)
+            model.fit(X[:num_samples], Y[:num_samples], batch_size=32, epochs=epochs, verbose=0)
+            members.append(model)
+
+    return compare_ensemble_latency(members, X_eval, weights=weights, batch_size=batch_size, Y=Y_eval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ensemble tahmin gecikmesi benchmark'ı")
+    parser.add_argument("--models", nargs="+", default=['standard', 'deep', 'semih'],
+                        choices=['simple', 'standard', 'deep', 'semih'])
+    parser.add_argument("--checkpoints", nargs="+", default=None,
+                        help="Sentetik eğitim yerine yüklenecek checkpoint'ler")
+    parser.add_argument("--samples", type=int, default=8192)
+    parser.add_argument("--eval-samples", type=int, default=4096)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--weights", type=float, nargs="+", default=None)
+    parser.add_argument("--output", default=None, help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    results = run_benchmark(tuple(args.models), args.checkpoints, args.samples, args.eval_samples,
+                            args.epochs, args.batch_size, args.weights)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Sonuçlar kaydedildi: {args.output}")
@@ -0,0 +1,245 @@
+# ============================================================================
+# BENCHMARK: TAM PIPELINE REGRESYON TESTİ
+# ============================================================================
+# Pipeline'ın her modülünü sentetik MNIST boyutlarında veriyle (data/train.csv
+# gerekmez) ayrı ayrı zamanlar:
+#   - load_and_preprocess_data (CSV, önbellek ilk oluşturma, önbellekten okuma)
+#   - create_train_generator / create_tf_dataset iterasyonu
+#   - her model_type için train_model ile bir epoch
+#   - evaluate_model ve make_predictions (bellek içi ve akış modu)
+#
+# Sonuçlar JSON olarak kaydedilir; --baseline ile verilen referansa göre
+# eşikten (varsayılan %10) fazla yavaşlayan ölçümler işaretlenir ve çıkış
+# kodu 1 olur.
+#
+# Kullanım:
+#   python -m benchmarks.bench_pipeline --output baseline.json
+#   python -m benchmarks.bench_pipeline --baseline baseline.json --threshold 0.10
+# ============================================================================
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+
+def _timed(fn, repeats=1):
+    """fn'yi repeats kez çalıştırır; en iyi süreyi (s) ve son sonucu döndürür."""
+    best = float('inf')
+    result = None
+    for _ in range(repeats):
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+    return best, result
+
+
+def _write_synthetic_csv(path, X, labels=None):
+    """Görüntüleri Kaggle MNIST CSV formatında (label, pixel0..pixel783) yazar."""
+    pixels = X.reshape(len(X), -1).astype(np.int64)
+    header = [f'pixel{i}' for i in range(pixels.shape[1])]
+    if labels is not None:
+        pixels = np.column_stack([labels, pixels])
+        header = ['label'] + header
+    np.savetxt(path, pixels, fmt='%d', delimiter=',', header=','.join(header), comments='')
+
+
+def _iterate(iterator, num_batches):
+    for _ in range(num_batches):
+        next(iterator)
+
+
+def run_benchmark(num_samples=8192, num_test=4096, model_types=('simple', 'standard', 'deep', 'semih'),
+                  num_batches=100, batch_size=32, repeats=3):
+    """
+    Pipeline modüllerini zamanlar.
+
+    Döndürür:
+    --------
+    dict
+        {'meta': ortam bilgisi, 'results': ölçüm adı -> saniye}
+    """
+    import tensorflow as tf
+    import config
+    from benchmarks.synthetic import make_synthetic_mnist
+    from modules.data_loader import load_and_preprocess_data
+    from modules.data_augmentation_module import (create_data_generator, create_train_generator,
+                                                  create_tf_dataset)
+    from modules.model_builder import create_cnn_model
+    from modules.model_trainer import train_model
+    from modules.model_evaluator import evaluate_model
+    from modules.predictor import make_predictions
+    from modules.plotting import configure_plotting, finish_plotting
+
+    compact = config.COMPACT_DTYPES
+    results = {}
+    configure_plotting('off')
+    with tempfile.TemporaryDirectory(prefix='bench_pipeline_') as work_dir:
+        # Sentetik CSV dosyaları
+        X, labels = make_synthetic_mnist(num_samples + num_test, compact_dtypes=True)
+        train_csv = os.path.join(work_dir, 'train.csv')
+        test_csv = os.path.join(work_dir, 'test.csv')
+        _write_synthetic_csv(train_csv, X[:num_samples], labels[:num_samples])
+        _write_synthetic_csv(test_csv, X[num_samples:])
+        cache_dir = os.path.join(work_dir, 'cache')
+
+        def load(use_cache):
+            return load_and_preprocess_data(train_csv, test_csv,
+                                            validation_split=config.VALIDATION_SPLIT,
+                                            random_state=config.RANDOM_STATE,
+                                            use_cache=use_cache, cache_dir=cache_dir,
+                                            compact_dtypes=compact)
+
+        results['load_csv'], data = _timed(lambda: load(False), repeats)
+        results['load_cache_build'], _ = _timed(lambda: load(True))
+        results['load_cache_warm'], _ = _timed(lambda: load(True), repeats)
+        X_train, X_val, Y_train, Y_val, X_test = data
+
+        # Veri artırma generator'ları (num_batches batch)
+        aug = dict(rotation_range=config.ROTATION_RANGE,
+                   width_shift_range=config.WIDTH_SHIFT_RANGE,
+                   height_shift_range=config.HEIGHT_SHIFT_RANGE,
+                   zoom_range=config.ZOOM_RANGE)
+
+        def keras_generator():
+            iterator = create_train_generator(create_data_generator(**aug), X_train, Y_train,
+                                              batch_size)
+            _iterate(iterator, num_batches)
+
+        def tfdata_generator():
+            dataset = create_tf_dataset(X_train, Y_train, batch_size, **aug,
+                                        seed=config.RANDOM_STATE).repeat()
+            _iterate(iter(dataset), num_batches)
+
+        results['train_generator_keras'], _ = _timed(keras_generator, repeats)
+        results['train_generator_tfdata'], _ = _timed(tfdata_generator, repeats)
+
+        # Her model tipi için bir epoch (veri artırmasız, callback'siz). Isınma
+        # fit'i aynı batch şekilleriyle (tam + son eksik batch) train/test
+        # fonksiyonlarını izler; böylece ölçüme tf.function izleme süresi girmez
+        train_warmup = batch_size + len(X_train) % batch_size
+        val_warmup = batch_size + len(X_val) % batch_size
+        model = None
+        for model_type in model_types:
+            tf.keras.backend.clear_session()
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                model = create_cnn_model(config.INPUT_SHAPE, config.NUM_CLASSES, model_type,
+                                         compact_dtypes=compact)
+            model.fit(X_train[:train_warmup], Y_train[:train_warmup], batch_size=batch_size,
+                      epochs=1, validation_data=(X_val[:val_warmup], Y_val[:val_warmup]), verbose=0)
+            results[f'train_epoch_{model_type}'], _ = _timed(
+                lambda: train_model(model, X_train, Y_train, X_val, Y_val, epochs=1,
+                                    batch_size=batch_size, use_augmentation=False, verbose=0),
+                repeats)
+
+        # Değerlendirme ve tahmin (son eğitilen modelle)
+        results['evaluate_model'], _ = _timed(lambda: evaluate_model(model, X_val, Y_val), repeats)
+        submission = os.path.join(work_dir, 'submission.csv')
+        results['make_predictions'], _ = _timed(
+            lambda: make_predictions(model, X_test, submission), repeats)
+        results['make_predictions_streaming'], _ = _timed(
+            lambda: make_predictions(model, X_test, submission, streaming=True,
+                                     batch_size=config.PREDICTION_BATCH_SIZE), repeats)
+    finish_plotting(verbose=False)
+
+    return {
+        'meta': {
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'host': platform.node(),
+            'python': platform.python_version(),
+            'tensorflow': tf.__version__,
+            'cpu_count': os.cpu_count(),
+            'num_samples': num_samples,
+            'num_test': num_test,
+            'batch_size': batch_size,
+            'num_batches': num_batches,
+            'compact_dtypes': compact,
+            'eval_model': model_types[-1],
+        },
+        'results': results,
+    }
+
+
+def compare_results(baseline, current, threshold=0.10):
+    """
+    Güncel sonuçları referansla karşılaştırır.
+
+    Parametreler:
+    ------------
+    baseline, current : dict
+        run_benchmark() çıktıları
+    threshold : float
+        İzin verilen göreli yavaşlama (0.10 = %10)
+
+    Döndürür:
+    --------
+    list
+        Eşiği aşan ölçümlerin adları
+    """
+    regressions = []
+    print(f"\n{'Ölçüm':<30}{'Referans':>12}{'Güncel':>12}{'Değişim':>10}")
+    for name, seconds in current['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is None:
+            print(f"{name:<30}{'-':>12}{seconds:>11.3f}s{'yeni':>10}")
+            continue
+        change = seconds / reference - 1.0
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  ✗ YAVAŞLAMA'
+        print(f"{name:<30}{reference:>11.3f}s{seconds:>11.3f}s{change:>+9.1%}{flag}")
+
+    for key in ('host', 'cpu_count', 'tensorflow', 'num_samples', 'batch_size'):
+        if baseline['meta'].get(key) != current['meta'].get(key):
+            print(f"  ! Uyarı: '{key}' referanstan farklı "
+                  f"({baseline['meta'].get(key)} → {current['meta'].get(key)})")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tam pipeline regresyon benchmark'ı")
+    parser.add_argument("--samples", type=int, default=8192)
+    parser.add_argument("--test-samples", type=int, default=4096)
+    parser.add_argument("--models", nargs="+", default=['simple', 'standard', 'deep', 'semih'])
+    parser.add_argument("--batches", type=int, default=100,
+                        help="Generator ölçümlerinde çekilecek batch sayısı")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeats", type=int, default=3, help="Ölçüm tekrarı (en iyisi alınır)")
+    parser.add_argument("--output", default=None, help="Sonuçların (yeni referans) yazılacağı JSON")
+    parser.add_argument("--baseline", default=None, help="Karşılaştırılacak referans JSON")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Yavaşlama eşiği (0.10 = %%10)")
+    args = parser.parse_args()
+
+    current = run_benchmark(args.samples, args.test_samples, tuple(args.models), args.batches,
+                            args.batch_size, args.repeats)
+
+    print("\n" + "="*60)
+    print("PIPELINE BENCHMARK SONUÇLARI")
+    print("="*60)
+    for name, seconds in current['results'].items():
+        print(f"  - {name:<30}{seconds:>9.3f} s")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"\n✓ Sonuçlar kaydedildi: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, current, args.threshold)
+        if regressions:
+            print(f"\n✗ {len(regressions)} ölçüm %{args.threshold * 100:.0f} eşiğinden fazla "
+                  f"yavaşladı: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\n✓ Yavaşlama yok (eşik %{args.threshold * 100:.0f})")
@@ -0,0 +1,96 @@
+# ============================================================================
+# BENCHMARK: KARIŞIK HASSASİYET (mixed_float16) VE XLA EĞİTİM MODU
+# ============================================================================
+# Her model tipi için mixed precision, XLA ve steps_per_execution
+# kombinasyonlarıyla epoch süresini ve doğruluğu ölçer. Varsayılan olarak
+# GPU gizlenir ve ölçüm CPU'da yapılır.
+#
+# Kullanım:
+#   python -m benchmarks.bench_precision --samples 8192 --epochs 2
+#   python -m benchmarks.bench_precision --models simple semih --output precision.json
+# ============================================================================
+
+import argparse
+import itertools
+import json
+import os
+import time
+
+
+def run_benchmark(model_types=('simple', 'standard', 'deep', 'semih'), num_samples=8192,
+                  epochs=2, batch_size=32, steps_per_execution=32):
+    """
+    Her model tipi ve bayrak kombinasyonu için epoch süresi ve doğruluğu ölçer.
+    
+    İlk epoch graph oluşturma/XLA derleme süresini içerdiğinden ayrı
+    raporlanır; 'epoch_s' sonraki epoch'ların ortalamasıdır.
+    
+    Döndürür:
+    --------
+    list
+        Her deneme için sonuç sözlükleri
+    """
+    from benchmarks.synthetic import make_synthetic_mnist
+    from modules.model_builder import create_cnn_model
+    import config
+    
+    X, Y = make_synthetic_mnist(num_samples, compact_dtypes=True)
+    split = int(num_samples * 0.9)
+    X_train, Y_train, X_val, Y_val = X[:split], Y[:split], X[split:], Y[split:]
+    
+    results = []
+    for model_type, mixed, jit, spe in itertools.product(
+            model_types, (False, 'force'), (False, True), (1, steps_per_execution)):
+        model = create_cnn_model(config.INPUT_SHAPE, config.NUM_CLASSES, model_type,
+                                 compact_dtypes=True, mixed_precision=mixed,
+                                 jit_compile=jit, steps_per_execution=spe)
+        epoch_times = []
+        for _ in range(epochs):
+            start = time.perf_counter()
+            model.fit(X_train, Y_train, batch_size=batch_size, epochs=1, verbose=0)
+            epoch_times.append(time.perf_counter() - start)
+        _, accuracy = model.evaluate(X_val, Y_val, batch_size=256, verbose=0)
+        
+        steady = epoch_times[1:] or epoch_times
+        results.append({
+            'model_type': model_type,
+            'mixed_precision': bool(mixed),
+            'jit_compile': jit,
+            'steps_per_execution': spe,
+            'first_epoch_s': epoch_times[0],
+            'epoch_s': sum(steady) / len(steady),
+            'val_accuracy': float(accuracy),
+        })
+    
+    print("\n" + "="*80)
+    print("KARIŞIK HASSASİYET / XLA BENCHMARK SONUÇLARI")
+    print("="*80)
+    print(f"{'Model':<10}{'Mixed':<8}{'XLA':<6}{'SPE':<6}{'İlk epoch':>12}{'Epoch':>10}{'Val acc':>10}")
+    for r in results:
+        print(f"{r['model_type']:<10}{str(r['mixed_precision']):<8}{str(r['jit_compile']):<6}"
+              f"{r['steps_per_execution']:<6}{r['first_epoch_s']:>11.2f}s{r['epoch_s']:>9.2f}s"
+              f"{r['val_accuracy']:>10.4f}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mixed precision / XLA eğitim benchmark'ı")
+    parser.add_argument("--models", nargs="+", default=['simple', 'standard', 'deep', 'semih'])
+    parser.add_argument("--samples", type=int, default=8192)
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--steps-per-execution", type=int, default=32)
+    parser.add_argument("--gpu", action="store_true", help="GPU'yu gizleme (varsayılan: sadece CPU)")
+    parser.add_argument("--output", default=None, help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+    
+    if not args.gpu:
+        # TensorFlow import edilmeden önce ayarlanmalı
+        os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    
+    results = run_benchmark(tuple(args.models), args.samples, args.epochs, args.batch_size,
+                            args.steps_per_execution)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Sonuçlar kaydedildi: {args.output}")
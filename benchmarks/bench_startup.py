@@ -0,0 +1,108 @@
+# ============================================================================
+# BENCHMARK: CLI BAŞLANGIÇ SÜRESİ (COLD START)
+# ============================================================================
+# main.py'nin ağır kütüphaneleri import etmeden açılabildiğini ölçer. Her
+# ölçüm yeni bir Python sürecinde yapılır; medyan süre
+# config.STARTUP_BUDGET_SECONDS bütçesini aşarsa çıkış kodu 1 olur (CI'da
+# regresyon kontrolü için).
+#
+# Kullanım:
+#   python -m benchmarks.bench_startup --runs 5
+#   python -m benchmarks.bench_startup --importtime   # en yavaş import'ları listele
+# ============================================================================
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import config
+
+# Ölçülen komutlar: yardım çıktısı ve sadece modülün import edilmesi
+COMMANDS = {
+    'help': [sys.executable, 'main.py', '--help'],
+    'import': [sys.executable, '-c', 'import main'],
+}
+
+# Başlangıçta yüklenmemesi gereken ağır modüller
+HEAVY_MODULES = ('tensorflow', 'keras', 'matplotlib', 'seaborn', 'sklearn', 'pandas')
+
+
+def _time_command(command, runs):
+    """Komutu runs kez yeni süreçte çalıştırır ve süreleri döndürür."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _loaded_heavy_modules():
+    """main import edildikten sonra yüklenmiş ağır modülleri listeler."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = ("import sys, main; print(','.join(sorted({m.split('.')[0] for m in sys.modules} & "
+            f"set({HEAVY_MODULES!r}))))")
+    output = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True,
+                            text=True, check=True).stdout.strip()
+    return [name for name in output.split(',') if name]
+
+
+def _print_importtime(top=15):
+    """python -X importtime çıktısından en yavaş import'ları yazdırır."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import main'], cwd=root,
+                            capture_output=True, text=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].strip()))
+    print(f"\nEn yavaş {top} import (kümülatif, µs):")
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative:>10}  {name}")
+
+
+def run_benchmark(runs=5, budget=None):
+    """
+    CLI başlangıç sürelerini ölçer ve bütçe ile karşılaştırır.
+    
+    Döndürür:
+    --------
+    dict
+        Her komut için medyan süre, bütçe ve yüklenen ağır modüller
+    """
+    budget = budget if budget is not None else config.STARTUP_BUDGET_SECONDS
+    results = {name: statistics.median(_time_command(cmd, runs)) for name, cmd in COMMANDS.items()}
+    heavy = _loaded_heavy_modules()
+    
+    print("\n" + "="*60)
+    print("CLI BAŞLANGIÇ SÜRESİ")
+    print("="*60)
+    for name, seconds in results.items():
+        status = "✓" if seconds <= budget else "✗"
+        print(f"  {status} {name:<8} {seconds*1000:8.1f} ms (bütçe: {budget*1000:.0f} ms)")
+    if heavy:
+        print(f"  ✗ Başlangıçta yüklenen ağır modüller: {', '.join(heavy)}")
+    else:
+        print("  ✓ Başlangıçta ağır modül yüklenmiyor")
+    
+    return {'timings_s': results, 'budget_s': budget, 'heavy_modules': heavy,
+            'within_budget': all(s <= budget for s in results.values()) and not heavy}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CLI başlangıç süresi benchmark'ı")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=None, help="Saniye (varsayılan: config)")
+    parser.add_argument("--importtime", action="store_true")
+    args = parser.parse_args()
+    
+    result = run_benchmark(args.runs, args.budget)
+    if args.importtime:
+        _print_importtime()
+    sys.exit(0 if result['within_budget'] else 1)
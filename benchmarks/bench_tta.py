@@ -0,0 +1,94 @@
+# ============================================================================
+# BENCHMARK: TEST ZAMANI VERİ ARTIRMA (TTA) MALİYETİ
+# ============================================================================
+# Sentetik veriyle kısa süre eğitilen bir model üzerinde K = 1, 2, 4, 8
+# varyant için tahmin throughput'unu, K=1'e göre göreli maliyeti ve
+# doğruluğu ölçer. Varyantlar vektörel olarak üretilip tek büyük batch
+# halinde modele verildiğinden maliyet K'dan daha yavaş büyüyebilir.
+#
+# Kullanım:
+#   python -m benchmarks.bench_tta --variants 1 2 4 8
+#   python -m benchmarks.bench_tta --model semih --output tta.json
+# ============================================================================
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+
+def run_benchmark(variant_counts=(1, 2, 4, 8), num_samples=8192, num_eval=2048,
+                  model_type='simple', epochs=2, batch_size=1024, range_scale=0.5, repeats=3):
+    """
+    Her varyant sayısı için görüntü/s, göreli maliyet ve doğruluğu ölçer.
+
+    Döndürür:
+    --------
+    list
+        Her varyant sayısı için sonuç sözlükleri
+    """
+    from benchmarks.synthetic import make_synthetic_mnist
+    from modules.model_builder import create_cnn_model
+    from modules.predictor import TTAPredictor
+    import config
+
+    X, Y = make_synthetic_mnist(num_samples + num_eval, compact_dtypes=True)
+    X_train, Y_train, X_eval, Y_eval = X[:num_samples], Y[:num_samples], X[num_samples:], Y[num_samples:]
+
+    model = create_cnn_model(config.INPUT_SHAPE, config.NUM_CLASSES, model_type, compact_dtypes=True)
+    model.fit(X_train, Y_train, batch_size=32, epochs=epochs, verbose=0)
+
+    results = []
+    for num_variants in variant_counts:
+        predictor = TTAPredictor(model, num_variants,
+                                 rotation_range=config.ROTATION_RANGE * range_scale,
+                                 width_shift_range=config.WIDTH_SHIFT_RANGE * range_scale,
+                                 height_shift_range=config.HEIGHT_SHIFT_RANGE * range_scale,
+                                 zoom_range=config.ZOOM_RANGE * range_scale,
+                                 max_batch_size=batch_size, seed=config.RANDOM_STATE)
+        predictor.predict_on_batch(X_eval[:predictor.chunk_size])  # Isınma
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            probabilities = predictor.predict(X_eval)
+            best = min(best, time.perf_counter() - start)
+        results.append({
+            'num_variants': num_variants,
+            'seconds': best,
+            'images_per_s': len(X_eval) / best,
+            'accuracy': float(np.mean(np.argmax(probabilities, axis=1) == Y_eval)),
+        })
+
+    for r in results:
+        r['relative_cost'] = r['seconds'] / results[0]['seconds']
+        r['cost_per_variant'] = r['relative_cost'] / r['num_variants']
+
+    print("\n" + "="*70)
+    print(f"TEST ZAMANI VERİ ARTIRMA ({model_type}, model batch {batch_size}, {len(X_eval)} görüntü)")
+    print("="*70)
+    print(f"{'K':<4}{'Süre':>10}{'Görüntü/s':>12}{'Maliyet':>10}{'Maliyet/K':>11}{'Accuracy':>10}")
+    for r in results:
+        print(f"{r['num_variants']:<4}{r['seconds']:>9.3f}s{r['images_per_s']:>12.0f}"
+              f"{r['relative_cost']:>9.2f}x{r['cost_per_variant']:>10.2f}x{r['accuracy']:>10.4f}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test zamanı veri artırma maliyet benchmark'ı")
+    parser.add_argument("--variants", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--samples", type=int, default=8192)
+    parser.add_argument("--eval-samples", type=int, default=2048)
+    parser.add_argument("--model", default='simple', choices=['simple', 'standard', 'deep', 'semih'])
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=1024, help="Modele verilen en büyük batch")
+    parser.add_argument("--range-scale", type=float, default=0.5)
+    parser.add_argument("--output", default=None, help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    results = run_benchmark(tuple(args.variants), args.samples, args.eval_samples, args.model,
+                            args.epochs, args.batch_size, args.range_scale)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Sonuçlar kaydedildi: {args.output}")
@@ -0,0 +1,125 @@
+# ============================================================================
+# BENCHMARK: TAHMİN SUNUCUSU YÜK TESTİ
+# ============================================================================
+# Sunucuyu aynı süreçte boş bir portta başlatır ve eş zamanlı istemcilerle
+# sentetik istekler gönderir. İnternet bağlantısı veya veri dosyası gerekmez;
+# --model verilmezse eğitilmemiş bir model kullanılır (gecikme ölçümü için
+# ağırlıkların önemi yoktur).
+#
+# Kullanım:
+#   python -m benchmarks.load_test_server --clients 32 --requests 50
+#   python -m benchmarks.load_test_server --model semihbest_model.keras
+# ============================================================================
+
+import argparse
+import json
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+from modules.inference_server import create_server
+import config
+
+
+def _client(url, rows, num_requests, latencies, lock):
+    """Sunucuya ardışık istekler gönderir ve istemci tarafı gecikmeleri kaydeder."""
+    body = json.dumps({'instances': rows.tolist()}).encode('utf-8')
+    local = []
+    for _ in range(num_requests):
+        request = urllib.request.Request(url, data=body,
+                                         headers={'Content-Type': 'application/json'})
+        start = time.perf_counter()
+        with urllib.request.urlopen(request) as response:
+            response.read()
+        local.append(time.perf_counter() - start)
+    with lock:
+        latencies.extend(local)
+
+
+def run_load_test(model=None, clients=16, requests_per_client=50, images_per_request=1,
+                  max_batch_size=None, max_wait_ms=None):
+    """
+    Tahmin sunucusuna eş zamanlı yük uygular ve gecikme/throughput raporu döndürür.
+    
+    Döndürür:
+    --------
+    dict
+        İstemci tarafı ölçümler ('client') ve sunucu /stats çıktısı ('server')
+    """
+    if model is None:
+        from modules.model_builder import create_cnn_model
+        model = create_cnn_model(config.INPUT_SHAPE, config.NUM_CLASSES, config.MODEL_TYPE,
+                                 compact_dtypes=config.COMPACT_DTYPES)
+    
+    server = create_server(model, '127.0.0.1', 0,
+                           max_batch_size=max_batch_size or config.SERVER_MAX_BATCH_SIZE,
+                           max_wait_ms=max_wait_ms if max_wait_ms is not None else config.SERVER_MAX_WAIT_MS,
+                           compact_dtypes=config.COMPACT_DTYPES)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    
+    rng = np.random.default_rng(config.RANDOM_STATE)
+    rows = rng.integers(0, 256, size=(images_per_request, 784))
+    latencies, lock = [], threading.Lock()
+    
+    # Isınma isteği (ilk model çağrısındaki graph oluşturma süresini ölçüme katmamak için)
+    _client(base_url + '/predict', rows, 1, [], lock)
+    
+    start = time.perf_counter()
+    threads = [threading.Thread(target=_client,
+                                args=(base_url + '/predict', rows, requests_per_client, latencies, lock))
+               for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    with urllib.request.urlopen(base_url + '/stats') as response:
+        server_stats = json.loads(response.read())
+    server.shutdown()
+    server.server_close()
+    server.batcher.close()
+    
+    latencies_ms = np.array(latencies) * 1000.0
+    client_stats = {
+        'requests': len(latencies),
+        'elapsed_s': elapsed,
+        'requests_per_s': len(latencies) / elapsed,
+        'images_per_s': len(latencies) * images_per_request / elapsed,
+    }
+    for p in (50, 90, 95, 99):
+        client_stats[f'latency_p{p}_ms'] = float(np.percentile(latencies_ms, p))
+    
+    print("\n" + "="*60)
+    print("YÜK TESTİ SONUÇLARI")
+    print("="*60)
+    print(f"  - İstemci sayısı: {clients}, istek/istemci: {requests_per_client}")
+    print(f"  - Throughput: {client_stats['requests_per_s']:,.1f} istek/sn "
+          f"({client_stats['images_per_s']:,.1f} görüntü/sn)")
+    print(f"  - Gecikme p50/p90/p99: {client_stats['latency_p50_ms']:.1f} / "
+          f"{client_stats['latency_p90_ms']:.1f} / {client_stats['latency_p99_ms']:.1f} ms")
+    print(f"  - Ortalama mikro-batch boyutu: {server_stats['mean_batch_size']:.1f}")
+    
+    return {'client': client_stats, 'server': server_stats}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tahmin sunucusu yük testi")
+    parser.add_argument("--model", default=None, help="Checkpoint yolu (boşsa eğitilmemiş model)")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--images-per-request", type=int, default=1)
+    parser.add_argument("--max-batch-size", type=int, default=None)
+    parser.add_argument("--max-wait-ms", type=float, default=None)
+    args = parser.parse_args()
+    
+    model = None
+    if args.model:
+        from tensorflow import keras
+        model = keras.models.load_model(args.model)
+    run_load_test(model, args.clients, args.requests, args.images_per_request,
+                  args.max_batch_size, args.max_wait_ms)
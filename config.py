@@ -7,29 +7,163 @@
 TRAIN_PATH = "data/train.csv"
 TEST_PATH = "data/test.csv"
 
+# Veri önbelleği (CSV'ler bir kez uint8 ikili dosyaya dönüştürülür ve memmap ile açılır)
+USE_DATA_CACHE = False
+DATA_CACHE_DIR = "data/cache"
+
+# Aşama önbelleği: veri, eğitim, değerlendirme ve tahmin çıktıları içerik
+# adresli artefaktlar olarak saklanır; girdileri değişmeyen aşamalar atlanır
+USE_STAGE_CACHE = False
+ARTIFACT_DIR = "artifacts"
+
 # Model ayarları
-MODEL_TYPE = 'semih'  # 'simple', 'standard', 'deep', 'semih'
+MODEL_TYPE = 'semih'  # 'simple', 'standard', 'deep', 'semih' veya .yaml/.json model spec dosyası
 INPUT_SHAPE = (28, 28, 1)
 NUM_CLASSES = 10
 
+# Kompakt veri tipleri: pikseller uint8 kalır (normalizasyon modelin içinde),
+# etiketler tamsayı sınıf numarasıdır (sparse categorical cross-entropy)
+COMPACT_DTYPES = False
+
 # Eğitim ayarları
 EPOCHS = 3
 BATCH_SIZE = 32
 VALIDATION_SPLIT = 0.1
 RANDOM_STATE = 13
 
+# Performans modu
+MIXED_PRECISION = False      # True: destekleniyorsa mixed_float16, 'force': her cihazda
+XLA_JIT = False              # model.compile(jit_compile=True)
+STEPS_PER_EXECUTION = 1      # Her tf.function çağrısındaki batch sayısı
+
 # Veri artırma ayarları
 USE_AUGMENTATION = True
 ROTATION_RANGE = 5
 WIDTH_SHIFT_RANGE = 0.1
 HEIGHT_SHIFT_RANGE = 0.1
 ZOOM_RANGE = 0.1
+# Veri artırma altyapısı: 'tfdata' (vektörel tf.data pipeline'ı),
+# 'numpy' (çok süreçli NumPy/SciPy motoru) veya 'keras' (ImageDataGenerator.flow)
+AUGMENTATION_BACKEND = 'keras'
+TFDATA_CACHE = False
+NUMPY_AUG_WORKERS = 4       # 'numpy' altyapısında işçi süreç sayısı
+NUMPY_AUG_PREFETCH = 16     # Halka tampondaki (önceden hazırlanan) batch sayısı
+# Veri seti istatistiği gerektiren ayarlar ('keras' altyapısı). Hepsi kapalıyken
+# istatistik hesaplanmaz; açıksa tek geçişte hesaplanıp önbelleğe yazılır.
+FEATUREWISE_CENTER = False
+FEATUREWISE_STD_NORMALIZATION = False
+ZCA_WHITENING = False
+AUG_STATS_CACHE_DIR = "data/cache"
+
+# Çok süreçli veri paralel CPU eğitimi (modules/distributed_trainer.py)
+# 1'den büyükse eğitim localhost üzerinde bu kadar işçi süreciyle
+# MultiWorkerMirroredStrategy kullanılarak yapılır; BATCH_SIZE işçi başına
+# batch boyutudur (global batch = BATCH_SIZE x DISTRIBUTED_WORKERS)
+DISTRIBUTED_WORKERS = 1
 
 # Callback ayarları
 EARLY_STOPPING_PATIENCE = 10
 REDUCE_LR_PATIENCE = 5
 
+# Asenkron checkpoint (modules/callbacks.py - AsyncModelCheckpoint)
+# Ağırlıklar + optimizer durumu her epoch belleğe kopyalanır ve arka plan
+# thread'inde native formatta yazılır; en iyi model MODEL_SAVE_PATH'e kaydedilir.
+# --resume bu checkpoint'lerden devam ettiği için ASYNC_CHECKPOINT açık olmalı
+ASYNC_CHECKPOINT = False
+CHECKPOINT_DIR = "checkpoints/" + MODEL_TYPE
+CHECKPOINT_KEEP_LAST = 3
+CHECKPOINT_FORMAT = 'keras'      # 'keras' (.keras dosyası) veya 'tf' (tf.train.Checkpoint)
+RESUME_FROM_CHECKPOINT = False   # Eğitime son checkpoint'ten devam et (python main.py train --resume)
+
+# Eğitim profili (modules/callbacks.py - ProfilingCallback)
+PROFILE_TRAINING = False
+PROFILE_PATH = "profile/" + MODEL_TYPE + "_steps.csv"   # Özet: aynı isimle .json
+PROFILE_TRACE_STEPS = None       # Örn: (20, 30) → bu adımlar için TensorBoard profiler izi
+PROFILE_TRACE_DIR = "logs/profile"
+
+# Yakınsama odaklı eğitim (modules/adaptive_trainer.py, python main.py train --adaptive)
+# Doğrulama her ADAPTIVE_EVAL_STEPS adımda bir alt örnekle yapılır, batch boyutu
+# gradyan gürültü ölçeğine göre BATCH_SIZE'dan büyütülür ve hedef doğruluk veya
+# plato görülünce eğitim durur. EPOCHS en fazla işlenecek veri miktarıdır;
+# EarlyStopping / checkpoint callback'leri bu modda kullanılmaz
+ADAPTIVE_TRAINING = False
+ADAPTIVE_EVAL_STEPS = 100            # Kaç eğitim adımında bir doğrulama yapılacağı
+ADAPTIVE_VAL_SAMPLES = 2048          # Doğrulama alt örneği boyutu
+ADAPTIVE_TARGET_ACCURACY = None      # Örn: 0.99 → alt örnekte bu val_accuracy'ye ulaşınca dur
+ADAPTIVE_PATIENCE = 5                # val_loss kaç değerlendirme boyunca iyileşmezse durulacağı
+ADAPTIVE_MIN_DELTA = 1e-3
+ADAPTIVE_MAX_BATCH_SIZE = 1024
+ADAPTIVE_NOISE_SPLITS = 4            # Gürültü tahmini için batch'in bölündüğü parça sayısı
+ADAPTIVE_LR_SCALING = 'sqrt'         # Batch ikiye katlanınca LR: 'linear' (x2), 'sqrt' (x√2), 'none'
+
 # Dosya yolları
 MODEL_SAVE_PATH = MODEL_TYPE + 'best_model.h5'
 SUBMISSION_PATH = MODEL_TYPE + 'submission.csv'
 
+# Grafik ayarları (modules/plotting.py)
+PLOT_MODE = 'auto'      # 'show', 'headless' (Agg, arka planda dosyaya), 'off', 'auto'
+PLOT_DIR = "plots"
+PLOT_FORMAT = 'png'     # 'png' veya 'svg'
+PLOT_DPI = 100
+
+# Hiperparametre taraması (modules/sweep.py, python main.py sweep)
+SWEEP_SPACE = {
+    'MODEL_TYPE': ['simple', 'standard', 'deep', 'semih'],
+    'BATCH_SIZE': [32, 64, 128],
+    'ROTATION_RANGE': [0, 5, 10],
+    'ZOOM_RANGE': [0.0, 0.1],
+    'EARLY_STOPPING_PATIENCE': [5, 10],
+}
+SWEEP_MODE = 'random'       # 'grid' veya 'random'
+SWEEP_TRIALS = 16           # 'random' modunda deneme sayısı
+SWEEP_SCHEDULER = 'asha'    # 'asha', 'sha' veya 'none'
+SWEEP_MIN_EPOCHS = 1
+SWEEP_MAX_EPOCHS = 9
+SWEEP_ETA = 3
+SWEEP_WORKERS = 4           # Paralel deneme süreci sayısı
+SWEEP_DIR = "sweeps/latest"
+
+# Bilgi damıtma (modules/distillation.py): öğretmen checkpoint'inden küçük öğrenci
+DISTILL_TEACHER_PATH = MODEL_SAVE_PATH
+DISTILL_STUDENT_TYPE = 'simple'      # 'simple', 'narrow' veya .yaml/.json model spec dosyası
+DISTILL_EPOCHS = 10
+DISTILL_TEMPERATURE = 4.0
+DISTILL_ALPHA = 0.1                  # Gerçek etiket kaybının ağırlığı
+DISTILL_ACCURACY_BUDGET = 0.005      # Öğretmene göre kabul edilen doğruluk kaybı (0.5 puan)
+DISTILL_LOGITS_DIR = "data/cache/teacher_logits"
+DISTILL_STUDENT_PATH = 'student_best_model.keras'
+
+# Çıkarım graph'ı optimizasyonu (modules/graph_optimizer.py): BN katlama, Dropout çıkarma, budama
+PRUNING = 'none'                     # 'none', 'magnitude' veya 'channel'
+PRUNING_SPARSITY = 0.5               # Budanacak ağırlık / filtre oranı
+PRUNING_FINE_TUNE_EPOCHS = 1
+PRUNING_LEARNING_RATE = 1e-4
+OPTIMIZED_MODEL_PATH = MODEL_TYPE + '_optimized.keras'
+
+# Tahmin ayarları
+STREAMING_PREDICTION = False     # Batch batch tahmin + artımlı submission yazımı
+PREDICTION_BATCH_SIZE = 1024
+PROBABILITIES_PATH = None        # Örn: MODEL_TYPE + 'probabilities.npy' veya '.parquet'
+TTA_VARIANTS = 1                 # Test zamanı veri artırma varyant sayısı (1 = kapalı); maliyet ~K kat
+TTA_RANGE_SCALE = 0.5            # TTA'da eğitim veri artırma aralıklarının çarpanı (daha hafif dönüşümler)
+ENSEMBLE_MODEL_PATHS = []        # Doluysa tahmin bu checkpoint'lerin ağırlıklı ortalamasıyla yapılır
+ENSEMBLE_WEIGHTS = None          # Örn: [1, 1, 2] (None = eşit ağırlık)
+ENSEMBLE_MODE = 'fused'          # 'fused' (tek graph) veya 'threads' (thread havuzu)
+
+# TFLite dışa aktarma ve CPU tahmini (modules/model_exporter.py)
+EXPORT_TFLITE = False
+TFLITE_QUANTIZATION = 'dynamic'  # 'none', 'float16', 'dynamic', 'int8'
+TFLITE_CALIBRATION_SAMPLES = 200 # 'int8' için X_train'den alınacak örnek sayısı
+TFLITE_NUM_THREADS = 4
+TFLITE_PATH = MODEL_TYPE + '_model.tflite'
+PREDICT_WITH_TFLITE = False      # make_predictions TFLite interpreter ile çalışsın mı?
+
+# CLI başlangıç süresi bütçesi (benchmarks/bench_startup.py)
+STARTUP_BUDGET_SECONDS = 0.5
+
+# Tahmin sunucusu ayarları (modules/inference_server.py)
+SERVER_HOST = '127.0.0.1'
+SERVER_PORT = 8080
+SERVER_MAX_BATCH_SIZE = 64       # Mikro-batch'teki en fazla görüntü sayısı
+SERVER_MAX_WAIT_MS = 5.0         # Mikro-batch'in dolması için en uzun bekleme
+
@@ -4,35 +4,80 @@
 # Bu dosya, tüm modülleri birleştirerek tam pipeline'ı çalıştırır
 # ============================================================================
 
+# Kullanım:
+#   python main.py                    # train ile aynı (tam pipeline)
+#   python main.py train --epochs 5
+#   python main.py eval --model semihbest_model.keras
+#   python main.py predict --model semihbest_model.keras
+#   python main.py serve --port 8080
+#   python main.py bench startup
+#
+# Başlangıç süresini kısa tutmak için TensorFlow, matplotlib vb. ağır
+# kütüphaneler modül seviyesinde değil, onlara ihtiyaç duyan alt komutun
+# içinde import edilir (bkz. benchmarks/bench_startup.py).
+# ============================================================================
+
+import os
+import sys
+import json
+import shutil
+import argparse
 import warnings
+from types import SimpleNamespace
 warnings.filterwarnings('ignore')
 
-import tensorflow as tf
-from tensorflow import keras
-
-# Modülleri import ediyoruz
-from modules.data_loader import load_and_preprocess_data
-from modules.data_visualization import visualize_data
-from modules.data_augmentation_module import create_data_generator, create_train_generator
-from modules.model_builder import create_cnn_model
-from modules.callbacks import create_callbacks
-from modules.model_trainer import train_model
-from modules.training_visualizer import plot_training_history
-from modules.model_evaluator import evaluate_model
-from modules.predictor import make_predictions
-
 # Yapılandırma dosyasını import ediyoruz
 import config
+from modules.plotting import PLOT_MODES  # Sadece standart kütüphane kullanır
+
+
+def print_environment():
+    """TensorFlow versiyonunu ve GPU kullanılabilirliğini yazdırır."""
+    import tensorflow as tf
+    
+    gpus = tf.config.list_physical_devices('GPU')
+    print("="*80)
+    print("CNN MODELİ - TAM PIPELINE")
+    print("="*80)
+    print(f"TensorFlow versiyonu: {tf.__version__}")
+    print(f"GPU kullanılabilir mi? {len(gpus) > 0}")
+    if gpus:
+        print(f"GPU cihazları: {gpus}")
+    print("="*80)
+
+
+# Aşama anahtarlarına giren config değerleri (bu değerler değişince ilgili
+# aşama ve ona bağlı aşamalar yeniden çalıştırılır)
+DATA_CONFIG_KEYS = ('VALIDATION_SPLIT', 'RANDOM_STATE', 'COMPACT_DTYPES')
+TRAIN_CONFIG_KEYS = ('INPUT_SHAPE', 'NUM_CLASSES', 'AUGMENTATION_BACKEND', 'ROTATION_RANGE',
+                     'WIDTH_SHIFT_RANGE', 'HEIGHT_SHIFT_RANGE', 'ZOOM_RANGE',
+                     'FEATUREWISE_CENTER', 'FEATUREWISE_STD_NORMALIZATION', 'ZCA_WHITENING',
+                     'EARLY_STOPPING_PATIENCE', 'REDUCE_LR_PATIENCE', 'MIXED_PRECISION',
+                     'XLA_JIT', 'STEPS_PER_EXECUTION', 'DISTRIBUTED_WORKERS',
+                     'ADAPTIVE_EVAL_STEPS', 'ADAPTIVE_VAL_SAMPLES', 'ADAPTIVE_TARGET_ACCURACY',
+                     'ADAPTIVE_PATIENCE', 'ADAPTIVE_MIN_DELTA', 'ADAPTIVE_MAX_BATCH_SIZE',
+                     'ADAPTIVE_NOISE_SPLITS', 'ADAPTIVE_LR_SCALING')
+PREDICT_CONFIG_KEYS = ('STREAMING_PREDICTION', 'PROBABILITIES_PATH', 'EXPORT_TFLITE',
+                       'PREDICT_WITH_TFLITE', 'TFLITE_QUANTIZATION', 'TTA_VARIANTS',
+                       'TTA_RANGE_SCALE', 'ROTATION_RANGE', 'WIDTH_SHIFT_RANGE',
+                       'HEIGHT_SHIFT_RANGE', 'ZOOM_RANGE')
 
-# GPU kullanılabilirliğini kontrol ediyoruz
-print("="*80)
-print("CNN MODELİ - TAM PIPELINE")
-print("="*80)
-print(f"TensorFlow versiyonu: {tf.__version__}")
-print(f"GPU kullanılabilir mi? {len(tf.config.list_physical_devices('GPU')) > 0}")
-if len(tf.config.list_physical_devices('GPU')) > 0:
-    print(f"GPU cihazları: {tf.config.list_physical_devices('GPU')}")
-print("="*80)
+
+def tta_params():
+    """Test zamanı veri artırma ayarları: eğitim aralıkları TTA_RANGE_SCALE ile ölçeklenir."""
+    return {
+        'rotation_range': config.ROTATION_RANGE * config.TTA_RANGE_SCALE,
+        'width_shift_range': config.WIDTH_SHIFT_RANGE * config.TTA_RANGE_SCALE,
+        'height_shift_range': config.HEIGHT_SHIFT_RANGE * config.TTA_RANGE_SCALE,
+        'zoom_range': config.ZOOM_RANGE * config.TTA_RANGE_SCALE,
+        'seed': config.RANDOM_STATE,
+    }
+
+
+def submission_classes(submission_path):
+    """Submission dosyasındaki tahmin edilen sınıfları okur (akış modu sınıfları bellekte tutmaz)."""
+    import pandas as pd
+    return pd.read_csv(submission_path, usecols=['Label'])['Label'].to_numpy()
 
 
 def run_complete_pipeline(train_path=None, 
@@ -42,7 +87,12 @@ def run_complete_pipeline(train_path=None,
                          batch_size=None,
                          use_augmentation=None,
                          save_model_path=None,
-                         submission_path=None):
+                         submission_path=None,
+                         use_stage_cache=None,
+                         invalidate=(),
+                         plot_mode=None,
+                         resume=None,
+                         adaptive=None):
     """
     Tüm pipeline'ı çalıştırır: veri yükleme, model oluşturma, eğitme, değerlendirme ve tahmin.
     
@@ -53,7 +103,8 @@ def run_complete_pipeline(train_path=None,
     test_path : str, optional
         Test verisi dosya yolu (None ise config'den alınır)
     model_type : str, optional
-        Model tipi: 'simple', 'standard', 'deep' (None ise config'den alınır)
+        Model tipi: 'simple', 'standard', 'deep', 'semih' veya .yaml/.json model
+        spec dosyası (None ise config'den alınır)
     epochs : int, optional
         Epoch sayısı (None ise config'den alınır)
     batch_size : int, optional
@@ -64,7 +115,42 @@ def run_complete_pipeline(train_path=None,
         Model kayıt yolu (None ise config'den alınır)
     submission_path : str, optional
         Submission dosyası kayıt yolu (None ise config'den alınır)
+    use_stage_cache : bool, optional
+        Aşama önbelleği kullanılsın mı? Girdileri değişmeyen aşamalar (veri,
+        eğitim, değerlendirme, tahmin) atlanıp önbellekten yüklenir
+        (None ise config'den alınır)
+    invalidate : iterable of str
+        Önbelleği silinip yeniden çalıştırılacak aşamalar
+        ('data', 'train', 'eval', 'predict' veya 'all')
+    plot_mode : str, optional
+        Grafik modu: 'auto', 'show', 'headless' veya 'off' (None ise
+        config'den alınır)
+    resume : bool, optional
+        True ise eğitim CHECKPOINT_DIR'deki son checkpoint'ten devam eder
+        (None ise config'den alınır)
+    adaptive : bool, optional
+        True ise yakınsama odaklı eğitim (uyarlanabilir batch boyutu, her N
+        adımda doğrulama, hedef/plato ile erken durma) kullanılır
+        (None ise config'den alınır)
     """
+    # Modülleri import ediyoruz (ağır import'lar sadece eğitimde yapılır)
+    from modules.data_loader import load_and_preprocess_data
+    from modules.data_visualization import visualize_data
+    from modules.data_augmentation_module import create_data_generator, create_train_generator, create_tf_dataset
+    from modules.model_builder import create_cnn_model, load_model_spec, model_spec_hash
+    from modules.callbacks import create_callbacks, restore_latest_checkpoint
+    from modules.model_trainer import train_model
+    from modules.distributed_trainer import train_distributed
+    from modules.adaptive_trainer import train_adaptive
+    from modules.training_visualizer import plot_training_history
+    from modules.model_evaluator import evaluate_model
+    from modules.predictor import make_predictions
+    from modules.model_exporter import export_tflite, compare_tflite_with_keras, TFLitePredictor
+    from modules.pipeline_cache import (ArtifactStore, STAGES, run_stage,
+                                        save_results, load_results)
+    from modules.plotting import configure_plotting, finish_plotting
+    from tensorflow import keras
+    
     # Yapılandırma değerlerini kullan (parametre verilmezse)
     train_path = train_path or config.TRAIN_PATH
     test_path = test_path or config.TEST_PATH
@@ -74,6 +160,11 @@ def run_complete_pipeline(train_path=None,
     use_augmentation = use_augmentation if use_augmentation is not None else config.USE_AUGMENTATION
     save_model_path = save_model_path or config.MODEL_SAVE_PATH
     submission_path = submission_path or config.SUBMISSION_PATH
+    use_stage_cache = use_stage_cache if use_stage_cache is not None else config.USE_STAGE_CACHE
+    resume = resume if resume is not None else config.RESUME_FROM_CHECKPOINT
+    adaptive = adaptive if adaptive is not None else config.ADAPTIVE_TRAINING
+    plotter = configure_plotting(plot_mode or config.PLOT_MODE, config.PLOT_DIR,
+                                 config.PLOT_FORMAT, config.PLOT_DPI)
     
     print("\n" + "="*80)
     print("CNN MODELİ - TAM PIPELINE")
@@ -83,64 +174,297 @@ def run_complete_pipeline(train_path=None,
     print(f"  - Epoch sayısı: {epochs}")
     print(f"  - Batch boyutu: {batch_size}")
     print(f"  - Veri artırma: {'Evet' if use_augmentation else 'Hayır'}")
+    print(f"  - Eğitim modu: {'Yakınsama odaklı (uyarlanabilir batch)' if adaptive else 'Standart'}")
     print(f"  - Model kayıt yolu: {save_model_path}")
     print(f"  - Submission yolu: {submission_path}")
+    print(f"  - Aşama önbelleği: {'Açık' if use_stage_cache else 'Kapalı'}"
+          + (f" (geçersiz kılınan: {', '.join(invalidate)})" if invalidate else ""))
+    print(f"  - Grafik modu: {plotter.mode}")
     print("="*80)
     
-    # 1. Veri yükleme ve ön işleme
-    X_train, X_val, Y_train, Y_val, X_test = load_and_preprocess_data(
-        train_path, test_path,
-        validation_split=config.VALIDATION_SPLIT,
-        random_state=config.RANDOM_STATE
-    )
+    store = ArtifactStore(config.ARTIFACT_DIR)
+    if use_stage_cache:
+        stages = STAGES if 'all' in invalidate else invalidate
+        for stage in stages:
+            store.invalidate(stage)
     
-    # 2. Veri görselleştirme
-    visualize_data(X_train, Y_train)
+    def cached_stage(stage, inputs, compute, save, load):
+        # Önbellek kapalıysa aşama her zaman çalıştırılır
+        if not use_stage_cache:
+            return compute(), None
+        return run_stage(store, stage, inputs, compute, save, load)
     
-    # 3. Veri artırma (isteğe bağlı)
-    if use_augmentation:
-        datagen = create_data_generator(
-            rotation_range=config.ROTATION_RANGE,
-            width_shift_range=config.WIDTH_SHIFT_RANGE,
-            height_shift_range=config.HEIGHT_SHIFT_RANGE,
-            zoom_range=config.ZOOM_RANGE
+    # 1-2. Veri yükleme, ön işleme ve görselleştirme
+    def compute_data():
+        X_train, X_val, Y_train, Y_val, X_test = load_and_preprocess_data(
+            train_path, test_path,
+            validation_split=config.VALIDATION_SPLIT,
+            random_state=config.RANDOM_STATE,
+            use_cache=config.USE_DATA_CACHE,
+            cache_dir=config.DATA_CACHE_DIR,
+            compact_dtypes=config.COMPACT_DTYPES
         )
-        train_generator = create_train_generator(datagen, X_train, Y_train, batch_size)
-    else:
-        train_generator = None
+        visualize_data(X_train, Y_train)
+        return dict(X_train=X_train, X_val=X_val, Y_train=Y_train, Y_val=Y_val, X_test=X_test)
     
-    # 4. Model oluşturma
-    model = create_cnn_model(
-        input_shape=config.INPUT_SHAPE,
-        num_classes=config.NUM_CLASSES,
-        model_type=model_type
+    data, data_digest = cached_stage(
+        'data',
+        inputs={
+            'train_sha256': store.file_hash(train_path) if use_stage_cache else None,
+            'test_sha256': store.file_hash(test_path) if use_stage_cache else None,
+            **{name: getattr(config, name) for name in DATA_CONFIG_KEYS},
+        },
+        compute=compute_data,
+        save=save_results,
+        load=lambda directory: load_results(directory, mmap_mode='r')
     )
+    X_train, X_val, Y_train, Y_val, X_test = (data['X_train'], data['X_val'], data['Y_train'],
+                                              data['Y_val'], data['X_test'])
     
-    # 5. Callback'ler oluşturma
-    callbacks = create_callbacks(
-        patience=config.EARLY_STOPPING_PATIENCE,
-        reduce_lr_patience=config.REDUCE_LR_PATIENCE,
-        model_save_path=save_model_path
+    # 3-8. Veri artırma, model oluşturma, eğitim ve eğitim geçmişi
+    def build_model():
+        return create_cnn_model(
+            input_shape=config.INPUT_SHAPE,
+            num_classes=config.NUM_CLASSES,
+            model_type=model_type,
+            compact_dtypes=config.COMPACT_DTYPES,
+            mixed_precision=config.MIXED_PRECISION,
+            jit_compile=config.XLA_JIT,
+            steps_per_execution=config.STEPS_PER_EXECUTION
+        )
+    
+    def compute_train():
+        if config.DISTRIBUTED_WORKERS > 1:
+            # 3-6. Çok süreçli veri paralel eğitim (tf.data veri artırma işçilerde yapılır)
+            model, history = train_distributed(
+                X_train, Y_train, X_val, Y_val,
+                num_workers=config.DISTRIBUTED_WORKERS,
+                model_type=model_type,
+                epochs=epochs,
+                per_worker_batch_size=batch_size,
+                use_augmentation=use_augmentation,
+                compact_dtypes=config.COMPACT_DTYPES,
+                model_save_path=save_model_path,
+                seed=config.RANDOM_STATE
+            )
+            plot_training_history(history)
+            return model, history
+        
+        if adaptive:
+            # 3-6. Yakınsama odaklı eğitim: veri artırma parça parça vektörel yapılır,
+            # callback'ler yerine her ADAPTIVE_EVAL_STEPS adımda doğrulama yapılır
+            model, history = train_adaptive(
+                build_model(), X_train, Y_train, X_val, Y_val,
+                epochs=epochs,
+                batch_size=batch_size,
+                max_batch_size=config.ADAPTIVE_MAX_BATCH_SIZE,
+                eval_every=config.ADAPTIVE_EVAL_STEPS,
+                val_samples=config.ADAPTIVE_VAL_SAMPLES,
+                target_accuracy=config.ADAPTIVE_TARGET_ACCURACY,
+                patience=config.ADAPTIVE_PATIENCE,
+                min_delta=config.ADAPTIVE_MIN_DELTA,
+                noise_splits=config.ADAPTIVE_NOISE_SPLITS,
+                lr_scaling=config.ADAPTIVE_LR_SCALING,
+                use_augmentation=use_augmentation,
+                augmentation=dict(rotation_range=config.ROTATION_RANGE,
+                                  width_shift_range=config.WIDTH_SHIFT_RANGE,
+                                  height_shift_range=config.HEIGHT_SHIFT_RANGE,
+                                  zoom_range=config.ZOOM_RANGE),
+                model_save_path=save_model_path,
+                prediction_batch_size=config.PREDICTION_BATCH_SIZE,
+                seed=config.RANDOM_STATE
+            )
+            plot_training_history(history)
+            return model, history
+        
+        # 3. Veri artırma (isteğe bağlı)
+        if use_augmentation and config.AUGMENTATION_BACKEND == 'tfdata':
+            train_generator = create_tf_dataset(
+                X_train, Y_train, batch_size,
+                rotation_range=config.ROTATION_RANGE,
+                width_shift_range=config.WIDTH_SHIFT_RANGE,
+                height_shift_range=config.HEIGHT_SHIFT_RANGE,
+                zoom_range=config.ZOOM_RANGE,
+                cache=config.TFDATA_CACHE,
+                seed=config.RANDOM_STATE
+            )
+        elif use_augmentation:
+            datagen = create_data_generator(
+                rotation_range=config.ROTATION_RANGE,
+                width_shift_range=config.WIDTH_SHIFT_RANGE,
+                height_shift_range=config.HEIGHT_SHIFT_RANGE,
+                zoom_range=config.ZOOM_RANGE,
+                backend=config.AUGMENTATION_BACKEND,
+                num_workers=config.NUMPY_AUG_WORKERS,
+                prefetch_batches=config.NUMPY_AUG_PREFETCH,
+                seed=config.RANDOM_STATE,
+                featurewise_center=config.FEATUREWISE_CENTER,
+                featurewise_std_normalization=config.FEATUREWISE_STD_NORMALIZATION,
+                zca_whitening=config.ZCA_WHITENING
+            )
+            train_generator = create_train_generator(datagen, X_train, Y_train, batch_size,
+                                                     stats_cache_dir=config.AUG_STATS_CACHE_DIR)
+        else:
+            train_generator = None
+        
+        # 4. Model oluşturma
+        model = build_model()
+        initial_epoch, initial_best = 0, None
+        if resume:
+            # Son asenkron checkpoint'ten (ağırlıklar + optimizer durumu) devam et
+            model, initial_epoch, state = restore_latest_checkpoint(config.CHECKPOINT_DIR, model)
+            if state and state.get('monitor') == 'val_accuracy':
+                initial_best = state.get('best')
+        
+        # 5. Callback'ler oluşturma
+        callbacks = create_callbacks(
+            patience=config.EARLY_STOPPING_PATIENCE,
+            reduce_lr_patience=config.REDUCE_LR_PATIENCE,
+            model_save_path=save_model_path,
+            async_checkpoint=config.ASYNC_CHECKPOINT,
+            checkpoint_dir=config.CHECKPOINT_DIR,
+            keep_last=config.CHECKPOINT_KEEP_LAST,
+            checkpoint_format=config.CHECKPOINT_FORMAT,
+            resume=resume,
+            initial_best=initial_best,
+            profile=config.PROFILE_TRAINING,
+            profile_path=config.PROFILE_PATH,
+            batch_size=batch_size,
+            trace_steps=config.PROFILE_TRACE_STEPS,
+            trace_dir=config.PROFILE_TRACE_DIR
+        )
+        
+        # 6. Model eğitimi
+        history = train_model(
+            model, X_train, Y_train, X_val, Y_val,
+            train_generator=train_generator,
+            epochs=epochs,
+            batch_size=batch_size,
+            use_augmentation=use_augmentation,
+            callbacks=callbacks,
+            initial_epoch=initial_epoch
+        )
+        if hasattr(train_generator, 'close'):
+            # NumPy augmentation işçi süreçlerini ve paylaşımlı belleği serbest bırak
+            train_generator.close()
+        
+        # 7. Eğitim geçmişini görselleştirme
+        plot_training_history(history)
+        return model, history
+    
+    def save_train(directory, result):
+        model, history = result
+        model.save(os.path.join(directory, 'model' + os.path.splitext(save_model_path)[1]))
+        with open(os.path.join(directory, 'history.json'), 'w') as f:
+            json.dump({k: [float(v) for v in values] for k, values in history.history.items()}, f)
+    
+    def load_train(directory):
+        model_file = 'model' + os.path.splitext(save_model_path)[1]
+        model = keras.models.load_model(os.path.join(directory, model_file))
+        # Checkpoint'in beklenen yolda da bulunmasını sağla
+        shutil.copyfile(os.path.join(directory, model_file), save_model_path)
+        with open(os.path.join(directory, 'history.json')) as f:
+            history = SimpleNamespace(history=json.load(f))
+        return model, history
+    
+    (model, history), train_digest = cached_stage(
+        'train',
+        inputs={
+            'data': data_digest,
+            'model_type': model_type,
+            'model_spec': model_spec_hash(load_model_spec(model_type)),
+            'epochs': epochs,
+            'batch_size': batch_size,
+            'use_augmentation': use_augmentation,
+            'adaptive': adaptive,
+            **{name: getattr(config, name) for name in TRAIN_CONFIG_KEYS},
+        },
+        compute=compute_train,
+        save=save_train,
+        load=load_train
     )
     
-    # 6. Model eğitimi
-    history = train_model(
-        model, X_train, Y_train, X_val, Y_val,
-        train_generator=train_generator,
-        epochs=epochs,
-        batch_size=batch_size,
-        use_augmentation=use_augmentation,
-        callbacks=callbacks
+    # 8. Model değerlendirme
+    evaluation_results, _ = cached_stage(
+        'eval',
+        inputs={'data': data_digest, 'train': train_digest},
+        compute=lambda: evaluate_model(model, X_val, Y_val,
+                                       batch_size=config.PREDICTION_BATCH_SIZE),
+        save=save_results,
+        load=load_results
     )
     
-    # 7. Eğitim geçmişini görselleştirme
-    plot_training_history(history)
+    # 9. TFLite dışa aktarma (isteğe bağlı)
+    predictor_model = model
+    if config.EXPORT_TFLITE:
+        export_tflite(
+            model, config.TFLITE_PATH,
+            quantization=config.TFLITE_QUANTIZATION,
+            calibration_data=X_train,
+            num_calibration_samples=config.TFLITE_CALIBRATION_SAMPLES,
+            seed=config.RANDOM_STATE
+        )
+        compare_tflite_with_keras(
+            model, config.TFLITE_PATH, X_val, Y_val,
+            keras_model_path=save_model_path,
+            num_threads=config.TFLITE_NUM_THREADS
+        )
+        if config.PREDICT_WITH_TFLITE:
+            predictor_model = TFLitePredictor(config.TFLITE_PATH,
+                                              num_threads=config.TFLITE_NUM_THREADS)
+    
+    # 10. Tahmin ve submission
+    def compute_predict():
+        predictions = make_predictions(
+            predictor_model, X_test, submission_path,
+            streaming=config.STREAMING_PREDICTION,
+            batch_size=config.PREDICTION_BATCH_SIZE,
+            probabilities_path=config.PROBABILITIES_PATH,
+            tta_variants=config.TTA_VARIANTS,
+            tta_params=tta_params()
+        )
+        if config.STREAMING_PREDICTION:
+            # Akış modu sınıfları biriktirmez; az önce yazılan submission'dan okunur
+            predictions = submission_classes(submission_path)
+        return predictions
     
-    # 8. Model değerlendirme
-    evaluation_results = evaluate_model(model, X_val, Y_val)
+    # Alt klasörde tutulur: kök klasördeki .npy dosyaları load_results() ile yüklenir
+    probabilities_file = (os.path.join('outputs', 'probabilities'
+                                       + os.path.splitext(config.PROBABILITIES_PATH)[1])
+                          if config.PROBABILITIES_PATH else None)
     
-    # 9. Tahmin ve submission
-    predictions = make_predictions(model, X_test, submission_path)
+    def save_predict(directory, predictions):
+        shutil.copyfile(submission_path, os.path.join(directory, 'submission.csv'))
+        if probabilities_file:
+            os.makedirs(os.path.join(directory, 'outputs'), exist_ok=True)
+            shutil.copyfile(config.PROBABILITIES_PATH, os.path.join(directory, probabilities_file))
+        save_results(directory, {'predicted_classes': predictions})
+    
+    def load_predict(directory):
+        shutil.copyfile(os.path.join(directory, 'submission.csv'), submission_path)
+        if probabilities_file:
+            # Olasılık dosyası da aşama anahtarının parçası; önbellekten geri yüklenir
+            shutil.copyfile(os.path.join(directory, probabilities_file), config.PROBABILITIES_PATH)
+        results = load_results(directory)
+        if 'predicted_classes' not in results:
+            # Eski (akış modu özeti kaydedilmiş) önbellek girdisi: sınıflar submission'dan okunur
+            return submission_classes(submission_path)
+        return results['predicted_classes']
+    
+    predictions, _ = cached_stage(
+        'predict',
+        inputs={
+            'data': data_digest,
+            'train': train_digest,
+            **{name: getattr(config, name) for name in PREDICT_CONFIG_KEYS},
+        },
+        compute=compute_predict,
+        save=save_predict,
+        load=load_predict
+    )
+    
+    # Arka planda çizilen grafiklerin bitmesini bekle ve kazanılan süreyi raporla
+    finish_plotting()
     
     print("\n" + "="*80)
     print("TÜM İŞLEMLER TAMAMLANDI!")
@@ -154,18 +478,309 @@ def run_complete_pipeline(train_path=None,
     return model, history, evaluation_results, predictions
 
 
-if __name__ == "__main__":
-    # Ana program çalıştırılıyor
-    # Tüm parametreler config.py dosyasından alınır
-    # İsterseniz burada parametreleri özelleştirebilirsiniz
-    
-    model, history, results, predictions = run_complete_pipeline(
-        # Özelleştirmek için parametreleri buraya ekleyebilirsiniz:
-        # model_type='standard',  # 'simple', 'standard', 'deep'
-        # epochs=50,
-        # batch_size=32,
-        # use_augmentation=True,
-        # save_model_path='best_model.h5',
-        # submission_path='submission.csv'
+def cmd_train(args):
+    """train alt komutu: tam pipeline'ı çalıştırır."""
+    print_environment()
+    return run_complete_pipeline(
+        model_type=args.model_type,
+        epochs=args.epochs,
+        batch_size=args.batch_size,
+        use_augmentation=False if args.no_augmentation else None,
+        save_model_path=args.model,
+        submission_path=args.submission,
+        use_stage_cache=False if args.no_cache else None,
+        invalidate=tuple(args.invalidate),
+        plot_mode=args.plots,
+        resume=True if args.resume else None,
+        adaptive=True if args.adaptive else None
+    )
+
+
+def cmd_eval(args):
+    """eval alt komutu: kayıtlı modeli doğrulama seti üzerinde değerlendirir."""
+    from tensorflow import keras
+    from modules.data_loader import load_and_preprocess_data
+    from modules.model_evaluator import evaluate_model
+    from modules.plotting import configure_plotting, finish_plotting
+    
+    configure_plotting(args.plots or config.PLOT_MODE, config.PLOT_DIR,
+                       config.PLOT_FORMAT, config.PLOT_DPI)
+    model = keras.models.load_model(args.model or config.MODEL_SAVE_PATH)
+    _, X_val, _, Y_val, _ = load_and_preprocess_data(
+        config.TRAIN_PATH, config.TEST_PATH,
+        validation_split=config.VALIDATION_SPLIT,
+        random_state=config.RANDOM_STATE,
+        use_cache=config.USE_DATA_CACHE,
+        cache_dir=config.DATA_CACHE_DIR,
+        compact_dtypes=config.COMPACT_DTYPES
+    )
+    results = evaluate_model(model, X_val, Y_val, batch_size=config.PREDICTION_BATCH_SIZE)
+    finish_plotting()
+    return results
+
+
+def cmd_predict(args):
+    """predict alt komutu: kayıtlı model (veya TFLite) ile submission üretir."""
+    from modules.data_loader import load_test_data
+    from modules.predictor import make_predictions
+    
+    ensemble_paths = args.ensemble or config.ENSEMBLE_MODEL_PATHS
+    if ensemble_paths:
+        from modules.ensemble import EnsemblePredictor, load_ensemble_members
+        print(f"\nEnsemble modelleri yükleniyor ({len(ensemble_paths)} checkpoint)...")
+        model = EnsemblePredictor(
+            load_ensemble_members(ensemble_paths, num_threads=config.TFLITE_NUM_THREADS),
+            weights=args.weights or config.ENSEMBLE_WEIGHTS,
+            mode=args.ensemble_mode or config.ENSEMBLE_MODE,
+            batch_size=config.PREDICTION_BATCH_SIZE
+        )
+    elif args.tflite:
+        from modules.model_exporter import TFLitePredictor
+        model = TFLitePredictor(args.tflite, num_threads=config.TFLITE_NUM_THREADS)
+    else:
+        from tensorflow import keras
+        model = keras.models.load_model(args.model or config.MODEL_SAVE_PATH)
+    X_test = load_test_data(config.TEST_PATH, use_cache=config.USE_DATA_CACHE,
+                            cache_dir=config.DATA_CACHE_DIR,
+                            compact_dtypes=config.COMPACT_DTYPES)
+    try:
+        return make_predictions(
+            model, X_test, args.submission or config.SUBMISSION_PATH,
+            streaming=args.streaming or config.STREAMING_PREDICTION,
+            batch_size=config.PREDICTION_BATCH_SIZE,
+            probabilities_path=config.PROBABILITIES_PATH,
+            tta_variants=args.tta or config.TTA_VARIANTS,
+            tta_params=tta_params()
+        )
+    finally:
+        if hasattr(model, 'close'):
+            # Ensemble thread havuzunu kapat
+            model.close()
+
+
+def cmd_serve(args):
+    """serve alt komutu: tahmin sunucusunu başlatır."""
+    from modules.inference_server import run_server
+    
+    run_server(args.model or config.MODEL_SAVE_PATH, args.host, args.port,
+               args.max_batch_size, args.max_wait_ms,
+               compact_dtypes=config.COMPACT_DTYPES)
+
+
+def cmd_sweep(args):
+    """sweep alt komutu: süreç havuzunda hiperparametre / mimari taraması yapar."""
+    from modules.sweep import run_sweep
+    
+    space = config.SWEEP_SPACE
+    if args.space:
+        with open(args.space) as f:
+            space = json.load(f)
+    return run_sweep(
+        space,
+        mode=args.mode,
+        num_trials=args.trials,
+        scheduler=args.scheduler,
+        min_epochs=args.min_epochs,
+        max_epochs=args.max_epochs,
+        eta=args.eta,
+        num_workers=args.workers,
+        threads_per_trial=args.threads_per_trial,
+        output_dir=args.output,
+        synthetic_samples=args.synthetic,
+        compact_dtypes=config.COMPACT_DTYPES,
+        seed=config.RANDOM_STATE
     )
 
+
+def cmd_distill(args):
+    """distill alt komutu: öğretmen checkpoint'inden küçük bir öğrenci model damıtır."""
+    from modules.data_loader import load_and_preprocess_data
+    from modules.distillation import distill_model
+    
+    X_train, X_val, Y_train, Y_val, _ = load_and_preprocess_data(
+        config.TRAIN_PATH, config.TEST_PATH,
+        validation_split=config.VALIDATION_SPLIT,
+        random_state=config.RANDOM_STATE,
+        use_cache=config.USE_DATA_CACHE,
+        cache_dir=config.DATA_CACHE_DIR,
+        compact_dtypes=config.COMPACT_DTYPES
+    )
+    _, report = distill_model(
+        args.teacher, X_train, Y_train, X_val, Y_val,
+        student_type=args.student_type,
+        epochs=args.epochs,
+        batch_size=config.BATCH_SIZE,
+        temperature=args.temperature,
+        alpha=args.alpha,
+        accuracy_budget=args.budget,
+        logits_dir=config.DISTILL_LOGITS_DIR,
+        student_path=args.output,
+        input_shape=config.INPUT_SHAPE,
+        num_classes=config.NUM_CLASSES,
+        compact_dtypes=config.COMPACT_DTYPES,
+        patience=config.EARLY_STOPPING_PATIENCE,
+        reduce_lr_patience=config.REDUCE_LR_PATIENCE,
+        prediction_batch_size=config.PREDICTION_BATCH_SIZE
+    )
+    return report
+
+
+def cmd_optimize(args):
+    """optimize alt komutu: BN katlama, Dropout çıkarma ve isteğe bağlı budama."""
+    from tensorflow import keras
+    from modules.data_loader import load_and_preprocess_data
+    from modules.graph_optimizer import optimize_for_inference
+    
+    model = keras.models.load_model(args.model or config.MODEL_SAVE_PATH, compile=False)
+    X_train, X_val, Y_train, Y_val, _ = load_and_preprocess_data(
+        config.TRAIN_PATH, config.TEST_PATH,
+        validation_split=config.VALIDATION_SPLIT,
+        random_state=config.RANDOM_STATE,
+        use_cache=config.USE_DATA_CACHE,
+        cache_dir=config.DATA_CACHE_DIR,
+        compact_dtypes=config.COMPACT_DTYPES
+    )
+    _, report = optimize_for_inference(
+        model, X_val, Y_val,
+        pruning=args.prune,
+        sparsity=args.sparsity,
+        X_train=X_train,
+        Y_train=Y_train,
+        fine_tune_epochs=args.fine_tune_epochs,
+        batch_size=config.BATCH_SIZE,
+        learning_rate=config.PRUNING_LEARNING_RATE,
+        prediction_batch_size=config.PREDICTION_BATCH_SIZE,
+        output_path=args.output
+    )
+    return report
+
+
+BENCHMARKS = {
+    'startup': 'benchmarks.bench_startup',
+    'augmentation': 'benchmarks.bench_augmentation',
+    'precision': 'benchmarks.bench_precision',
+    'server': 'benchmarks.load_test_server',
+    'distributed': 'benchmarks.bench_distributed',
+    'pipeline': 'benchmarks.bench_pipeline',
+    'tta': 'benchmarks.bench_tta',
+    'ensemble': 'benchmarks.bench_ensemble',
+    'adaptive': 'benchmarks.bench_adaptive',
+}
+
+
+def cmd_bench(args):
+    """bench alt komutu: seçilen benchmark script'ini kalan argümanlarla çalıştırır."""
+    import runpy
+    
+    module = BENCHMARKS[args.name]
+    sys.argv = [module] + args.bench_args
+    runpy.run_module(module, run_name="__main__", alter_sys=True)
+
+
+def build_parser():
+    """Komut satırı argüman ayrıştırıcısını oluşturur."""
+    parser = argparse.ArgumentParser(description="CNN modeli - eğitim, değerlendirme, tahmin ve sunum")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    train = subparsers.add_parser("train", help="Tam pipeline'ı çalıştır (varsayılan)")
+    train.add_argument("--model-type",
+                       help="'simple', 'standard', 'deep', 'semih' veya .yaml/.json model spec dosyası")
+    train.add_argument("--epochs", type=int)
+    train.add_argument("--batch-size", type=int)
+    train.add_argument("--no-augmentation", action="store_true")
+    train.add_argument("--model", help="Model kayıt yolu")
+    train.add_argument("--submission", help="Submission dosyası yolu")
+    train.add_argument("--no-cache", action="store_true", help="Aşama önbelleğini kullanma")
+    train.add_argument("--invalidate", nargs="+", default=[],
+                       choices=['data', 'train', 'eval', 'predict', 'all'],
+                       help="Önbelleği silinip yeniden çalıştırılacak aşamalar")
+    train.add_argument("--plots", choices=PLOT_MODES, help="Grafik modu")
+    train.add_argument("--resume", action="store_true",
+                       help="Eğitime son asenkron checkpoint'ten devam et")
+    train.add_argument("--adaptive", action="store_true",
+                       help="Yakınsama odaklı eğitim: uyarlanabilir batch boyutu ve erken durma")
+    train.set_defaults(func=cmd_train)
+    
+    evaluate = subparsers.add_parser("eval", help="Kayıtlı modeli değerlendir")
+    evaluate.add_argument("--model", help="Model checkpoint yolu")
+    evaluate.add_argument("--plots", choices=PLOT_MODES, help="Grafik modu")
+    evaluate.set_defaults(func=cmd_eval)
+    
+    predict = subparsers.add_parser("predict", help="Kayıtlı modelle submission üret")
+    predict.add_argument("--model", help="Model checkpoint yolu")
+    predict.add_argument("--tflite", help="Keras modeli yerine kullanılacak .tflite dosyası")
+    predict.add_argument("--submission", help="Submission dosyası yolu")
+    predict.add_argument("--streaming", action="store_true", help="Akış modunda tahmin")
+    predict.add_argument("--tta", type=int, default=None,
+                         help="Test zamanı veri artırma varyant sayısı (varsayılan: TTA_VARIANTS)")
+    predict.add_argument("--ensemble", nargs="+", metavar="PATH",
+                         help="Olasılıkları ağırlıklı ortalanacak checkpoint'ler (.keras veya .tflite)")
+    predict.add_argument("--weights", type=float, nargs="+", help="Ensemble model ağırlıkları")
+    predict.add_argument("--ensemble-mode", choices=['fused', 'threads'])
+    predict.set_defaults(func=cmd_predict)
+    
+    serve = subparsers.add_parser("serve", help="Tahmin sunucusunu başlat")
+    serve.add_argument("--model", help="Model checkpoint yolu")
+    serve.add_argument("--host", default=config.SERVER_HOST)
+    serve.add_argument("--port", type=int, default=config.SERVER_PORT)
+    serve.add_argument("--max-batch-size", type=int, default=config.SERVER_MAX_BATCH_SIZE)
+    serve.add_argument("--max-wait-ms", type=float, default=config.SERVER_MAX_WAIT_MS)
+    serve.set_defaults(func=cmd_serve)
+    
+    sweep = subparsers.add_parser("sweep", help="Hiperparametre / mimari taraması")
+    sweep.add_argument("--space", help="Arama uzayı JSON dosyası (varsayılan: config.SWEEP_SPACE)")
+    sweep.add_argument("--mode", choices=['grid', 'random'], default=config.SWEEP_MODE)
+    sweep.add_argument("--trials", type=int, default=config.SWEEP_TRIALS)
+    sweep.add_argument("--scheduler", choices=['asha', 'sha', 'none'], default=config.SWEEP_SCHEDULER)
+    sweep.add_argument("--min-epochs", type=int, default=config.SWEEP_MIN_EPOCHS)
+    sweep.add_argument("--max-epochs", type=int, default=config.SWEEP_MAX_EPOCHS)
+    sweep.add_argument("--eta", type=int, default=config.SWEEP_ETA)
+    sweep.add_argument("--workers", type=int, default=config.SWEEP_WORKERS)
+    sweep.add_argument("--threads-per-trial", type=int, help="Süreç başına CPU thread sayısı")
+    sweep.add_argument("--output", default=config.SWEEP_DIR)
+    sweep.add_argument("--synthetic", type=int, help="Sentetik örnek sayısı (CSV yerine)")
+    sweep.set_defaults(func=cmd_sweep)
+    
+    distill = subparsers.add_parser("distill", help="Öğretmen modelden küçük öğrenci model damıtma")
+    distill.add_argument("--teacher", default=config.DISTILL_TEACHER_PATH, help="Öğretmen checkpoint'i")
+    distill.add_argument("--student-type", default=config.DISTILL_STUDENT_TYPE,
+                         help="'simple', 'narrow' veya .yaml/.json model spec dosyası")
+    distill.add_argument("--epochs", type=int, default=config.DISTILL_EPOCHS)
+    distill.add_argument("--temperature", type=float, default=config.DISTILL_TEMPERATURE)
+    distill.add_argument("--alpha", type=float, default=config.DISTILL_ALPHA)
+    distill.add_argument("--budget", type=float, default=config.DISTILL_ACCURACY_BUDGET,
+                         help="Öğretmene göre kabul edilen doğruluk kaybı (0.005 = 0.5 puan)")
+    distill.add_argument("--output", default=config.DISTILL_STUDENT_PATH, help="Öğrenci model yolu")
+    distill.set_defaults(func=cmd_distill)
+    
+    optimize = subparsers.add_parser("optimize", help="Sunum için BN katlama, Dropout çıkarma ve budama")
+    optimize.add_argument("--model", help="Eğitilmiş model yolu (varsayılan: MODEL_SAVE_PATH)")
+    optimize.add_argument("--prune", choices=['none', 'magnitude', 'channel'], default=config.PRUNING)
+    optimize.add_argument("--sparsity", type=float, default=config.PRUNING_SPARSITY)
+    optimize.add_argument("--fine-tune-epochs", type=int, default=config.PRUNING_FINE_TUNE_EPOCHS)
+    optimize.add_argument("--output", default=config.OPTIMIZED_MODEL_PATH, help="Optimize edilmiş model yolu")
+    optimize.set_defaults(func=cmd_optimize)
+    
+    bench = subparsers.add_parser("bench", help="Benchmark çalıştır")
+    bench.add_argument("name", choices=sorted(BENCHMARKS))
+    bench.add_argument("bench_args", nargs=argparse.REMAINDER,
+                       help="Benchmark script'ine iletilecek argümanlar")
+    bench.set_defaults(func=cmd_bench)
+    
+    return parser
+
+
+def main(argv=None):
+    """Komut satırı giriş noktası."""
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        # Alt komut verilmezse eskisi gibi tam pipeline çalıştırılır
+        args = build_parser().parse_args(["train"])
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    # Ana program çalıştırılıyor
+    # Tüm parametreler config.py dosyasından alınır; komut satırı
+    # argümanları ile geçersiz kılınabilir (python main.py --help)
+    main()
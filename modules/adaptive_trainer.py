@@ -0,0 +1,287 @@
+# ============================================================================
+# MODÜL 20: YAKINSAMA ODAKLI EĞİTİM (UYARLANABİLİR BATCH BOYUTU)
+# ============================================================================
+# train_model() sabit BATCH_SIZE ile epoch epoch eğitir; callback'ler ancak
+# EARLY_STOPPING_PATIENCE tam epoch boyunca iyileşme olmazsa durur. Bu
+# modülde eğitim, her biri N adımlık kısa model.fit() parçalarıyla yapılır:
+#   - Her parçadan sonra sabit bir doğrulama alt örneği değerlendirilir
+#   - Gradyan gürültü ölçeği B_noise = tr(Σ) / |G|² (McCandlish ve ark., 2018)
+#     aynı batch'in K parçasına ait gradyanlardan tahmin edilir. B_noise,
+#     gürültünün sinyale göre azaldığı ve daha büyük batch'lerin adım başına
+#     daha fazla ilerleme sağladığı "kritik" batch boyutudur; mevcut batch'in
+#     iki katını aşınca batch ikiye katlanır, öğrenme oranı da aynı oranda
+#     ('linear' veya 'sqrt') ölçeklenir
+#   - Hedef val_accuracy'ye ulaşılınca veya val_loss belirli sayıda
+#     değerlendirme boyunca iyileşmezse eğitim hemen durur
+# ============================================================================
+
+import math
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+LR_SCALING_RULES = ('linear', 'sqrt', 'none')
+HISTORY_KEYS = ('loss', 'accuracy', 'val_loss', 'val_accuracy', 'batch_size', 'learning_rate',
+                'noise_scale', 'images_seen', 'wall_s')
+
+
+def noise_scale_estimate(small_sq_norm, big_sq_norm, small_batch, big_batch):
+    """
+    İki batch boyutundaki gradyan norm karelerinden |G|² ve tr(Σ) tahmin eder.
+
+    E[|G_B|²] = |G|² + tr(Σ) / B eşitliği iki batch boyutu için çözülür.
+
+    Parametreler:
+    ------------
+    small_sq_norm : float
+        Küçük batch gradyanlarının ortalama norm karesi
+    big_sq_norm : float
+        Büyük batch (küçük batch'lerin ortalaması) gradyanının norm karesi
+    small_batch, big_batch : int
+        Batch boyutları
+
+    Döndürür:
+    --------
+    grad_sq, trace : float, float
+        Gerçek gradyanın norm karesi ve gradyan kovaryansının izi
+    """
+    grad_sq = (big_batch * big_sq_norm - small_batch * small_sq_norm) / (big_batch - small_batch)
+    trace = (small_sq_norm - big_sq_norm) / (1.0 / small_batch - 1.0 / big_batch)
+    return grad_sq, trace
+
+
+def _make_gradient_probe(model, num_splits):
+    """Batch'i num_splits parçaya bölüp parça ve toplam gradyan norm karelerini hesaplayan fonksiyon."""
+    import tensorflow as tf
+    from tensorflow import keras
+
+    loss_fn = keras.losses.get(model.loss)
+    variables = model.trainable_variables
+
+    @tf.function(reduce_retracing=True)
+    def probe(x, y):
+        small_sq = tf.constant(0.0)
+        total = [tf.zeros(v.shape, tf.float32) for v in variables]
+        for xs, ys in zip(tf.split(x, num_splits), tf.split(y, num_splits)):
+            with tf.GradientTape() as tape:
+                # training=False: Dropout ve BatchNormalization istatistikleri değişmez
+                outputs = tf.cast(model(xs, training=False), tf.float32)
+                loss = tf.reduce_mean(loss_fn(ys, outputs))
+            grads = [tf.cast(g, tf.float32) for g in tape.gradient(loss, variables)]
+            small_sq += tf.add_n([tf.reduce_sum(tf.square(g)) for g in grads])
+            total = [t + g for t, g in zip(total, grads)]
+        big_sq = tf.add_n([tf.reduce_sum(tf.square(t / num_splits)) for t in total])
+        return small_sq / num_splits, big_sq
+
+    return probe
+
+
+def _augment_chunk(X, augmentation, block_size=4096):
+    """Eğitim parçasını bloklar halinde vektörel olarak artırır (uint8 girdide veri tipi korunur)."""
+    from modules.data_augmentation_module import augment_batch
+
+    output = np.empty_like(X)
+    for start in range(0, len(X), block_size):
+        augmented = augment_batch(X[start:start + block_size], **augmentation).numpy()
+        if np.issubdtype(X.dtype, np.integer):
+            augmented = np.clip(np.round(augmented), 0, 255)
+        output[start:start + block_size] = augmented.astype(X.dtype)
+    return output
+
+
+def train_adaptive(model, X_train, Y_train, X_val, Y_val, epochs=3, batch_size=32,
+                   max_batch_size=1024, eval_every=100, val_samples=2048, target_accuracy=None,
+                   patience=5, min_delta=1e-3, noise_splits=4, lr_scaling='sqrt', noise_ema=0.8,
+                   use_augmentation=True, augmentation=None, model_save_path=None,
+                   prediction_batch_size=1024, seed=13):
+    """
+    Modeli yakınsamaya göre erken duran ve batch boyutunu büyüten döngüyle eğitir.
+
+    train_distributed() gibi eğitilen modeli ve history.history özelliğine
+    sahip bir nesne döndürür; history'deki her kayıt bir epoch değil bir
+    değerlendirmedir (eval_every adım).
+
+    Parametreler:
+    ------------
+    model : keras.Model
+        Derlenmiş model (create_cnn_model)
+    X_train, Y_train : numpy array
+        Eğitim verisi
+    X_val, Y_val : numpy array
+        Doğrulama verisi (ara değerlendirmeler bunun alt örneğiyle yapılır)
+    epochs : int
+        En fazla işlenecek görüntü sayısı = epochs x len(X_train)
+    batch_size : int
+        Başlangıç batch boyutu
+    max_batch_size : int
+        Batch boyutunun büyüyebileceği üst sınır
+    eval_every : int
+        Kaç eğitim adımında bir doğrulama yapılacağı
+    val_samples : int
+        Doğrulama alt örneğinin boyutu
+    target_accuracy : float, optional
+        Alt örnekte bu val_accuracy'ye ulaşılınca eğitim durur
+    patience : int
+        val_loss kaç değerlendirme boyunca min_delta kadar iyileşmezse durulacağı
+    min_delta : float
+        İyileşme sayılacak en küçük val_loss azalması
+    noise_splits : int
+        Gürültü tahmini için batch_size x noise_splits görüntülük batch'in bölündüğü parça sayısı
+    lr_scaling : str
+        Batch ikiye katlanınca öğrenme oranı: 'linear' (x2), 'sqrt' (x√2) veya 'none'
+    noise_ema : float
+        Gürültü tahminlerinin üstel hareketli ortalama katsayısı
+    use_augmentation : bool
+        Veri artırma kullanılsın mı?
+    augmentation : dict, optional
+        augment_batch() ayarları (rotation_range, ...)
+    model_save_path : str, optional
+        Eğitim sonunda modelin kaydedileceği yol
+    prediction_batch_size : int
+        Doğrulama batch boyutu
+    seed : int
+        Karıştırma ve alt örnek seçimi için seed değeri
+
+    Döndürür:
+    --------
+    model, history : keras.Model, SimpleNamespace
+        history.history: değerlendirme başına metrikler, history.summary: özet
+    """
+    import tensorflow as tf
+
+    if lr_scaling not in LR_SCALING_RULES:
+        raise ValueError(f"Geçersiz öğrenme oranı ölçekleme kuralı: {lr_scaling} "
+                         f"(seçenekler: {', '.join(LR_SCALING_RULES)})")
+
+    print("\n" + "="*60)
+    print("MODÜL 20: YAKINSAMA ODAKLI EĞİTİM")
+    print("="*60)
+
+    rng = np.random.default_rng(seed)
+    val_index = np.sort(rng.choice(len(X_val), min(val_samples, len(X_val)), replace=False))
+    X_sub, Y_sub = np.asarray(X_val[val_index]), np.asarray(Y_val[val_index])
+    probe = _make_gradient_probe(model, noise_splits)
+    growth = {'linear': 2.0, 'sqrt': math.sqrt(2.0), 'none': 1.0}[lr_scaling]
+    learning_rate = float(tf.keras.backend.get_value(model.optimizer.learning_rate))
+    budget = epochs * len(X_train)
+
+    print(f"  - Başlangıç batch boyutu: {batch_size} (en fazla {max_batch_size})")
+    print(f"  - Değerlendirme: her {eval_every} adımda {len(X_sub)} doğrulama görüntüsü")
+    print("  - Durma: " + (f"val_accuracy >= {target_accuracy}, " if target_accuracy else "")
+          + f"{patience} değerlendirme iyileşme yok veya {epochs} epoch")
+    print(f"  - Öğrenme oranı ölçekleme: {lr_scaling}")
+
+    order, position = rng.permutation(len(X_train)), 0
+
+    def next_indices(count):
+        # Karıştırılmış sıradan count indeks alır; sıra bitince yeniden karıştırılır
+        nonlocal order, position
+        parts = []
+        while count > 0:
+            if position == len(order):
+                order, position = rng.permutation(len(X_train)), 0
+            part = order[position:position + count]
+            position += len(part)
+            count -= len(part)
+            parts.append(part)
+        # Sıralı indeksler memmap'ten sıralı okunur; fit parça içinde yeniden karıştırır
+        return np.sort(np.concatenate(parts))
+
+    history = {key: [] for key in HISTORY_KEYS}
+    grad_sq_ema = trace_ema = None
+    best_loss, best_weights, wait = np.inf, None, 0
+    images_seen, stop_reason, time_to_target = 0, 'budget', None
+    start = time.perf_counter()
+
+    while images_seen < budget:
+        steps = min(eval_every, max(1, (budget - images_seen) // batch_size))
+        index = next_indices(steps * batch_size)
+        X_chunk, Y_chunk = X_train[index], Y_train[index]
+        if use_augmentation:
+            X_chunk = _augment_chunk(X_chunk, augmentation or {})
+        fit = model.fit(X_chunk, Y_chunk, batch_size=batch_size, epochs=1, shuffle=True, verbose=0)
+        images_seen += len(index)
+        val = model.evaluate(X_sub, Y_sub, batch_size=prediction_batch_size, verbose=0,
+                             return_dict=True)
+
+        # Gradyan gürültü ölçeği: batch_size'lık noise_splits parça ve bunların ortalaması
+        noise_scale = float('nan')
+        probe_size = noise_splits * batch_size
+        if len(X_chunk) >= probe_size:
+            rows = np.sort(rng.choice(len(X_chunk), probe_size, replace=False))
+            small_sq, big_sq = (float(v) for v in probe(tf.constant(X_chunk[rows]),
+                                                        tf.constant(Y_chunk[rows])))
+            grad_sq, trace = noise_scale_estimate(small_sq, big_sq, batch_size, probe_size)
+            if grad_sq_ema is None:
+                grad_sq_ema, trace_ema = grad_sq, trace
+            else:
+                grad_sq_ema = noise_ema * grad_sq_ema + (1 - noise_ema) * grad_sq
+                trace_ema = noise_ema * trace_ema + (1 - noise_ema) * trace
+            if grad_sq_ema > 0 and trace_ema > 0:
+                noise_scale = trace_ema / grad_sq_ema
+
+        wall_s = time.perf_counter() - start
+        for key, value in (('loss', fit.history['loss'][-1]), ('accuracy', fit.history['accuracy'][-1]),
+                           ('val_loss', val['loss']), ('val_accuracy', val['accuracy']),
+                           ('batch_size', batch_size), ('learning_rate', learning_rate),
+                           ('noise_scale', noise_scale), ('images_seen', images_seen),
+                           ('wall_s', wall_s)):
+            history[key].append(float(value))
+
+        message = (f"{images_seen / len(X_train):>6.2f} epoch | batch {batch_size:>5} | "
+                   f"lr {learning_rate:.2e} | loss {fit.history['loss'][-1]:.4f} | "
+                   f"val_loss {val['loss']:.4f} | val_acc {val['accuracy']:.4f} | "
+                   f"B_noise {noise_scale:>7.0f} | {wall_s:.1f}s")
+
+        # Batch büyütme: kritik batch boyutu mevcut batch'in iki katını aşmışsa
+        # (ilk tahmin tek ölçüme dayandığı için en az iki ölçüm beklenir)
+        if (len(history['noise_scale']) > 1 and noise_scale >= 2 * batch_size
+                and 2 * batch_size <= max_batch_size):
+            batch_size *= 2
+            learning_rate *= growth
+            model.optimizer.learning_rate = learning_rate
+            message += f" → batch {batch_size}, lr {learning_rate:.2e}"
+        print(message)
+
+        if val['loss'] < best_loss - min_delta:
+            best_loss, best_weights, wait = val['loss'], model.get_weights(), 0
+        else:
+            wait += 1
+        if target_accuracy is not None and val['accuracy'] >= target_accuracy:
+            stop_reason, time_to_target, best_weights = 'target', wall_s, None
+            break
+        if wait >= patience:
+            stop_reason = 'plateau'
+            break
+
+    if best_weights is not None:
+        # EarlyStopping(restore_best_weights=True) gibi en iyi val_loss ağırlıklarına dönülür
+        model.set_weights(best_weights)
+    wall_s = time.perf_counter() - start
+    final = model.evaluate(X_val, Y_val, batch_size=prediction_batch_size, verbose=0, return_dict=True)
+
+    reasons = {'target': 'hedef doğruluğa ulaşıldı', 'plateau': 'val_loss iyileşmiyor',
+               'budget': 'epoch bütçesi doldu'}
+    summary = {
+        'stop_reason': stop_reason,
+        'wall_s': wall_s,
+        'time_to_target_s': time_to_target,
+        'images_seen': images_seen,
+        'epochs_seen': images_seen / len(X_train),
+        'evaluations': len(history['loss']),
+        'final_batch_size': batch_size,
+        'final_learning_rate': learning_rate,
+        'val_loss': float(final['loss']),
+        'val_accuracy': float(final['accuracy']),
+    }
+    print(f"\n✓ Eğitim durdu: {reasons[stop_reason]}")
+    print(f"  - Süre: {wall_s:.1f} s, {summary['epochs_seen']:.2f} epoch ({images_seen} görüntü)")
+    print(f"  - Son batch boyutu: {batch_size}, öğrenme oranı: {learning_rate:.2e}")
+    print(f"  - Tüm doğrulama seti: loss {summary['val_loss']:.4f}, "
+          f"accuracy {summary['val_accuracy']:.4f}")
+
+    if model_save_path:
+        model.save(model_save_path)
+        print(f"  - Model kaydedildi: {model_save_path}")
+    return model, SimpleNamespace(history=history, summary=summary)
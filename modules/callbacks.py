@@ -25,13 +25,541 @@
 #    - Eğitim kesilirse en iyi model zaten kaydedilmiş olur
 #    - Manuel müdahale gerektirmez
 #
+# AsyncModelCheckpoint (async_checkpoint=True): ModelCheckpoint yerine
+#    - Ağırlıkları ve optimizer durumunu belleğe kopyalar, diske yazmayı arka
+#      plan thread'inde native .keras / TF checkpoint formatında yapar
+#    - Geçici dosyaya yazıp yeniden adlandırır (yarım checkpoint kalmaz)
+#    - Son N checkpoint'i tutar; eğitim kaldığı epoch'tan aynen devam edebilir
+#    - Eğitimin kayıt için beklediği süreyi epoch başına ölçer
+#
 # DETAYLI AÇIKLAMA İÇİN: modules/CALLBACKS_ACIKLAMA.md dosyasına bakın
 # ============================================================================
 
-from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau, ModelCheckpoint
+import os
+import re
+import json
+import time
+import queue
+import shutil
+import threading
+
+import numpy as np
+from tensorflow import keras
+from tensorflow.keras.callbacks import Callback, EarlyStopping, ReduceLROnPlateau, ModelCheckpoint
+
+CHECKPOINT_PATTERN = re.compile(r'^ckpt-epoch(\d+)(\.keras)?$')
+
+
+def _optimizer_variables(optimizer):
+    """Optimizer değişkenlerini döndürür (eski ve yeni Keras API'leri için)."""
+    variables = optimizer.variables
+    return list(variables() if callable(variables) else variables)
+
 
+def _list_checkpoints(directory):
+    """Klasördeki checkpoint'leri (epoch, yol) olarak epoch sırasıyla döndürür."""
+    if not os.path.isdir(directory):
+        return []
+    found = []
+    for name in os.listdir(directory):
+        match = CHECKPOINT_PATTERN.match(name)
+        if match:
+            found.append((int(match.group(1)), os.path.join(directory, name)))
+    return sorted(found)
 
-def create_callbacks(patience=10, reduce_lr_patience=5, model_save_path='best_model.h5'):
+
+def _remove_path(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+class AsyncModelCheckpoint(Callback):
+    """
+    Checkpoint'leri eğitimi bekletmeden arka planda yazan callback.
+    
+    Epoch sonunda ağırlıklar ve optimizer durumu numpy kopyaları olarak
+    alınır (eğitimi bekleten tek adım budur). Kopyalar, eğitimdeki modelin
+    bir klonuna yüklenip arka plan thread'inde kaydedilir; böylece eğitim
+    bir sonraki epoch'a hemen geçer.
+    
+    Parametreler:
+    ------------
+    directory : str
+        Checkpoint klasörü (ckpt-epochNNN.keras veya ckpt-epochNNN/)
+    best_path : str, optional
+        En iyi modelin ayrıca kaydedileceği yol (ör. config.MODEL_SAVE_PATH)
+    monitor : str
+        En iyi modeli belirlemek için izlenecek metrik
+    mode : str
+        'max' veya 'min'
+    save_best_only : bool
+        True ise sadece metrik iyileştiğinde checkpoint alınır
+    keep_last : int
+        Tutulacak en son checkpoint sayısı (eskiler silinir)
+    checkpoint_format : str
+        'keras' (tek .keras dosyası) veya 'tf' (tf.train.Checkpoint klasörü)
+    include_optimizer : bool
+        Optimizer durumu (momentler, adım sayacı) da kaydedilsin mi?
+    resume : bool
+        True ise klasördeki mevcut checkpoint'ler bu eğitimin devamı sayılır;
+        False ise eğitim başında önceki çalıştırmanın checkpoint'leri silinir
+    initial_best : float, optional
+        Devam edilen eğitimde şimdiye kadarki en iyi monitor değeri
+        (restore_latest_checkpoint() ile okunur); None ise ±inf
+    verbose : int
+        1 ise her kayıtta mesaj yazdırılır
+    """
+    
+    def __init__(self, directory='checkpoints', best_path=None, monitor='val_accuracy',
+                 mode='max', save_best_only=False, keep_last=3, checkpoint_format='keras',
+                 include_optimizer=True, resume=False, initial_best=None, verbose=1):
+        super().__init__()
+        if checkpoint_format not in ('keras', 'tf'):
+            raise ValueError(f"Geçersiz checkpoint formatı: {checkpoint_format}")
+        self.directory = directory
+        self.best_path = best_path
+        self.monitor = monitor
+        self.mode = mode
+        self.save_best_only = save_best_only
+        self.keep_last = keep_last
+        self.checkpoint_format = checkpoint_format
+        self.include_optimizer = include_optimizer
+        self.resume = resume
+        self.verbose = verbose
+        self.best = initial_best if initial_best is not None else (-np.inf if mode == 'max' else np.inf)
+        self.blocked_times = []   # Epoch başına eğitimin kayıt için beklediği süre (s)
+        self.write_times = []     # Arka planda checkpoint başına yazma süresi (s)
+        self.setup_time = 0.0
+        self._queue = None
+        self._thread = None
+        self._error = None
+        self._clone = None
+        self._written = []        # Bu eğitim soyuna ait checkpoint yolları (eskiden yeniye)
+    
+    def _is_improvement(self, value):
+        return value > self.best if self.mode == 'max' else value < self.best
+    
+    def on_train_begin(self, logs=None):
+        start = time.perf_counter()
+        os.makedirs(self.directory, exist_ok=True)
+        existing = [path for _, path in _list_checkpoints(self.directory)]
+        if self.resume:
+            self._written = existing
+        else:
+            # Yeni eğitim: önceki (belki daha uzun) çalıştırmanın checkpoint'leri
+            # kalırsa budama yenilerini siler ve --resume eski modeli yükler
+            for path in existing + [os.path.join(self.directory, 'checkpoint.json')]:
+                _remove_path(path)
+            self._written = []
+        # Arka plan thread'i sadece bu klona dokunur; eğitimdeki model serbest kalır
+        self._clone = keras.models.clone_model(self.model)
+        self._clone.set_weights(self.model.get_weights())
+        if self.include_optimizer and getattr(self.model, 'optimizer', None) is not None:
+            self._clone.compile_from_config(self.model.get_compile_config())
+            self._clone.optimizer.build(self._clone.trainable_variables)
+        self._queue = queue.Queue(maxsize=2)
+        self._thread = threading.Thread(target=self._writer_loop, name='async-checkpoint',
+                                         daemon=True)
+        self._thread.start()
+        self.setup_time = time.perf_counter() - start
+    
+    def on_epoch_end(self, epoch, logs=None):
+        start = time.perf_counter()
+        self._raise_if_failed()
+        value = (logs or {}).get(self.monitor)
+        is_best = value is not None and self._is_improvement(value)
+        if is_best:
+            self.best = value
+        if is_best or not self.save_best_only:
+            weights = self.model.get_weights()
+            optimizer_state = None
+            if self.include_optimizer and getattr(self._clone, 'optimizer', None) is not None:
+                optimizer_state = [np.array(v) for v in _optimizer_variables(self.model.optimizer)]
+            # Kuyruk doluysa (yazıcı geride kaldıysa) burada beklenir ve ölçülür
+            self._queue.put((epoch + 1, weights, optimizer_state, is_best,
+                             None if value is None else float(value)))
+        self.blocked_times.append(time.perf_counter() - start)
+    
+    def on_train_end(self, logs=None):
+        start = time.perf_counter()
+        self._queue.put(None)
+        self._thread.join()
+        drain = time.perf_counter() - start
+        self._raise_if_failed()
+        
+        if self.verbose and self.blocked_times:
+            blocked_ms = np.array(self.blocked_times) * 1000.0
+            print(f"\n✓ Asenkron checkpoint: {len(self.write_times)} kayıt → {self.directory}")
+            print(f"  - Eğitimin kayıt için beklediği süre: epoch başına ort. {blocked_ms.mean():.1f} ms "
+                  f"(en fazla {blocked_ms.max():.1f} ms)")
+            if self.write_times:
+                print(f"  - Arka planda yazma süresi: kayıt başına ort. "
+                      f"{np.mean(self.write_times) * 1000.0:.1f} ms")
+            print(f"  - Kurulum {self.setup_time * 1000.0:.1f} ms, eğitim sonunda bekleme "
+                  f"{drain * 1000.0:.1f} ms")
+    
+    def _raise_if_failed(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Arka plan checkpoint yazımı başarısız oldu") from error
+    
+    def _writer_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if self._error is not None:
+                continue
+            try:
+                self._write(*item)
+            except Exception as exc:
+                self._error = exc
+    
+    def _save_clone(self, path):
+        """Klonu path'e yazar: önce geçici yola, sonra atomik yeniden adlandırma."""
+        root, ext = os.path.splitext(path)
+        tmp_path = f"{root}.tmp-{os.getpid()}{ext}"
+        _remove_path(tmp_path)
+        if ext:
+            # Uzantı formatı belirler ('.keras' native format)
+            self._clone.save(tmp_path)
+        else:
+            checkpoint = keras_checkpoint(self._clone, self.include_optimizer)
+            checkpoint.write(os.path.join(tmp_path, 'ckpt'))
+        if os.path.isdir(path):
+            shutil.rmtree(path)  # os.replace dolu bir klasörün üzerine yazamaz
+        os.replace(tmp_path, path)
+    
+    def _write(self, epoch, weights, optimizer_state, is_best, value):
+        start = time.perf_counter()
+        self._clone.set_weights(weights)
+        if optimizer_state is not None:
+            variables = _optimizer_variables(self._clone.optimizer)
+            if len(variables) != len(optimizer_state):
+                raise ValueError("Optimizer durumu klonla eşleşmiyor")
+            for variable, state in zip(variables, optimizer_state):
+                variable.assign(state)
+        
+        name = f'ckpt-epoch{epoch:03d}' + ('.keras' if self.checkpoint_format == 'keras' else '')
+        path = os.path.join(self.directory, name)
+        self._save_clone(path)
+        if is_best and self.best_path:
+            self._save_clone(self.best_path)
+        
+        # Bu eğitimin son N checkpoint'ini tut ve en son checkpoint bilgisini atomik olarak güncelle
+        self._written.append(path)
+        for old_path in self._written[:-self.keep_last]:
+            _remove_path(old_path)
+        self._written = self._written[-self.keep_last:]
+        state = {'latest': name, 'epoch': epoch, 'monitor': self.monitor, 'value': value,
+                 'best': float(self.best), 'format': self.checkpoint_format}
+        tmp_state = os.path.join(self.directory, 'checkpoint.json.tmp')
+        with open(tmp_state, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_state, os.path.join(self.directory, 'checkpoint.json'))
+        
+        self.write_times.append(time.perf_counter() - start)
+        if self.verbose:
+            print(f"\nEpoch {epoch}: checkpoint arka planda kaydedildi → {path}"
+                  + (" (en iyi)" if is_best else ""))
+
+
+def keras_checkpoint(model, include_optimizer=True):
+    """Model (ve optimizer) için tf.train.Checkpoint nesnesi oluşturur."""
+    import tensorflow as tf
+    if include_optimizer and getattr(model, 'optimizer', None) is not None:
+        return tf.train.Checkpoint(model=model, optimizer=model.optimizer)
+    return tf.train.Checkpoint(model=model)
+
+
+def restore_latest_checkpoint(directory, model=None):
+    """
+    AsyncModelCheckpoint klasöründeki en son checkpoint'ten eğitime devam
+    etmek için modeli yükler.
+    
+    Parametreler:
+    ------------
+    directory : str
+        Checkpoint klasörü
+    model : keras.Model, optional
+        'tf' formatı için ağırlıkların yükleneceği (derlenmiş) model;
+        'keras' formatında model dosyadan oluşturulur
+    
+    Döndürür:
+    --------
+    model, initial_epoch, state : keras.Model veya None, int, dict veya None
+        Checkpoint yoksa (model, 0, None); initial_epoch train_model()'e
+        verilebilir. state, checkpoint.json içeriğidir ('monitor', 'best', ...);
+        'best' create_callbacks(initial_best=...) ile en iyi değeri korur
+    """
+    checkpoints = _list_checkpoints(directory)
+    if not checkpoints:
+        return model, 0, None
+    epoch, path = checkpoints[-1]
+    state = None
+    state_path = os.path.join(directory, 'checkpoint.json')
+    if os.path.exists(state_path):
+        with open(state_path) as f:
+            state = json.load(f)
+    if path.endswith('.keras'):
+        model = keras.models.load_model(path)
+    else:
+        if model is None:
+            raise ValueError("'tf' formatındaki checkpoint için model verilmeli")
+        if getattr(model, 'optimizer', None) is not None:
+            model.optimizer.build(model.trainable_variables)
+        keras_checkpoint(model).read(os.path.join(path, 'ckpt')).expect_partial()
+    print(f"✓ Checkpoint yüklendi: {path} (epoch {epoch}'den devam)")
+    return model, epoch, state
+
+
+def _current_rss_mb():
+    """Sürecin anlık bellek kullanımını (RSS, MB) döndürür."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        return float('nan')
+
+
+class ProfilingCallback(Callback):
+    """
+    Eğitimde zamanın nereye gittiğini adım adım ölçen callback.
+    
+    Her eğitim adımı için şunları kaydeder:
+      - batch_ms    : adımın toplam duvar saati süresi
+      - data_wait_ms: girdi pipeline'ından batch'in gelmesini bekleme süresi
+      - compute_ms  : ileri/geri geçiş ve ağırlık güncellemesi süresi
+      - overhead_ms : önceki adımın bitişinden bu adımın başına kadar geçen süre
+                      (callback'ler, Python döngüsü)
+      - images_per_s, rss_mb
+    
+    Bekleme/hesaplama ayrımı için eğitim fonksiyonu geçici olarak, batch'i
+    önce çeken sonra train_step'i çalıştıran bir sürümle değiştirilir. Bu
+    sadece varsayılan dağıtım stratejisi ve steps_per_execution=1 ile
+    mümkündür; aksi halde data_wait_ms boş kalır ve compute_ms = batch_ms olur.
+    
+    Parametreler:
+    ------------
+    output_path : str
+        Adım tablosunun yazılacağı .csv dosyası; özet aynı isimle .json olarak yazılır
+    batch_size : int, optional
+        Batch boyutu (batch'ten okunamazsa images/s için kullanılır)
+    trace_steps : tuple, optional
+        (başlangıç, bitiş) global adım aralığı için TensorBoard profiler izi
+    trace_dir : str
+        Profiler izinin yazılacağı klasör (tensorboard --logdir)
+    warmup_steps : int
+        Özet istatistiklerde atlanacak ilk adım sayısı (graph oluşturma)
+    split_data_wait : bool
+        Girdi bekleme süresi ayrı ölçülsün mü?
+    """
+    
+    FIELDS = ('epoch', 'step', 'global_step', 'batch_ms', 'data_wait_ms', 'compute_ms',
+              'overhead_ms', 'images', 'images_per_s', 'rss_mb')
+    
+    def __init__(self, output_path='profile/steps.csv', batch_size=None, trace_steps=None,
+                 trace_dir='logs/profile', warmup_steps=5, split_data_wait=True):
+        super().__init__()
+        self.output_path = output_path
+        self.batch_size = batch_size
+        self.trace_steps = tuple(trace_steps) if trace_steps else None
+        self.trace_dir = trace_dir
+        self.warmup_steps = warmup_steps
+        self.split_data_wait = split_data_wait
+        self.records = []
+        self._epoch = 0
+        self._global_step = 0
+        self._prev_end = None
+        self._batch_begin = None
+        self._fetch = None
+        self._tracing = False
+        self._original_train_function = None
+    
+    def _can_split(self):
+        import tensorflow as tf
+        steps_per_execution = getattr(self.model, '_steps_per_execution',
+                                      getattr(self.model, 'steps_per_execution', None))
+        if steps_per_execution is not None and int(np.asarray(steps_per_execution)) != 1:
+            return False
+        return (self.split_data_wait and not tf.distribute.has_strategy()
+                and getattr(self.model, 'train_function', None) is not None)
+    
+    def on_train_begin(self, logs=None):
+        import tensorflow as tf
+        self.records = []
+        self._train_start = time.perf_counter()
+        if not self._can_split():
+            return
+        
+        model = self.model
+        compute_step = tf.function(model.train_step,
+                                   jit_compile=bool(getattr(model, 'jit_compile', False)))
+        
+        def profiled_train_function(iterator):
+            start = time.perf_counter()
+            data = next(iterator)   # Girdi pipeline'ı batch'i hazırlayana kadar bekler
+            fetched = time.perf_counter()
+            logs = compute_step(data)
+            first = tf.nest.flatten(data)[0]
+            self._fetch = (fetched - start, int(first.shape[0]) if first.shape.rank else None)
+            return logs
+        
+        self._original_train_function = model.train_function
+        model.train_function = profiled_train_function
+    
+    def on_epoch_begin(self, epoch, logs=None):
+        self._epoch = epoch
+        self._prev_end = None
+    
+    def on_train_batch_begin(self, batch, logs=None):
+        if self.trace_steps and self._global_step == self.trace_steps[0] and not self._tracing:
+            import tensorflow as tf
+            tf.profiler.experimental.start(self.trace_dir)
+            self._tracing = True
+        self._fetch = None
+        self._batch_begin = time.perf_counter()
+    
+    def on_train_batch_end(self, batch, logs=None):
+        # Loglardan bir skaler okumak, asenkron çalışan adımın bitmesini bekletir;
+        # böylece buradaki zaman hesaplamanın bitişini gösterir
+        if logs:
+            np.asarray(next(iter(logs.values())))
+        end = time.perf_counter()
+        batch_s = end - self._batch_begin
+        data_wait_s, images = self._fetch if self._fetch else (None, None)
+        images = images or self.batch_size
+        overhead_s = self._batch_begin - self._prev_end if self._prev_end is not None else 0.0
+        self.records.append({
+            'epoch': self._epoch,
+            'step': batch,
+            'global_step': self._global_step,
+            'batch_ms': batch_s * 1000.0,
+            'data_wait_ms': None if data_wait_s is None else data_wait_s * 1000.0,
+            'compute_ms': (batch_s - (data_wait_s or 0.0)) * 1000.0,
+            'overhead_ms': overhead_s * 1000.0,
+            'images': images,
+            'images_per_s': images / (batch_s + overhead_s) if images else None,
+            'rss_mb': _current_rss_mb(),
+        })
+        self._prev_end = end
+        self._global_step += 1
+        if self._tracing and self._global_step >= self.trace_steps[1]:
+            self._stop_trace()
+    
+    def _stop_trace(self):
+        import tensorflow as tf
+        tf.profiler.experimental.stop()
+        self._tracing = False
+        print(f"\n✓ Profiler izi kaydedildi: {self.trace_dir} "
+              f"(adım {self.trace_steps[0]}-{self.trace_steps[1]})")
+    
+    def on_train_end(self, logs=None):
+        if self._original_train_function is not None:
+            self.model.train_function = self._original_train_function
+            self._original_train_function = None
+        if self._tracing:
+            self._stop_trace()
+        if not self.records:
+            return
+        summary = self.summary()
+        self.save(summary)
+        print(f"\n✓ Profil: {summary['steps']} adım, {summary['images_per_s']:.0f} görüntü/s, "
+              f"adım p50 {summary['batch_ms_p50']:.1f} ms / p99 {summary['batch_ms_p99']:.1f} ms")
+        if summary['data_wait_fraction'] is not None:
+            print(f"  - Girdi bekleme: %{summary['data_wait_fraction'] * 100:.1f}, "
+                  f"hesaplama: %{summary['compute_fraction'] * 100:.1f}, "
+                  f"ek yük: %{summary['overhead_fraction'] * 100:.1f}")
+        print(f"  - En yüksek RSS: {summary['rss_mb_max']:.0f} MB")
+        print(f"  - Kayıt: {self.output_path}, {summary_path(self.output_path)}")
+    
+    def summary(self):
+        """Isınma adımları hariç özet istatistikleri döndürür."""
+        steady = self.records[self.warmup_steps:] or self.records
+        batch_ms = np.array([r['batch_ms'] for r in steady])
+        compute_ms = np.array([r['compute_ms'] for r in steady])
+        overhead_ms = np.array([r['overhead_ms'] for r in steady])
+        waits = [r['data_wait_ms'] for r in steady if r['data_wait_ms'] is not None]
+        images = sum(r['images'] or 0 for r in steady)
+        total_ms = batch_ms.sum() + overhead_ms.sum()
+        return {
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'model': self.model.name if self.model is not None else None,
+            'steps': len(self.records),
+            'warmup_steps': len(self.records) - len(steady),
+            'epochs': self._epoch + 1,
+            'wall_s': time.perf_counter() - self._train_start,
+            'images_per_s': images / (total_ms / 1000.0) if total_ms else 0.0,
+            'batch_ms_mean': float(batch_ms.mean()),
+            'batch_ms_p50': float(np.percentile(batch_ms, 50)),
+            'batch_ms_p90': float(np.percentile(batch_ms, 90)),
+            'batch_ms_p99': float(np.percentile(batch_ms, 99)),
+            'compute_ms_mean': float(compute_ms.mean()),
+            'data_wait_ms_mean': float(np.mean(waits)) if waits else None,
+            'overhead_ms_mean': float(overhead_ms.mean()),
+            'data_wait_fraction': float(np.sum(waits) / total_ms) if waits and total_ms else None,
+            'compute_fraction': float(compute_ms.sum() / total_ms) if total_ms else None,
+            'overhead_fraction': float(overhead_ms.sum() / total_ms) if total_ms else None,
+            'rss_mb_max': float(max(r['rss_mb'] for r in self.records)),
+        }
+    
+    def save(self, summary=None):
+        """Adım tablosunu CSV, özeti JSON olarak kaydeder."""
+        import csv
+        directory = os.path.dirname(self.output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.output_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+            writer.writeheader()
+            writer.writerows(self.records)
+        with open(summary_path(self.output_path), 'w') as f:
+            json.dump(summary or self.summary(), f, indent=2)
+
+
+def summary_path(output_path):
+    """Adım tablosu yolundan özet JSON dosyasının yolunu türetir."""
+    return os.path.splitext(output_path)[0] + '.json'
+
+
+def compare_profiles(baseline_path, candidate_path):
+    """
+    İki çalıştırmanın profil özetlerini (.json) karşılaştırıp farkları yazdırır.
+    
+    Döndürür:
+    --------
+    dict
+        Metrik -> (referans, aday, yüzde değişim)
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(candidate_path) as f:
+        candidate = json.load(f)
+    
+    comparison = {}
+    print(f"\n{'Metrik':<22}{'Referans':>12}{'Aday':>12}{'Değişim':>10}")
+    for key, value in baseline.items():
+        other = candidate.get(key)
+        if not isinstance(value, (int, float)) or not isinstance(other, (int, float)):
+            continue
+        change = (other - value) / value * 100.0 if value else float('nan')
+        comparison[key] = (value, other, change)
+        print(f"{key:<22}{value:>12.2f}{other:>12.2f}{change:>+9.1f}%")
+    return comparison
+
+
+def create_callbacks(patience=10, reduce_lr_patience=5, model_save_path='best_model.h5',
+                     async_checkpoint=False, checkpoint_dir='checkpoints', keep_last=3,
+                     checkpoint_format='keras', resume=False, initial_best=None, profile=False,
+                     profile_path='profile/steps.csv', batch_size=None, trace_steps=None,
+                     trace_dir='logs/profile', restore_best_weights=True):
     """
     Model eğitimi için callback'ler oluşturur.
     
@@ -58,9 +586,54 @@ def create_callbacks(patience=10, reduce_lr_patience=5, model_save_path='best_mo
     
     model_save_path : str
         En iyi modelin kaydedileceği dosya yolu
-        - Örnek: 'best_model.h5', 'models/my_model.h5'
+        - Örnek: 'best_model.h5', 'models/my_model.keras'
         - Model otomatik olarak bu yola kaydedilir
     
+    async_checkpoint : bool
+        True ise ModelCheckpoint yerine AsyncModelCheckpoint kullanılır
+        - Her epoch'ta ağırlıklar + optimizer durumu arka planda checkpoint_dir'e yazılır
+        - En iyi model yine model_save_path'e kaydedilir
+    
+    checkpoint_dir : str
+        Asenkron checkpoint klasörü (eğitime devam için)
+    
+    keep_last : int
+        Tutulacak en son checkpoint sayısı
+    
+    checkpoint_format : str
+        'keras' (.keras dosyası) veya 'tf' (tf.train.Checkpoint klasörü)
+    
+    resume : bool
+        True ise checkpoint_dir'deki checkpoint'lerden devam ediliyordur;
+        False ise yeni eğitim başında klasördeki eski checkpoint'ler silinir
+    
+    initial_best : float, optional
+        Devam edilen eğitimde şimdiye kadarki en iyi val_accuracy; ilk epoch
+        daha kötüyse model_save_path'teki en iyi model ezilmez
+    
+    profile : bool
+        True ise listeye ProfilingCallback eklenir
+        - Adım süresi, girdi bekleme / hesaplama ayrımı, görüntü/s, RSS
+        - Sonuçlar profile_path (.csv) ve aynı isimli .json özetine yazılır
+    
+    profile_path : str
+        Profil adım tablosunun yolu
+    
+    batch_size : int, optional
+        Profildeki görüntü/s hesabı için batch boyutu
+    
+    trace_steps : tuple, optional
+        (başlangıç, bitiş) adım aralığı için TensorBoard profiler izi
+    
+    trace_dir : str
+        Profiler izinin yazılacağı klasör
+    
+    restore_best_weights : bool
+        EarlyStopping eğitim sonunda en iyi epoch'un ağırlıklarını geri yüklesin mi?
+        - Eğitime sonradan devam edilecekse (ör. tarama basamakları) False
+          verilmeli; aksi halde son epoch'un optimizer durumu en iyi epoch'un
+          ağırlıklarıyla karışır
+    
     Döndürür:
     --------
     list
@@ -101,7 +674,7 @@ def create_callbacks(patience=10, reduce_lr_patience=5, model_save_path='best_mo
     early_stopping = EarlyStopping(
         monitor='val_loss',              # İzlenecek metrik: validasyon loss
         patience=patience,              # Kaç epoch bekleyecek (varsayılan: 10)
-        restore_best_weights=True,      # En iyi ağırlıkları geri yükle
+        restore_best_weights=restore_best_weights,  # En iyi ağırlıkları geri yükle
         verbose=1                        # Bilgilendirme mesajlarını göster
     )
     
@@ -130,12 +703,25 @@ def create_callbacks(patience=10, reduce_lr_patience=5, model_save_path='best_mo
     #   - Her epoch'ta val_accuracy'yi kontrol eder
     #   - Eğer yeni bir en iyi accuracy görürse modeli kaydeder
     #   - save_best_only=True → Sadece en iyi modeli kaydeder (disk alanı tasarrufu)
-    model_checkpoint = ModelCheckpoint(
-        model_save_path,                # Modelin kaydedileceği dosya yolu
-        monitor='val_accuracy',         # İzlenecek metrik: validasyon accuracy
-        save_best_only=True,            # Sadece en iyi modeli kaydet
-        verbose=1                       # Bilgilendirme mesajlarını göster
-    )
+    if async_checkpoint:
+        # Ağırlıklar belleğe kopyalanır, diske yazma arka plan thread'inde yapılır
+        model_checkpoint = AsyncModelCheckpoint(
+            checkpoint_dir,
+            best_path=model_save_path,      # En iyi model ayrıca buraya kaydedilir
+            monitor='val_accuracy',
+            keep_last=keep_last,            # Son N checkpoint tutulur
+            checkpoint_format=checkpoint_format,
+            resume=resume,
+            initial_best=initial_best,
+            verbose=1
+        )
+    else:
+        model_checkpoint = ModelCheckpoint(
+            model_save_path,                # Modelin kaydedileceği dosya yolu
+            monitor='val_accuracy',         # İzlenecek metrik: validasyon accuracy
+            save_best_only=True,            # Sadece en iyi modeli kaydet
+            verbose=1                       # Bilgilendirme mesajlarını göster
+        )
     
     # Callback'leri listeye ekliyoruz
     callbacks = [
@@ -144,6 +730,18 @@ def create_callbacks(patience=10, reduce_lr_patience=5, model_save_path='best_mo
         model_checkpoint    # 3. Model kaydetme
     ]
     
+    # 4. PROFİL CALLBACK'İ (isteğe bağlı)
+    # -----------------------------------
+    # Ne yapar: Her eğitim adımının süresini, girdi bekleme / hesaplama
+    # ayrımını, throughput'u ve bellek kullanımını kaydeder
+    if profile:
+        callbacks.append(ProfilingCallback(
+            output_path=profile_path,
+            batch_size=batch_size,
+            trace_steps=trace_steps,        # Örn: (20, 30) → 20-30. adımlar için profiler izi
+            trace_dir=trace_dir
+        ))
+    
     print("✓ Callback'ler oluşturuldu:")
     print(f"  - Early Stopping (patience={patience})")
     print(f"    → {patience} epoch boyunca iyileşme olmazsa eğitimi durdurur")
@@ -151,6 +749,13 @@ def create_callbacks(patience=10, reduce_lr_patience=5, model_save_path='best_mo
     print(f"    → {reduce_lr_patience} epoch boyunca iyileşme olmazsa LR'yi yarıya indirir")
     print(f"  - Model Checkpoint (kayıt yolu: {model_save_path})")
     print(f"    → En iyi validasyon accuracy gösteren modeli kaydeder")
+    if async_checkpoint:
+        print(f"    → Asenkron: her epoch arka planda {checkpoint_dir} klasörüne "
+              f"({checkpoint_format}, son {keep_last} checkpoint)")
+    if profile:
+        print(f"  - Profil (kayıt yolu: {profile_path})")
+        print(f"    → Adım süresi, girdi bekleme / hesaplama, görüntü/s ve RSS kaydeder"
+              + (f"; {trace_steps[0]}-{trace_steps[1]}. adımlar için profiler izi" if trace_steps else ""))
     
     return callbacks
 
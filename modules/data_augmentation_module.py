@@ -2,13 +2,24 @@
 # MODÜL 4: VERİ ARTIRMA (DATA AUGMENTATION)
 # ============================================================================
 
+import os
+import math
+import hashlib
+
+import numpy as np
+import tensorflow as tf
 from tensorflow.keras.preprocessing.image import ImageDataGenerator
 
+from modules.numpy_augmentation import NumpyAugmenter
+
 
 def create_data_generator(rotation_range=5, width_shift_range=0.1, 
-                         height_shift_range=0.1, zoom_range=0.1):
+                         height_shift_range=0.1, zoom_range=0.1,
+                         backend='keras', num_workers=0, prefetch_batches=8, seed=None,
+                         featurewise_center=False, featurewise_std_normalization=False,
+                         zca_whitening=False):
     """
-    Veri artırma için ImageDataGenerator oluşturur.
+    Veri artırma için ImageDataGenerator (veya NumPy tabanlı eşdeğerini) oluşturur.
     
     Parametreler:
     ------------
@@ -20,22 +31,51 @@ def create_data_generator(rotation_range=5, width_shift_range=0.1,
         Dikey kaydırma oranı
     zoom_range : float
         Yakınlaştırma/uzaklaştırma oranı
+    backend : str
+        'keras' (ImageDataGenerator) veya 'numpy' (batch başına tek vektörel
+        dönüşüm yapan, çok süreçli NumpyAugmenter)
+    num_workers : int
+        'numpy' altyapısında batch hazırlayan süreç sayısı (0 = senkron)
+    prefetch_batches : int
+        'numpy' altyapısında önceden hazırlanacak batch sayısı
+    seed : int, optional
+        'numpy' altyapısı için seed değeri
+    featurewise_center, featurewise_std_normalization, zca_whitening : bool
+        Veri seti istatistiği gerektiren ayarlar ('keras' altyapısı). Sadece
+        bunlardan biri açıksa create_train_generator() istatistik hesaplar.
     
     Döndürür:
     --------
-    ImageDataGenerator
-        Veri artırma generator'ı
+    ImageDataGenerator veya NumpyAugmenter
+        Veri artırma generator'ı (ikisi de fit/flow arayüzüne sahiptir)
     """
     print("\n" + "="*60)
     print("MODÜL 4: VERİ ARTIRMA GENERATOR'ı OLUŞTURMA")
     print("="*60)
     
+    if backend == 'numpy':
+        datagen = NumpyAugmenter(
+            rotation_range=rotation_range,
+            width_shift_range=width_shift_range,
+            height_shift_range=height_shift_range,
+            zoom_range=zoom_range,
+            num_workers=num_workers,
+            prefetch_batches=prefetch_batches,
+            seed=seed
+        )
+        print(f"✓ NumPy veri artırma motoru oluşturuldu ({num_workers} işçi süreç)")
+        print(f"  - Döndürme: ±{rotation_range} derece")
+        print(f"  - Yatay kaydırma: ±{width_shift_range*100:.1f}%")
+        print(f"  - Dikey kaydırma: ±{height_shift_range*100:.1f}%")
+        print(f"  - Yakınlaştırma: {1-zoom_range:.1%} - {1+zoom_range:.1%}")
+        return datagen
+    
     datagen = ImageDataGenerator(
-        featurewise_center=False,
+        featurewise_center=featurewise_center,
         samplewise_center=False,
-        featurewise_std_normalization=False,
+        featurewise_std_normalization=featurewise_std_normalization,
         samplewise_std_normalization=False,
-        zca_whitening=False,
+        zca_whitening=zca_whitening,
         rotation_range=rotation_range,
         zoom_range=zoom_range,
         width_shift_range=width_shift_range,
@@ -53,13 +93,117 @@ def create_data_generator(rotation_range=5, width_shift_range=0.1,
     return datagen
 
 
-def create_train_generator(datagen, X_train, Y_train, batch_size=32):
+def _dataset_hash(X, chunk_rows=4096):
+    """Dizinin şekli, veri tipi ve içeriğinden SHA-256 özeti hesaplar."""
+    digest = hashlib.sha256(f"{X.shape}|{X.dtype}".encode("utf-8"))
+    for start in range(0, len(X), chunk_rows):
+        digest.update(np.ascontiguousarray(X[start:start + chunk_rows]).tobytes())
+    return digest.hexdigest()
+
+
+def compute_dataset_statistics(X, featurewise_center=False, featurewise_std_normalization=False,
+                               zca_whitening=False, zca_epsilon=1e-6, chunk_rows=4096,
+                               cache_dir=None, dataset_key=None):
+    """
+    ImageDataGenerator.fit() ile aynı istatistikleri veri üzerinden tek bir
+    akış (streaming) geçişiyle hesaplar.
+    
+    fit() tüm veri setini float kopyasına çevirirken burada veri chunk_rows
+    satırlık parçalarla okunur ve sadece toplamlar (ZCA için 784x784 X^T X)
+    tutulur. Sonuç, veri setinin hash'i ile anahtarlanarak diske kaydedilir.
+    
+    Parametreler:
+    ------------
+    X : numpy array
+        (örnek_sayısı, yükseklik, genişlik, kanal) eğitim görüntüleri
+    featurewise_center, featurewise_std_normalization, zca_whitening : bool
+        Hesaplanacak istatistikler
+    zca_epsilon : float
+        ZCA için epsilon (ImageDataGenerator varsayılanı)
+    chunk_rows : int
+        Her adımda işlenecek örnek sayısı
+    cache_dir : str, optional
+        İstatistiklerin kaydedileceği klasör (None ise önbellek kullanılmaz)
+    dataset_key : str, optional
+        Veri setinin bilinen hash'i (None ise içerikten hesaplanır)
+    
+    Döndürür:
+    --------
+    dict
+        'mean', 'std' ve 'principal_components' (hesaplanmayanlar None)
+    """
+    flags = (featurewise_center, featurewise_std_normalization, zca_whitening, zca_epsilon)
+    cache_path = None
+    if cache_dir is not None:
+        key = dataset_key or _dataset_hash(X)
+        name = hashlib.sha256(f"{key}|{flags}".encode("utf-8")).hexdigest()[:16]
+        cache_path = os.path.join(cache_dir, f"augstats_{name}.npz")
+        if os.path.exists(cache_path):
+            with np.load(cache_path) as cached:
+                print(f"✓ Veri seti istatistikleri önbellekten yüklendi: {cache_path}")
+                return {k: (cached[k] if k in cached.files else None)
+                        for k in ('mean', 'std', 'principal_components')}
+    
+    n = len(X)
+    channels = X.shape[-1]
+    features = int(np.prod(X.shape[1:]))
+    channel_sum = np.zeros(channels)
+    channel_sumsq = np.zeros(channels)
+    feature_sum = np.zeros(features) if zca_whitening else None
+    gram = np.zeros((features, features)) if zca_whitening else None
+    
+    for start in range(0, n, chunk_rows):
+        chunk = np.asarray(X[start:start + chunk_rows], dtype=np.float64)
+        channel_sum += chunk.sum(axis=(0, 1, 2))
+        channel_sumsq += np.square(chunk).sum(axis=(0, 1, 2))
+        if zca_whitening:
+            flat = chunk.reshape(len(chunk), features)
+            feature_sum += flat.sum(axis=0)
+            gram += flat.T @ flat
+    
+    channel_mean = channel_sum / n
+    channel_std = np.sqrt(np.maximum(channel_sumsq / n - np.square(channel_mean), 0.0))
+    
+    mean = channel_mean.reshape(1, 1, channels) if featurewise_center else None
+    std = channel_std.reshape(1, 1, channels) if featurewise_std_normalization else None
+    principal_components = None
+    if zca_whitening:
+        # fit() ile aynı ön işleme: x' = (x - m) * a (kanal bazında), sigma = E[x' x'^T]
+        shift = np.broadcast_to(mean if mean is not None else 0.0, X.shape[1:]).reshape(features)
+        scale = np.broadcast_to(1.0 / (std + 1e-6) if std is not None else 1.0,
+                                X.shape[1:]).reshape(features)
+        feature_mean = feature_sum / n
+        sigma = (gram / n
+                 - np.outer(shift, feature_mean) - np.outer(feature_mean, shift)
+                 + np.outer(shift, shift))
+        sigma = sigma * np.outer(scale, scale)
+        u, s, _ = np.linalg.svd(sigma)
+        s_inv = 1.0 / np.sqrt(s[np.newaxis] + zca_epsilon)
+        principal_components = (u * s_inv).dot(u.T)
+    
+    stats = {'mean': mean, 'std': std, 'principal_components': principal_components}
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cache_path + ".tmp.npz"
+        np.savez(tmp_path, **{k: v for k, v in stats.items() if v is not None})
+        os.replace(tmp_path, cache_path)
+        print(f"✓ Veri seti istatistikleri önbelleğe kaydedildi: {cache_path}")
+    return stats
+
+
+def create_train_generator(datagen, X_train, Y_train, batch_size=32,
+                           stats_cache_dir=None, dataset_key=None):
     """
     Eğitim için veri artırma generator'ı oluşturur.
     
+    Veri seti istatistikleri (datagen.fit) sadece featurewise_center,
+    featurewise_std_normalization veya zca_whitening açıksa hesaplanır; bu
+    durumda da compute_dataset_statistics() ile tek akış geçişinde hesaplanıp
+    diske önbelleklenir.
+    
     Parametreler:
     ------------
-    datagen : ImageDataGenerator
+    datagen : ImageDataGenerator veya NumpyAugmenter
         Veri artırma generator'ı
     X_train : numpy array
         Eğitim görüntüleri
@@ -67,14 +211,164 @@ def create_train_generator(datagen, X_train, Y_train, batch_size=32):
         Eğitim etiketleri
     batch_size : int
         Batch boyutu
+    stats_cache_dir : str, optional
+        Veri seti istatistiklerinin önbelleklendiği klasör
+    dataset_key : str, optional
+        Veri setinin bilinen hash'i (None ise içerikten hesaplanır)
     
     Döndürür:
     --------
     NumpyArrayIterator
         Eğitim generator'ı
     """
-    datagen.fit(X_train)
+    needs_statistics = any(getattr(datagen, name, False) for name in
+                           ('featurewise_center', 'featurewise_std_normalization', 'zca_whitening'))
+    if needs_statistics:
+        stats = compute_dataset_statistics(
+            X_train,
+            featurewise_center=datagen.featurewise_center,
+            featurewise_std_normalization=datagen.featurewise_std_normalization,
+            zca_whitening=datagen.zca_whitening,
+            zca_epsilon=datagen.zca_epsilon,
+            cache_dir=stats_cache_dir,
+            dataset_key=dataset_key
+        )
+        datagen.mean = stats['mean']
+        datagen.std = stats['std']
+        datagen.principal_components = stats['principal_components']
     train_generator = datagen.flow(X_train, Y_train, batch_size=batch_size, shuffle=True)
     print(f"✓ Eğitim generator'ı oluşturuldu (batch_size={batch_size})")
     return train_generator
 
+
+def augment_batch(images, rotation_range=5, width_shift_range=0.1,
+                  height_shift_range=0.1, zoom_range=0.1, seed=None):
+    """
+    Bir batch görüntüyü tek bir vektörel işlemle rastgele döndürür, kaydırır ve
+    yakınlaştırır.
+    
+    Her örnek için ayrı bir afin matris üretilir ve tüm batch tek bir
+    ImageProjectiveTransformV3 çağrısıyla dönüştürülür. Parametrelerin anlamı
+    ImageDataGenerator ile aynıdır (kaydırma < 1 ise görüntü boyutunun oranı,
+    yakınlaştırma [1-zoom, 1+zoom] aralığı, boşluklar 'nearest' ile doldurulur).
+    
+    Parametreler:
+    ------------
+    images : tf.Tensor
+        (batch, yükseklik, genişlik, kanal) görüntüler
+    rotation_range : float
+        Döndürme açısı (derece)
+    width_shift_range : float
+        Yatay kaydırma oranı
+    height_shift_range : float
+        Dikey kaydırma oranı
+    zoom_range : float
+        Yakınlaştırma/uzaklaştırma oranı
+    seed : int, optional
+        Rastgelelik için seed değeri
+    
+    Döndürür:
+    --------
+    tf.Tensor
+        Dönüştürülmüş float32 görüntüler
+    """
+    images = tf.cast(images, tf.float32)
+    shape = tf.shape(images)
+    batch = shape[0]
+    height = tf.cast(shape[1], tf.float32)
+    width = tf.cast(shape[2], tf.float32)
+    
+    # Beş parametre tek çağrıyla çekilir: aynı op seed'li ayrı çağrılar
+    # graph içinde aynı diziyi üretir (tx == ty, zx == zy olurdu)
+    noise = tf.random.uniform([batch, 5], -1.0, 1.0, seed=seed)
+    theta = noise[:, 0] * (rotation_range * math.pi / 180.0)
+    tx = noise[:, 1] * (width_shift_range * width if width_shift_range < 1 else width_shift_range)
+    ty = noise[:, 2] * (height_shift_range * height if height_shift_range < 1 else height_shift_range)
+    zx = 1.0 + noise[:, 3] * zoom_range
+    zy = 1.0 + noise[:, 4] * zoom_range
+    
+    # Çıkış pikselinden giriş pikseline giden matris: döndürme @ yakınlaştırma,
+    # görüntü merkezi etrafında uygulanır ve kaydırma eklenir
+    cos, sin = tf.cos(theta), tf.sin(theta)
+    a0, a1 = cos * zx, -sin * zy
+    b0, b1 = sin * zx, cos * zy
+    cx = (width - 1.0) / 2.0
+    cy = (height - 1.0) / 2.0
+    a2 = cx + tx - a0 * cx - a1 * cy
+    b2 = cy + ty - b0 * cx - b1 * cy
+    zeros = tf.zeros([batch])
+    transforms = tf.stack([a0, a1, a2, b0, b1, b2, zeros, zeros], axis=1)
+    
+    return tf.raw_ops.ImageProjectiveTransformV3(
+        images=images,
+        transforms=transforms,
+        output_shape=shape[1:3],
+        fill_value=0.0,
+        interpolation="BILINEAR",
+        fill_mode="NEAREST"
+    )
+
+
+def create_tf_dataset(X_train, Y_train, batch_size=32, rotation_range=5,
+                      width_shift_range=0.1, height_shift_range=0.1, zoom_range=0.1,
+                      shuffle=True, cache=False, augment=True, seed=None):
+    """
+    ImageDataGenerator.flow yerine kullanılabilecek tf.data eğitim pipeline'ı
+    oluşturur.
+    
+    Augmentation örnek örnek Python'da değil, batch'ler üzerinde vektörel
+    olarak yapılır (augment_batch). map adımı AUTOTUNE ile paralel çalışır ve
+    prefetch sayesinde sonraki batch eğitimle eş zamanlı hazırlanır. Dönen
+    dataset doğrudan train_model(train_generator=...) ile kullanılabilir.
+    
+    Parametreler:
+    ------------
+    X_train : numpy array
+        Eğitim görüntüleri
+    Y_train : numpy array
+        Eğitim etiketleri
+    batch_size : int
+        Batch boyutu
+    rotation_range, width_shift_range, height_shift_range, zoom_range : float
+        create_data_generator() ile aynı veri artırma ayarları
+    shuffle : bool
+        Her epoch'ta veri karıştırılsın mı?
+    cache : bool
+        float32'ye dönüştürülmüş örnekler ilk epoch'tan sonra bellekte tutulsun mu?
+    augment : bool
+        False ise sadece batch'leme yapılır (veri artırma olmadan)
+    seed : int, optional
+        Karıştırma ve veri artırma için seed değeri
+    
+    Döndürür:
+    --------
+    tf.data.Dataset
+        (görüntü, etiket) batch'leri üreten dataset
+    """
+    print("\n" + "="*60)
+    print("MODÜL 4: tf.data VERİ ARTIRMA PIPELINE'I OLUŞTURMA")
+    print("="*60)
+    
+    dataset = tf.data.Dataset.from_tensor_slices((X_train, Y_train))
+    if cache:
+        dataset = dataset.map(lambda x, y: (tf.cast(x, tf.float32), y),
+                              num_parallel_calls=tf.data.AUTOTUNE)
+        dataset = dataset.cache()
+    if shuffle:
+        dataset = dataset.shuffle(len(X_train), seed=seed, reshuffle_each_iteration=True)
+    dataset = dataset.batch(batch_size)
+    
+    if augment:
+        def _augment(x, y):
+            return augment_batch(x, rotation_range, width_shift_range,
+                                 height_shift_range, zoom_range, seed=seed), y
+        dataset = dataset.map(_augment, num_parallel_calls=tf.data.AUTOTUNE)
+    
+    dataset = dataset.prefetch(tf.data.AUTOTUNE)
+    
+    print(f"✓ tf.data pipeline'ı oluşturuldu (batch_size={batch_size})")
+    print(f"  - Veri artırma: {'Evet (vektörel, AUTOTUNE paralel)' if augment else 'Hayır'}")
+    print(f"  - Önbellek (cache): {'Evet' if cache else 'Hayır'}")
+    print(f"  - Batch sayısı: {math.ceil(len(X_train) / batch_size)}")
+    
+    return dataset
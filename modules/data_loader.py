@@ -2,14 +2,188 @@
 # MODÜL 2: VERİ YÜKLEME VE ÖN İŞLEME
 # ============================================================================
 
+import os
+import json
+import hashlib
+import struct
+
 import numpy as np
 import pandas as pd
+import tensorflow as tf
 from tensorflow.keras.utils import to_categorical
 from sklearn.model_selection import train_test_split
 
 
+# Önbellek dosya formatı:
+#   [0:8]     sihirli bayt dizisi (CACHE_MAGIC)
+#   [8:12]    JSON başlığın uzunluğu (uint32, little-endian)
+#   [12:...]  JSON başlık (kaynak dosyanın hash'i, mtime'ı, boyutu, satır sayısı)
+#   [CACHE_HEADER_SIZE:...]  uint8 pikseller (satır x 784), ardından int64 etiketler
+CACHE_MAGIC = b"CNNVC001"
+CACHE_HEADER_SIZE = 4096
+CACHE_CHUNK_ROWS = 10000
+NUM_PIXELS = 784
+
+
+def _file_sha256(path, block_size=1 << 20):
+    """Dosyanın SHA-256 özetini bloklar halinde okuyarak hesaplar."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _default_cache_path(csv_path, cache_dir=None):
+    """CSV dosyası için önbellek dosyasının yolunu döndürür."""
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(csv_path) or ".", "cache")
+    name = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(cache_dir, name + ".u8cache")
+
+
+def _write_cache_header(f, header):
+    """Sabit boyutlu başlık alanını dosyanın başına yazar."""
+    payload = json.dumps(header, sort_keys=True).encode("utf-8")
+    if len(payload) + 12 > CACHE_HEADER_SIZE:
+        raise ValueError("Önbellek başlığı çok büyük")
+    f.seek(0)
+    f.write(CACHE_MAGIC)
+    f.write(struct.pack("<I", len(payload)))
+    f.write(payload)
+    f.write(b"\0" * (CACHE_HEADER_SIZE - 12 - len(payload)))
+
+
+def _read_cache_header(cache_path):
+    """Önbellek başlığını okur; dosya geçersizse None döndürür."""
+    try:
+        with open(cache_path, "rb") as f:
+            raw = f.read(CACHE_HEADER_SIZE)
+    except OSError:
+        return None
+    if len(raw) < CACHE_HEADER_SIZE or raw[:8] != CACHE_MAGIC:
+        return None
+    (length,) = struct.unpack("<I", raw[8:12])
+    try:
+        return json.loads(raw[12:12 + length].decode("utf-8"))
+    except ValueError:
+        return None
+
+
+def build_csv_cache(csv_path, cache_path=None, chunk_rows=CACHE_CHUNK_ROWS):
+    """
+    CSV dosyasını tek seferlik olarak sıkıştırılmış ikili önbelleğe dönüştürür.
+    
+    CSV parça parça okunur, pikseller uint8 ve etiketler int64 olarak yazılır.
+    Dosya önce geçici bir isimle yazılır ve sonra atomik olarak yerine taşınır.
+    
+    Parametreler:
+    ------------
+    csv_path : str
+        Kaynak CSV dosyası yolu
+    cache_path : str, optional
+        Önbellek dosyası yolu (None ise CSV'nin yanındaki cache/ klasörü)
+    chunk_rows : int
+        Her seferde okunacak satır sayısı
+    
+    Döndürür:
+    --------
+    dict
+        Yazılan önbellek başlığı
+    """
+    cache_path = cache_path or _default_cache_path(csv_path)
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    stat = os.stat(csv_path)
+    
+    tmp_path = f"{cache_path}.tmp{os.getpid()}"
+    labels = []
+    num_rows = 0
+    has_label = False
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b"\0" * CACHE_HEADER_SIZE)
+            for chunk in pd.read_csv(csv_path, chunksize=chunk_rows):
+                if "label" in chunk.columns:
+                    has_label = True
+                    labels.append(chunk.pop("label").to_numpy(dtype=np.int64))
+                pixels = chunk.to_numpy(dtype=np.uint8)
+                if pixels.shape[1] != NUM_PIXELS:
+                    raise ValueError(f"{csv_path}: {NUM_PIXELS} piksel sütunu bekleniyordu, "
+                                     f"{pixels.shape[1]} bulundu")
+                f.write(np.ascontiguousarray(pixels).tobytes())
+                num_rows += len(pixels)
+            if has_label:
+                f.write(np.concatenate(labels).astype("<i8").tobytes())
+            header = {
+                "source": os.path.abspath(csv_path),
+                "source_sha256": _file_sha256(csv_path),
+                "source_mtime_ns": stat.st_mtime_ns,
+                "source_size": stat.st_size,
+                "num_rows": num_rows,
+                "num_pixels": NUM_PIXELS,
+                "has_label": has_label,
+            }
+            _write_cache_header(f, header)
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return header
+
+
+def load_csv_cached(csv_path, cache_dir=None):
+    """
+    CSV dosyasını ikili önbellekten np.memmap olarak yükler.
+    
+    Önbellek yoksa veya kaynak CSV değiştiyse önbellek yeniden oluşturulur.
+    Değişiklik kontrolü önce boyut ve mtime ile yapılır; bunlar farklıysa
+    dosyanın hash'i karşılaştırılır (sadece dokunulmuş dosyalar yeniden
+    dönüştürülmez).
+    
+    Parametreler:
+    ------------
+    csv_path : str
+        Kaynak CSV dosyası yolu
+    cache_dir : str, optional
+        Önbellek klasörü (None ise CSV'nin yanındaki cache/ klasörü)
+    
+    Döndürür:
+    --------
+    pixels, labels : np.memmap
+        (satır, 784) uint8 pikseller ve int64 etiketler (etiket yoksa None)
+    """
+    cache_path = _default_cache_path(csv_path, cache_dir)
+    stat = os.stat(csv_path)
+    header = _read_cache_header(cache_path)
+    
+    if header is None:
+        print(f"   → Önbellek bulunamadı, oluşturuluyor: {cache_path}")
+        header = build_csv_cache(csv_path, cache_path)
+    elif (header["source_size"], header["source_mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+        if header["source_size"] == stat.st_size and header["source_sha256"] == _file_sha256(csv_path):
+            # İçerik aynı, sadece mtime değişmiş: başlığı güncellemek yeterli
+            header["source_mtime_ns"] = stat.st_mtime_ns
+            with open(cache_path, "r+b") as f:
+                _write_cache_header(f, header)
+        else:
+            print(f"   → Kaynak dosya değişmiş, önbellek yeniden oluşturuluyor: {cache_path}")
+            header = build_csv_cache(csv_path, cache_path)
+    
+    num_rows = header["num_rows"]
+    num_pixels = header["num_pixels"]
+    pixels = np.memmap(cache_path, dtype=np.uint8, mode="r",
+                       offset=CACHE_HEADER_SIZE, shape=(num_rows, num_pixels))
+    labels = None
+    if header["has_label"]:
+        labels = np.memmap(cache_path, dtype="<i8", mode="r",
+                           offset=CACHE_HEADER_SIZE + num_rows * num_pixels,
+                           shape=(num_rows,))
+    return pixels, labels
+
+
 def load_and_preprocess_data(train_path="data/train.csv", test_path="data/test.csv", 
-                             validation_split=0.1, random_state=13):
+                             validation_split=0.1, random_state=13,
+                             use_cache=False, cache_dir=None, compact_dtypes=False):
     """
     Veri setini yükler ve ön işleme yapar.
     
@@ -23,6 +197,15 @@ def load_and_preprocess_data(train_path="data/train.csv", test_path="data/test.c
         Doğrulama seti için ayrılacak oran (varsayılan: 0.1 = %10)
     random_state : int
         Rastgelelik için seed değeri
+    use_cache : bool
+        CSV yerine ikili (uint8, memmap) önbellekten yüklensin mi?
+    cache_dir : str, optional
+        Önbellek klasörü (None ise CSV'nin yanındaki cache/ klasörü)
+    compact_dtypes : bool
+        True ise pikseller uint8 (0-255) ve etiketler int32 sınıf numarası
+        olarak kalır. Normalizasyon modelin içinde yapılır
+        (create_cnn_model(compact_dtypes=True)), bu sayede bellek kullanımı ve
+        cihaza kopyalanan veri miktarı yaklaşık 8 kat azalır.
     
     Döndürür:
     --------
@@ -35,43 +218,69 @@ def load_and_preprocess_data(train_path="data/train.csv", test_path="data/test.c
     
     # 1. Veri yükleme
     print("\n1. Veri yükleme işlemi başlatılıyor...")
-    train = pd.read_csv(train_path)
-    test = pd.read_csv(test_path)
-    
-    print(f"   ✓ Eğitim verisi yüklendi: {train.shape}")
-    print(f"   ✓ Test verisi yüklendi: {test.shape}")
+    if use_cache:
+        train_pixels, train_labels = load_csv_cached(train_path, cache_dir)
+        test_pixels, _ = load_csv_cached(test_path, cache_dir)
+        print(f"   ✓ Eğitim verisi önbellekten yüklendi: {train_pixels.shape}")
+        print(f"   ✓ Test verisi önbellekten yüklendi: {test_pixels.shape}")
+    else:
+        train = pd.read_csv(train_path)
+        test = pd.read_csv(test_path)
+        
+        print(f"   ✓ Eğitim verisi yüklendi: {train.shape}")
+        print(f"   ✓ Test verisi yüklendi: {test.shape}")
     
     # 2. Etiket ve özellik ayırma
     print("\n2. Etiket ve özellik ayırma işlemi...")
-    Y_train = train["label"]
-    X_train = train.drop(labels=["label"], axis=1)
+    if use_cache:
+        Y_train = np.asarray(train_labels)
+        X_train = train_pixels
+        test = test_pixels
+    else:
+        Y_train = train["label"].values
+        X_train = train.drop(labels=["label"], axis=1).values
+        test = test.values
     
     print(f"   ✓ Etiket sayısı: {len(Y_train)}")
     print(f"   ✓ Özellik sayısı: {X_train.shape[1]} (784 piksel = 28x28)")
     
     # 3. Normalizasyon (0-255 aralığından 0-1 aralığına)
-    print("\n3. Normalizasyon işlemi (0-255 -> 0-1)...")
-    X_train = X_train / 255.0
-    test = test / 255.0
-    
-    print(f"   ✓ Eğitim verisi normalizasyonu tamamlandı")
-    print(f"   ✓ Test verisi normalizasyonu tamamlandı")
-    print(f"   ✓ Piksel değer aralığı: [{X_train.min().min():.3f}, {X_train.max().max():.3f}]")
+    if compact_dtypes:
+        print("\n3. Normalizasyon modelin içinde yapılacak (pikseller uint8 kalıyor)...")
+        X_train = np.asarray(X_train, dtype=np.uint8)
+        test = np.asarray(test, dtype=np.uint8)
+        
+        print(f"   ✓ Piksel veri tipi: {X_train.dtype}")
+        print(f"   ✓ Piksel değer aralığı: [{X_train.min()}, {X_train.max()}]")
+    else:
+        print("\n3. Normalizasyon işlemi (0-255 -> 0-1)...")
+        X_train = X_train / 255.0
+        test = test / 255.0
+        
+        print(f"   ✓ Eğitim verisi normalizasyonu tamamlandı")
+        print(f"   ✓ Test verisi normalizasyonu tamamlandı")
+        print(f"   ✓ Piksel değer aralığı: [{X_train.min():.3f}, {X_train.max():.3f}]")
     
     # 4. Yeniden şekillendirme (CNN için: örnek_sayısı, yükseklik, genişlik, kanal)
     print("\n4. Yeniden şekillendirme işlemi (CNN formatına dönüştürme)...")
-    X_train = X_train.values.reshape(-1, 28, 28, 1)
-    X_test = test.values.reshape(-1, 28, 28, 1)
+    X_train = X_train.reshape(-1, 28, 28, 1)
+    X_test = test.reshape(-1, 28, 28, 1)
     
     print(f"   ✓ Eğitim verisi: {X_train.shape}")
     print(f"   ✓ Test verisi: {X_test.shape}")
     
-    # 5. Etiket kodlama (One-Hot Encoding)
-    print("\n5. Etiket kodlama işlemi (One-Hot Encoding)...")
+    # 5. Etiket kodlama (One-Hot Encoding veya tamsayı sınıf numarası)
     num_classes = 10
-    Y_train = to_categorical(Y_train, num_classes=num_classes)
-    
-    print(f"   ✓ Etiketler one-hot encoding formatına dönüştürüldü")
+    if compact_dtypes:
+        print("\n5. Etiketler tamsayı sınıf numarası olarak bırakılıyor...")
+        Y_train = np.asarray(Y_train, dtype=np.int32)
+        
+        print(f"   ✓ Etiket veri tipi: {Y_train.dtype}")
+    else:
+        print("\n5. Etiket kodlama işlemi (One-Hot Encoding)...")
+        Y_train = to_categorical(Y_train, num_classes=num_classes)
+        
+        print(f"   ✓ Etiketler one-hot encoding formatına dönüştürüldü")
     print(f"   ✓ Etiket boyutu: {Y_train.shape}")
     
     # 6. Eğitim ve doğrulama seti ayırma
@@ -93,3 +302,226 @@ def load_and_preprocess_data(train_path="data/train.csv", test_path="data/test.c
     
     return X_train, X_val, Y_train, Y_val, X_test
 
+
+def load_test_data(test_path="data/test.csv", use_cache=False, cache_dir=None,
+                   compact_dtypes=False):
+    """
+    Sadece test verisini yükler (eğitim CSV'si okunmaz).
+    
+    Tahmin veya sunucu gibi eğitim gerektirmeyen çalıştırmalarda
+    load_and_preprocess_data() yerine kullanılır.
+    
+    Parametreler:
+    ------------
+    test_path : str
+        Test verisi dosya yolu
+    use_cache : bool
+        CSV yerine ikili (uint8, memmap) önbellekten yüklensin mi?
+    cache_dir : str, optional
+        Önbellek klasörü
+    compact_dtypes : bool
+        True ise uint8 (0-255), değilse float (0-1) pikseller döndürülür
+    
+    Döndürür:
+    --------
+    X_test : numpy array
+        (örnek_sayısı, 28, 28, 1) test görüntüleri
+    """
+    if use_cache:
+        pixels, _ = load_csv_cached(test_path, cache_dir)
+    else:
+        pixels = pd.read_csv(test_path).to_numpy(dtype=np.uint8)
+    X_test = pixels.reshape(-1, 28, 28, 1)
+    if not compact_dtypes:
+        X_test = X_test / 255.0
+    print(f"✓ Test verisi yüklendi: {X_test.shape}")
+    return X_test
+
+
+def to_class_ids(Y):
+    """
+    Etiketleri sınıf numaralarına dönüştürür.
+    
+    One-hot (örnek_sayısı, sınıf) etiketler için argmax alınır; zaten tamsayı
+    sınıf numarası olan (örnek_sayısı,) etiketler olduğu gibi döndürülür.
+    
+    Parametreler:
+    ------------
+    Y : numpy array
+        One-hot veya tamsayı etiketler
+    
+    Döndürür:
+    --------
+    numpy array
+        (örnek_sayısı,) boyutunda sınıf numaraları
+    """
+    Y = np.asarray(Y)
+    if Y.ndim > 1:
+        return np.argmax(Y, axis=1)
+    return Y
+
+
+def _row_hash_unit(row_ids, seed):
+    """
+    Satır numaralarını seed'e bağlı olarak [0, 1) aralığında deterministik
+    değerlere eşler (splitmix64). Aynı satır her okumada aynı değeri alır.
+    """
+    mask = (1 << 64) - 1
+    offset = np.uint64((seed * 0x9E3779B97F4A7C15) & mask)
+    z = row_ids.astype(np.uint64) + offset
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+
+def stream_csv_batches(csv_path, subset="train", batch_size=32, chunk_rows=CACHE_CHUNK_ROWS,
+                       validation_split=0.1, random_state=13, compact_dtypes=False,
+                       num_classes=10, shuffle=True, epoch=0):
+    """
+    CSV dosyasını sabit boyutlu parçalar halinde okuyup batch'ler üretir.
+    
+    Dosyanın tamamı hiçbir zaman belleğe alınmaz; bellek kullanımı dosya
+    boyutundan bağımsız olarak chunk_rows ile sınırlıdır. Eğitim/doğrulama
+    ayrımı satır numarasının hash'i ile yapılır, bu yüzden her okumada aynı
+    satırlar aynı sete düşer.
+    
+    Parametreler:
+    ------------
+    csv_path : str
+        CSV dosyası yolu
+    subset : str
+        'train', 'validation' veya 'all' (etiketsiz test dosyası için 'all')
+    batch_size : int
+        Batch boyutu
+    chunk_rows : int
+        Her seferde okunacak satır sayısı
+    validation_split : float
+        Doğrulama setine düşecek satır oranı
+    random_state : int
+        Hash tabanlı ayrım ve parça içi karıştırma için seed değeri
+    compact_dtypes : bool
+        True ise uint8 piksel ve int32 etiket, değilse float32 (0-1) piksel ve
+        one-hot etiket üretir
+    num_classes : int
+        Sınıf sayısı (one-hot kodlama için)
+    shuffle : bool
+        Her parçanın kendi içinde karıştırılıp karıştırılmayacağı
+    epoch : int
+        Karıştırma sırasını epoch'a göre değiştirmek için kullanılır
+    
+    Üretir:
+    ------
+    (X, Y) veya X : numpy arrays
+        Etiketli dosyalarda (X, Y), etiketsiz dosyalarda sadece X batch'i
+    """
+    if subset not in ("train", "validation", "all"):
+        raise ValueError(f"Geçersiz subset: {subset}")
+    
+    rng = np.random.default_rng(random_state + epoch)
+    eye = np.eye(num_classes, dtype=np.float32)
+    buffer_X, buffer_Y = None, None
+    row_offset = 0
+    
+    def _convert(pixels, labels):
+        X = pixels.reshape(-1, 28, 28, 1)
+        if not compact_dtypes:
+            X = X.astype(np.float32) / 255.0
+        if labels is None:
+            return X, None
+        Y = labels.astype(np.int32) if compact_dtypes else eye[labels]
+        return X, Y
+    
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_rows):
+        labels = chunk.pop("label").to_numpy(dtype=np.int64) if "label" in chunk.columns else None
+        pixels = chunk.to_numpy(dtype=np.uint8)
+        
+        if subset != "all":
+            row_ids = np.arange(row_offset, row_offset + len(pixels))
+            in_val = _row_hash_unit(row_ids, random_state) < validation_split
+            keep = in_val if subset == "validation" else ~in_val
+            pixels = pixels[keep]
+            labels = labels[keep] if labels is not None else None
+        row_offset += len(chunk)
+        
+        if shuffle and len(pixels) > 1:
+            order = rng.permutation(len(pixels))
+            pixels = pixels[order]
+            labels = labels[order] if labels is not None else None
+        
+        X, Y = _convert(pixels, labels)
+        if buffer_X is not None:
+            X = np.concatenate([buffer_X, X])
+            Y = np.concatenate([buffer_Y, Y]) if Y is not None else None
+        
+        full = (len(X) // batch_size) * batch_size
+        for start in range(0, full, batch_size):
+            if Y is None:
+                yield X[start:start + batch_size]
+            else:
+                yield X[start:start + batch_size], Y[start:start + batch_size]
+        buffer_X = X[full:]
+        buffer_Y = Y[full:] if Y is not None else None
+    
+    # Son eksik batch
+    if buffer_X is not None and len(buffer_X) > 0:
+        if buffer_Y is None:
+            yield buffer_X
+        else:
+            yield buffer_X, buffer_Y
+
+
+def make_streaming_dataset(csv_path, subset="train", batch_size=32, chunk_rows=CACHE_CHUNK_ROWS,
+                           validation_split=0.1, random_state=13, compact_dtypes=False,
+                           num_classes=10, shuffle=True):
+    """
+    stream_csv_batches() üzerinde tf.data.Dataset oluşturur.
+    
+    Dataset her epoch'ta dosyayı baştan okur (karıştırma sırası epoch'a göre
+    değişir) ve prefetch ile disk okuması eğitimle paralel yürür. Dönen
+    dataset doğrudan train_model(train_generator=...) veya model.fit() ile
+    kullanılabilir.
+    
+    Parametreler:
+    ------------
+    stream_csv_batches() ile aynıdır.
+    
+    Döndürür:
+    --------
+    tf.data.Dataset
+        (X, Y) veya X batch'leri üreten dataset
+    """
+    print("\n" + "="*60)
+    print(f"MODÜL 2: AKIŞ (STREAMING) VERİ KAYNAĞI ({subset})")
+    print("="*60)
+    
+    x_dtype = tf.uint8 if compact_dtypes else tf.float32
+    x_spec = tf.TensorSpec(shape=(None, 28, 28, 1), dtype=x_dtype)
+    with open(csv_path, "r") as f:
+        has_label = f.readline().split(",")[0].strip().strip('"') == "label"
+    if has_label:
+        y_spec = (tf.TensorSpec(shape=(None,), dtype=tf.int32) if compact_dtypes
+                  else tf.TensorSpec(shape=(None, num_classes), dtype=tf.float32))
+        output_signature = (x_spec, y_spec)
+    else:
+        output_signature = x_spec
+    
+    epoch_counter = {"epoch": 0}
+    
+    def _generator():
+        epoch = epoch_counter["epoch"]
+        epoch_counter["epoch"] += 1
+        return stream_csv_batches(csv_path, subset=subset, batch_size=batch_size,
+                                  chunk_rows=chunk_rows, validation_split=validation_split,
+                                  random_state=random_state, compact_dtypes=compact_dtypes,
+                                  num_classes=num_classes, shuffle=shuffle, epoch=epoch)
+    
+    dataset = tf.data.Dataset.from_generator(_generator, output_signature=output_signature)
+    dataset = dataset.prefetch(tf.data.AUTOTUNE)
+    
+    print(f"✓ Akış veri kaynağı oluşturuldu: {csv_path}")
+    print(f"  - Parça boyutu: {chunk_rows} satır")
+    print(f"  - Batch boyutu: {batch_size}")
+    print(f"  - Doğrulama oranı (hash tabanlı): {validation_split}")
+    
+    return dataset
@@ -3,20 +3,47 @@
 # ============================================================================
 
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+from modules.data_loader import to_class_ids
+from modules.plotting import submit_figure
+
+
+def _draw_class_distribution(fig, labels):
+    import seaborn as sns
+    ax = fig.subplots()
+    sns.countplot(x=labels, palette="icefire", ax=ax)
+    ax.set_title("Eğitim Verisi Sınıf Dağılımı", fontsize=16)
+    ax.set_xlabel("Rakam Sınıfı", fontsize=12)
+    ax.set_ylabel("Örnek Sayısı", fontsize=12)
+
+
+def _draw_sample_images(fig, images, labels):
+    axes = fig.subplots(2, 5)
+    fig.suptitle("Örnek Eğitim Görüntüleri", fontsize=16, fontweight='bold')
+    
+    for i in range(len(images)):
+        row = i // 5
+        col = i % 5
+        axes[row, col].imshow(images[i][:, :, 0], cmap='gray')
+        axes[row, col].set_title(f"Etiket: {labels[i]}", fontsize=12)
+        axes[row, col].axis('off')
+    
+    fig.tight_layout()
 
 
 def visualize_data(X_train, Y_train, num_samples=10):
     """
     Veri setinden örnek görüntüleri görselleştirir.
     
+    Grafikler modules.plotting ile ayarlanan moda göre gösterilir, arka
+    planda dosyaya kaydedilir veya atlanır.
+    
     Parametreler:
     ------------
     X_train : numpy array
         Eğitim görüntüleri
     Y_train : numpy array
-        Eğitim etiketleri (one-hot encoded)
+        Eğitim etiketleri (one-hot encoded veya tamsayı sınıf numarası)
     num_samples : int
         Gösterilecek örnek sayısı
     """
@@ -24,29 +51,15 @@ def visualize_data(X_train, Y_train, num_samples=10):
     print("MODÜL 3: VERİ GÖRSELLEŞTİRME")
     print("="*60)
     
+    # Arka plan thread'ine memmap yerine bağımsız kopyalar verilir
+    labels = np.array(to_class_ids(Y_train))
+    count = min(num_samples, 10)
+    
     # Etiket dağılımını görselleştirme
-    plt.figure(figsize=(15, 7))
-    labels = np.argmax(Y_train, axis=1)
-    g = sns.countplot(x=labels, palette="icefire")
-    plt.title("Eğitim Verisi Sınıf Dağılımı", fontsize=16)
-    plt.xlabel("Rakam Sınıfı", fontsize=12)
-    plt.ylabel("Örnek Sayısı", fontsize=12)
-    plt.show()
+    submit_figure('class_distribution', (15, 7), _draw_class_distribution, labels)
     
     # Örnek görüntüleri görselleştirme
-    fig, axes = plt.subplots(2, 5, figsize=(15, 6))
-    fig.suptitle("Örnek Eğitim Görüntüleri", fontsize=16, fontweight='bold')
-    
-    for i in range(min(num_samples, 10)):
-        row = i // 5
-        col = i % 5
-        axes[row, col].imshow(X_train[i][:, :, 0], cmap='gray')
-        true_label = np.argmax(Y_train[i])
-        axes[row, col].set_title(f"Etiket: {true_label}", fontsize=12)
-        axes[row, col].axis('off')
-    
-    plt.tight_layout()
-    plt.show()
+    submit_figure('sample_images', (15, 6), _draw_sample_images,
+                  np.array(X_train[:count]), labels[:count].copy())
     
     print("✓ Veri görselleştirme tamamlandı!")
-
@@ -0,0 +1,258 @@
+# ============================================================================
+# MODÜL 18: BİLGİ DAMITMA (KNOWLEDGE DISTILLATION)
+# ============================================================================
+# Eğitilmiş bir öğretmen modelin ('deep', 'semih') yumuşak hedefleriyle küçük
+# ve hızlı bir öğrenci model ('simple', 'narrow' veya bir spec dosyası)
+# train_model() üzerinden eğitilir.
+#
+# Öğretmen logit'leri (softmax çıktısının logaritması) eğitim ve doğrulama
+# setleri için bir kez hesaplanıp diske yazılır; anahtar öğretmen dosyasının
+# ve verinin SHA-256 özetidir, yani aynı öğretmen/veri ile tekrar çalıştırmada
+# öğretmen hiç çalıştırılmaz. Hedefler [sınıf numarası, öğretmen logit'leri]
+# sütunları olarak paketlenir; kayıp:
+#   alpha * CE(etiket, öğrenci) + (1 - alpha) * T² * KL(öğretmen_T || öğrenci_T)
+#
+# Önbellekteki logit'ler örnek bazında olduğundan damıtma eğitimi veri
+# artırmasız yapılır.
+# ============================================================================
+
+import os
+import time
+import hashlib
+
+import numpy as np
+
+# Log-olasılık hesabında kullanılan kırpma değeri (Keras crossentropy ile aynı)
+_EPSILON = 1e-7
+
+
+def _array_sha256(X, chunk_rows=4096):
+    """Dizinin içeriğinin SHA-256 özeti (memmap'lerde parça parça okunur)."""
+    digest = hashlib.sha256(str((X.shape, X.dtype.str)).encode())
+    for start in range(0, len(X), chunk_rows):
+        digest.update(np.ascontiguousarray(X[start:start + chunk_rows]).tobytes())
+    return digest.hexdigest()
+
+
+def cache_teacher_logits(teacher, X, cache_dir, teacher_path=None, batch_size=1024):
+    """
+    Öğretmen logit'lerini hesaplayıp diske yazar (önbellekte varsa yükler).
+
+    Parametreler:
+    ------------
+    teacher : keras.Model
+        Softmax çıkışlı öğretmen model (predict_on_batch() metoduna sahip nesne)
+    X : numpy array
+        Görüntüler
+    cache_dir : str
+        Logit dosyalarının klasörü
+    teacher_path : str, optional
+        Öğretmen checkpoint'i (önbellek anahtarına dosya özeti girer; None
+        ise ağırlıkların özeti kullanılır)
+    batch_size : int
+        Tahmin batch boyutu
+
+    Döndürür:
+    --------
+    numpy array
+        (örnek_sayısı, sınıf) float32 logit'ler (memmap)
+    """
+    from modules.data_loader import _file_sha256
+
+    if teacher_path is not None:
+        teacher_digest = _file_sha256(teacher_path)
+    else:
+        teacher_digest = hashlib.sha256(
+            b''.join(np.asarray(w).tobytes() for w in teacher.get_weights())).hexdigest()
+    path = os.path.join(cache_dir, f'{teacher_digest[:16]}_{_array_sha256(X)[:16]}.npy')
+    if os.path.exists(path):
+        print(f"✓ Öğretmen logit'leri önbellekten yüklendi: {path}")
+        return np.load(path, mmap_mode='r')
+
+    os.makedirs(cache_dir, exist_ok=True)
+    start_time = time.perf_counter()
+    tmp_path = path + '.tmp.npy'
+    logits = None
+    for start in range(0, len(X), batch_size):
+        probabilities = np.asarray(teacher.predict_on_batch(X[start:start + batch_size]), dtype=np.float32)
+        if logits is None:
+            logits = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float32,
+                                               shape=(len(X), probabilities.shape[1]))
+        logits[start:start + len(probabilities)] = np.log(np.clip(probabilities, _EPSILON, 1.0))
+    logits.flush()
+    del logits
+    os.replace(tmp_path, path)
+    print(f"✓ Öğretmen logit'leri hesaplandı ve kaydedildi: {path} "
+          f"({time.perf_counter() - start_time:.1f} sn)")
+    return np.load(path, mmap_mode='r')
+
+
+def pack_targets(Y, teacher_logits):
+    """Etiketleri ve öğretmen logit'lerini [sınıf, logit_0..logit_C] sütunlarına paketler."""
+    from modules.data_loader import to_class_ids
+
+    classes = to_class_ids(Y).astype(np.float32)[:, None]
+    return np.concatenate([classes, np.asarray(teacher_logits, dtype=np.float32)], axis=1)
+
+
+def make_distillation_loss(temperature=4.0, alpha=0.1):
+    """
+    Paketlenmiş hedefler için damıtma kaybını döndürür.
+
+    Parametreler:
+    ------------
+    temperature : float
+        Yumuşatma sıcaklığı T (büyüdükçe öğretmenin sınıflar arası
+        benzerlik bilgisi daha çok aktarılır)
+    alpha : float
+        Gerçek etiket kaybının ağırlığı (1 - alpha: öğretmen kaybı)
+    """
+    import tensorflow as tf
+
+    def distillation_loss(y_true, y_pred):
+        labels = tf.cast(y_true[:, 0], tf.int32)
+        teacher_logits = y_true[:, 1:]
+        probabilities = tf.clip_by_value(tf.cast(y_pred, tf.float32), _EPSILON, 1.0)
+        student_logits = tf.math.log(probabilities)
+        hard = tf.keras.losses.sparse_categorical_crossentropy(labels, probabilities)
+        teacher_soft = tf.nn.softmax(teacher_logits / temperature)
+        soft = tf.reduce_sum(
+            teacher_soft * (tf.math.log(teacher_soft + _EPSILON)
+                            - tf.nn.log_softmax(student_logits / temperature)), axis=-1)
+        return alpha * hard + (1.0 - alpha) * temperature ** 2 * soft
+
+    return distillation_loss
+
+
+def _packed_accuracy():
+    """Paketlenmiş hedeflerin ilk sütunundaki etikete göre accuracy metriği."""
+    import tensorflow as tf
+
+    def accuracy(y_true, y_pred):
+        predicted = tf.cast(tf.argmax(y_pred, axis=-1), tf.float32)
+        return tf.cast(tf.equal(predicted, y_true[:, 0]), tf.float32)
+
+    return tf.keras.metrics.MeanMetricWrapper(accuracy, name='accuracy')
+
+
+def distill_model(teacher_path, X_train, Y_train, X_val, Y_val, student_type='simple',
+                  epochs=10, batch_size=32, temperature=4.0, alpha=0.1, accuracy_budget=0.005,
+                  logits_dir='data/cache/teacher_logits', student_path='student_best_model.keras',
+                  input_shape=(28, 28, 1), num_classes=10, compact_dtypes=False,
+                  patience=5, reduce_lr_patience=3, prediction_batch_size=1024):
+    """
+    Öğretmen checkpoint'inden küçük bir öğrenci modeli damıtır.
+
+    Parametreler:
+    ------------
+    teacher_path : str
+        Eğitilmiş öğretmen checkpoint'i (.keras)
+    X_train, Y_train, X_val, Y_val : numpy arrays
+        Eğitim ve doğrulama verisi (etiketler one-hot veya tamsayı)
+    student_type : str veya dict
+        Öğrenci mimarisi (create_cnn_model model_type'ı; ör. 'simple', 'narrow')
+    epochs, batch_size : int
+        Eğitim ayarları
+    temperature, alpha : float
+        Damıtma kaybı ayarları (bkz. make_distillation_loss)
+    accuracy_budget : float
+        Öğretmene göre kabul edilen en fazla doğruluk kaybı (0.005 = 0.5 puan)
+    logits_dir : str
+        Öğretmen logit önbelleği klasörü
+    student_path : str
+        Öğrenci modelin kaydedileceği yol
+    input_shape, num_classes, compact_dtypes :
+        create_cnn_model() ayarları
+    patience, reduce_lr_patience : int
+        Erken durdurma ve öğrenme oranı azaltma sabrı
+    prediction_batch_size : int
+        Logit hesabı ve gecikme ölçümü batch boyutu
+
+    Döndürür:
+    --------
+    tuple
+        (öğrenci model, rapor sözlüğü)
+    """
+    from tensorflow import keras
+    from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
+    from modules.model_builder import create_cnn_model
+    from modules.model_trainer import train_model
+    from modules.model_exporter import measure_latency
+    from modules.data_loader import to_class_ids
+
+    print("\n" + "="*60)
+    print("MODÜL 18: BİLGİ DAMITMA")
+    print("="*60)
+
+    teacher = keras.models.load_model(teacher_path, compile=False)
+    print(f"✓ Öğretmen yüklendi: {teacher_path} ({teacher.count_params():,} parametre)")
+    train_logits = cache_teacher_logits(teacher, X_train, logits_dir, teacher_path, prediction_batch_size)
+    val_logits = cache_teacher_logits(teacher, X_val, logits_dir, teacher_path, prediction_batch_size)
+
+    student = create_cnn_model(input_shape, num_classes, student_type, compact_dtypes=compact_dtypes,
+                               summary=False, compile=False)
+    student.compile(optimizer='adam', loss=make_distillation_loss(temperature, alpha),
+                    metrics=[_packed_accuracy()])
+    print(f"\nÖğrenci: {student_type} ({student.count_params():,} parametre), "
+          f"T={temperature}, alpha={alpha}")
+
+    callbacks = [
+        EarlyStopping(monitor='val_loss', patience=patience, restore_best_weights=True, verbose=1),
+        ReduceLROnPlateau(monitor='val_loss', factor=0.5, patience=reduce_lr_patience,
+                          min_lr=0.00001, verbose=1),
+    ]
+    history = train_model(student, X_train, pack_targets(Y_train, train_logits),
+                          X_val, pack_targets(Y_val, val_logits),
+                          epochs=epochs, batch_size=batch_size, use_augmentation=False,
+                          callbacks=callbacks)
+
+    # Kaydedilen model özel kayıp fonksiyonuna bağlı kalmasın
+    student.compile(optimizer='adam',
+                    loss='sparse_categorical_crossentropy' if compact_dtypes else 'categorical_crossentropy',
+                    metrics=['accuracy'])
+    student.save(student_path)
+    print(f"✓ Öğrenci model kaydedildi: {student_path}")
+
+    val_classes = to_class_ids(Y_val)
+    teacher_accuracy = float(np.mean(np.argmax(val_logits, axis=1) == val_classes))
+    student_predictions = student.predict(X_val, batch_size=prediction_batch_size, verbose=0)
+    student_accuracy = float(np.mean(np.argmax(student_predictions, axis=1) == val_classes))
+    teacher_ms, teacher_single_ms = measure_latency(teacher, X_val, prediction_batch_size)
+    student_ms, student_single_ms = measure_latency(student, X_val, prediction_batch_size)
+
+    report = {
+        'teacher_path': teacher_path,
+        'student_path': student_path,
+        'student_type': student_type if isinstance(student_type, str) else 'spec',
+        'teacher_params': int(teacher.count_params()),
+        'student_params': int(student.count_params()),
+        'teacher_accuracy': teacher_accuracy,
+        'student_accuracy': student_accuracy,
+        'accuracy_drop': teacher_accuracy - student_accuracy,
+        'accuracy_budget': accuracy_budget,
+        'within_budget': teacher_accuracy - student_accuracy <= accuracy_budget,
+        'teacher_ms_per_image': teacher_ms,
+        'student_ms_per_image': student_ms,
+        'teacher_single_ms': teacher_single_ms,
+        'student_single_ms': student_single_ms,
+        'speedup': teacher_ms / student_ms,
+        'epochs_trained': len(history.history['loss']),
+    }
+
+    print("\n" + "="*60)
+    print("DAMITMA RAPORU")
+    print("="*60)
+    print(f"{'':<12}{'Parametre':>12}{'Accuracy':>10}{'ms/görüntü':>12}{'Tek görüntü':>13}")
+    print(f"{'Öğretmen':<12}{report['teacher_params']:>12,}{teacher_accuracy:>10.4f}"
+          f"{teacher_ms:>12.4f}{teacher_single_ms:>11.2f}ms")
+    print(f"{'Öğrenci':<12}{report['student_params']:>12,}{student_accuracy:>10.4f}"
+          f"{student_ms:>12.4f}{student_single_ms:>11.2f}ms")
+    print(f"  - Hızlanma (batch): {report['speedup']:.2f}x")
+    if report['within_budget']:
+        print(f"✓ Doğruluk kaybı {report['accuracy_drop']*100:.2f} puan "
+              f"(bütçe {accuracy_budget*100:.2f} puan)")
+    else:
+        print(f"✗ Doğruluk kaybı {report['accuracy_drop']*100:.2f} puan, bütçeyi "
+              f"({accuracy_budget*100:.2f} puan) aşıyor: daha geniş bir öğrenci, daha fazla "
+              f"epoch veya farklı sıcaklık deneyin")
+    return student, report
@@ -0,0 +1,305 @@
+# ============================================================================
+# MODÜL 16: ÇOK SÜREÇLİ VERİ PARALEL CPU EĞİTİMİ
+# ============================================================================
+# Küçük CNN'lerde TensorFlow'un intra-op thread'leri çok çekirdekli CPU'ları
+# iyi kullanamaz. Bu modül aynı makinede N işçi süreci başlatır ve modeli
+# MultiWorkerMirroredStrategy ile senkron veri paralel eğitir:
+#
+#   - her işçi localhost üzerinde ayrı bir porttan kümeye katılır (TF_CONFIG)
+#   - her işçi çekirdeklerin 1/N'ini kullanır (thread sınırları)
+#   - global batch = işçi başına batch x işçi sayısı; her adımda gradyanlar
+#     RING all-reduce ile toplanır
+#   - chief (işçi 0) modeli ve eğitim geçmişini kaydeder
+#
+# Eğitim verisi işçilere .npy dosyaları (memmap) üzerinden paylaştırılır.
+# İşçi süreci doğrudan da çalıştırılabilir (launch_workers() bunu yapar):
+#   TF_CONFIG=... python -m modules.distributed_trainer --data-dir ... --output-dir ...
+# ============================================================================
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import tempfile
+import subprocess
+from types import SimpleNamespace
+
+THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS',
+                   'TF_NUM_INTRAOP_THREADS', 'TF_NUM_INTEROP_THREADS')
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_ports(count):
+    """localhost üzerinde boş portlar bulur."""
+    sockets = []
+    try:
+        for _ in range(count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(('localhost', 0))
+            sockets.append(sock)
+        return [sock.getsockname()[1] for sock in sockets]
+    finally:
+        for sock in sockets:
+            sock.close()
+
+
+def launch_workers(num_workers, data_dir, output_dir, model_type='semih', epochs=3,
+                   per_worker_batch_size=32, use_augmentation=True, compact_dtypes=True,
+                   model_save_path=None, threads_per_worker=None, seed=13):
+    """
+    Localhost üzerinde num_workers işçi süreci başlatır ve eğitimin bitmesini bekler.
+
+    Parametreler:
+    ------------
+    num_workers : int
+        İşçi süreci sayısı
+    data_dir : str
+        X_train/Y_train/X_val/Y_val .npy dosyalarının klasörü
+    output_dir : str
+        İşçi logları ve chief'in sonuç dosyasının (result.json) klasörü
+    model_type : str
+        create_cnn_model() model tipi
+    epochs : int
+        Epoch sayısı
+    per_worker_batch_size : int
+        İşçi başına batch boyutu (global batch = bu değer x num_workers)
+    use_augmentation : bool
+        tf.data veri artırma kullanılsın mı?
+    compact_dtypes : bool
+        uint8 piksel / tamsayı etiket kullanılsın mı?
+    model_save_path : str, optional
+        Chief'in eğitilen modeli kaydedeceği yol (None ise output_dir/model.keras)
+    threads_per_worker : int, optional
+        İşçi başına CPU thread sayısı (None ise çekirdekler işçilere bölünür)
+    seed : int
+        Karıştırma ve veri artırma seed değeri (tüm işçilerde aynı olmalıdır)
+
+    Döndürür:
+    --------
+    dict
+        Chief'in sonuçları (history, epoch süreleri, throughput)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // num_workers)
+    model_save_path = os.path.abspath(model_save_path or os.path.join(output_dir, 'model.keras'))
+    cluster = {'worker': [f'localhost:{port}' for port in _free_ports(num_workers)]}
+
+    command = [sys.executable, '-m', 'modules.distributed_trainer',
+               '--data-dir', os.path.abspath(data_dir),
+               '--output-dir', os.path.abspath(output_dir),
+               '--model-type', model_type,
+               '--epochs', str(epochs),
+               '--per-worker-batch-size', str(per_worker_batch_size),
+               '--model-save-path', model_save_path,
+               '--seed', str(seed)]
+    if use_augmentation:
+        command.append('--augment')
+    if compact_dtypes:
+        command.append('--compact-dtypes')
+
+    processes = []
+    logs = []
+    for index in range(num_workers):
+        env = dict(os.environ)
+        env['TF_CONFIG'] = json.dumps({'cluster': cluster,
+                                       'task': {'type': 'worker', 'index': index}})
+        for name in THREAD_ENV_VARS:
+            env[name] = str(threads_per_worker)
+        env['CUDA_VISIBLE_DEVICES'] = ''
+        env.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+        if index == 0:
+            # Chief'in çıktısı konsolda görünür, diğer işçiler log dosyasına yazar
+            log = None
+        else:
+            log = open(os.path.join(output_dir, f'worker_{index}.log'), 'w')
+            logs.append(log)
+        processes.append(subprocess.Popen(command, env=env, cwd=PROJECT_ROOT,
+                                          stdout=log, stderr=subprocess.STDOUT if log else None))
+
+    failed = None
+    try:
+        while failed is None and any(process.poll() is None for process in processes):
+            time.sleep(0.5)
+            for index, process in enumerate(processes):
+                if process.poll() not in (None, 0):
+                    failed = index
+                    break
+        if failed is None:
+            failed = next((index for index, process in enumerate(processes)
+                           if process.returncode != 0), None)
+    finally:
+        # Bir işçi düşerse diğerleri all-reduce'ta sonsuza kadar bekler
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+                process.wait()
+        for log in logs:
+            log.close()
+    if failed is not None:
+        raise RuntimeError(f"İşçi {failed} hata ile sonlandı "
+                           f"(loglar: {os.path.abspath(output_dir)})")
+
+    with open(os.path.join(output_dir, 'result.json')) as f:
+        return json.load(f)
+
+
+def train_distributed(X_train, Y_train, X_val, Y_val, num_workers, model_type='semih',
+                      epochs=3, per_worker_batch_size=32, use_augmentation=True,
+                      compact_dtypes=True, model_save_path='best_model.keras', seed=13):
+    """
+    Bellekteki veriyle çok süreçli veri paralel eğitim yapar.
+
+    train_model() ile aynı şekilde kullanılabilir: eğitilen modeli ve
+    history.history özelliğine sahip bir nesne döndürür.
+
+    Döndürür:
+    --------
+    model, history : keras.Model, SimpleNamespace
+    """
+    import numpy as np
+    from tensorflow import keras
+
+    print("\n" + "="*60)
+    print("MODÜL 16: ÇOK SÜREÇLİ VERİ PARALEL EĞİTİM")
+    print("="*60)
+    print(f"  - İşçi sayısı: {num_workers}")
+    print(f"  - Global batch: {per_worker_batch_size} x {num_workers} = "
+          f"{per_worker_batch_size * num_workers}")
+
+    with tempfile.TemporaryDirectory(prefix='distributed_') as work_dir:
+        data_dir = os.path.join(work_dir, 'data')
+        os.makedirs(data_dir)
+        for name, array in (('X_train', X_train), ('Y_train', Y_train),
+                            ('X_val', X_val), ('Y_val', Y_val)):
+            np.save(os.path.join(data_dir, f'{name}.npy'), array)
+        result = launch_workers(num_workers, data_dir, work_dir, model_type, epochs,
+                                per_worker_batch_size, use_augmentation, compact_dtypes,
+                                model_save_path=model_save_path, seed=seed)
+
+    model = keras.models.load_model(model_save_path)
+    print(f"✓ Dağıtık eğitim tamamlandı: {result['images_per_second']:.0f} görüntü/s, "
+          f"epoch ortalaması {result['epoch_seconds_mean']:.2f} s")
+    return model, SimpleNamespace(history=result['history'])
+
+
+def run_worker(data_dir, output_dir, model_type, epochs, per_worker_batch_size,
+               use_augmentation, compact_dtypes, model_save_path, seed=13):
+    """
+    Tek bir işçi sürecini çalıştırır (TF_CONFIG ortam değişkeni gereklidir).
+    """
+    import numpy as np
+    import tensorflow as tf
+    import config
+    from modules.model_builder import create_cnn_model
+    from modules.callbacks import create_callbacks
+    from modules.model_trainer import train_model
+    from modules.data_augmentation_module import create_tf_dataset
+
+    threads = int(os.environ.get('TF_NUM_INTRAOP_THREADS', 0))
+    if threads:
+        tf.config.threading.set_intra_op_parallelism_threads(threads)
+        tf.config.threading.set_inter_op_parallelism_threads(min(2, threads))
+
+    task = json.loads(os.environ['TF_CONFIG'])['task']
+    is_chief = task['index'] == 0
+    communication = tf.distribute.experimental.CommunicationOptions(
+        implementation=tf.distribute.experimental.CommunicationImplementation.RING)
+    strategy = tf.distribute.MultiWorkerMirroredStrategy(communication_options=communication)
+    global_batch_size = per_worker_batch_size * strategy.num_replicas_in_sync
+
+    data = {name: np.load(os.path.join(data_dir, f'{name}.npy'), mmap_mode='r')
+            for name in ('X_train', 'Y_train', 'X_val', 'Y_val')}
+    steps_per_epoch = len(data['X_train']) // global_batch_size
+
+    # Tüm işçiler aynı seed ile aynı sırayı üretir; DATA politikası her
+    # işçiye global batch'lerin farklı bir parçasını verir
+    options = tf.data.Options()
+    options.experimental_distribute.auto_shard_policy = tf.data.experimental.AutoShardPolicy.DATA
+    train_dataset = create_tf_dataset(
+        data['X_train'], data['Y_train'], global_batch_size,
+        rotation_range=config.ROTATION_RANGE,
+        width_shift_range=config.WIDTH_SHIFT_RANGE,
+        height_shift_range=config.HEIGHT_SHIFT_RANGE,
+        zoom_range=config.ZOOM_RANGE,
+        augment=use_augmentation,
+        seed=seed
+    ).repeat().with_options(options)
+    val_dataset = tf.data.Dataset.from_tensor_slices((data['X_val'], data['Y_val'])) \
+        .batch(global_batch_size).with_options(options)
+
+    with strategy.scope():
+        model = create_cnn_model(config.INPUT_SHAPE, config.NUM_CLASSES, model_type,
+                                 compact_dtypes=compact_dtypes)
+
+    # Checkpoint'i sadece chief asıl yola yazar; diğer işçiler geçici yola yazar
+    save_path = model_save_path if is_chief else os.path.join(
+        output_dir, f"worker_{task['index']}", os.path.basename(model_save_path))
+    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    
+    class EpochTimer(tf.keras.callbacks.Callback):
+        def on_epoch_begin(self, epoch, logs=None):
+            self._start = time.perf_counter()
+        
+        def on_epoch_end(self, epoch, logs=None):
+            epoch_times.append(time.perf_counter() - self._start)
+    
+    epoch_times = []
+    timer = EpochTimer()
+    callbacks = create_callbacks(
+        patience=config.EARLY_STOPPING_PATIENCE,
+        reduce_lr_patience=config.REDUCE_LR_PATIENCE,
+        model_save_path=save_path
+    ) + [timer]
+
+    history = train_model(
+        model, data['X_train'], data['Y_train'], val_dataset, None,
+        train_generator=train_dataset,
+        epochs=epochs,
+        steps_per_epoch=steps_per_epoch,
+        batch_size=global_batch_size,
+        use_augmentation=use_augmentation,
+        callbacks=callbacks,
+        verbose=1 if is_chief else 0
+    )
+    # Son epoch ağırlıkları ayrı dosyaya yazılır; save_path chief'te ModelCheckpoint'in
+    # en iyi modelidir ve train_distributed() değerlendirme için onu yükler
+    # (kayıt tüm işçilerin katıldığı bir işlem olduğundan her işçi kendi yoluna yazar)
+    last_path = os.path.join(output_dir, f"worker_{task['index']}", 'last_model.keras')
+    os.makedirs(os.path.dirname(last_path), exist_ok=True)
+    model.save(last_path)
+
+    if is_chief:
+        # İlk epoch graph oluşturma süresini içerdiğinden throughput sonraki epoch'lardan hesaplanır
+        steady = epoch_times[1:] or epoch_times
+        epoch_mean = sum(steady) / len(steady)
+        result = {
+            'num_workers': strategy.num_replicas_in_sync,
+            'per_worker_batch_size': per_worker_batch_size,
+            'global_batch_size': global_batch_size,
+            'steps_per_epoch': steps_per_epoch,
+            'epoch_seconds': epoch_times,
+            'epoch_seconds_mean': epoch_mean,
+            'images_per_second': steps_per_epoch * global_batch_size / epoch_mean,
+            'history': {key: [float(v) for v in values] for key, values in history.history.items()},
+        }
+        with open(os.path.join(output_dir, 'result.json'), 'w') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MultiWorkerMirroredStrategy işçi süreci")
+    parser.add_argument("--data-dir", required=True)
+    parser.add_argument("--output-dir", required=True)
+    parser.add_argument("--model-type", default='semih')
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--per-worker-batch-size", type=int, default=32)
+    parser.add_argument("--model-save-path", required=True)
+    parser.add_argument("--augment", action="store_true")
+    parser.add_argument("--compact-dtypes", action="store_true")
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+    run_worker(args.data_dir, args.output_dir, args.model_type, args.epochs,
+               args.per_worker_batch_size, args.augment, args.compact_dtypes,
+               args.model_save_path, args.seed)
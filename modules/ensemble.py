@@ -0,0 +1,213 @@
+# ============================================================================
+# MODÜL 17: ENSEMBLE TAHMİN MOTORU
+# ============================================================================
+# Birden fazla checkpoint'in (ör. 'standard', 'deep', 'semih') softmax
+# çıktıları ağırlıklı ortalamayla birleştirilir. Her batch tek geçişte
+# işlenir; modeller ayrı ayrı X_test üzerinden geçmez.
+#   'fused'   : tüm modeller tek bir tf.function graph'ında çağrılır, ağırlıklı
+#               ortalama graph içinde alınır (TF bağımsız dalları inter-op
+#               thread'lerinde paralel çalıştırır)
+#   'threads' : her model kendi thread'inde predict_on_batch çalıştırır
+#               (TFLitePredictor gibi Keras dışı modeller için de geçerli)
+#
+# EnsemblePredictor predict/predict_on_batch sağladığı için make_predictions,
+# stream_predictions, evaluate_model ve TTAPredictor ile doğrudan kullanılır.
+# ============================================================================
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+ENSEMBLE_MODES = ('fused', 'threads')
+
+
+def load_ensemble_members(paths, num_threads=4):
+    """
+    Checkpoint'leri yükler (.tflite dosyaları TFLitePredictor ile).
+
+    Döndürür:
+    --------
+    list
+        predict_on_batch() metoduna sahip modeller
+    """
+    members = []
+    for path in paths:
+        if path.endswith('.tflite'):
+            from modules.model_exporter import TFLitePredictor
+            members.append(TFLitePredictor(path, num_threads=num_threads))
+        else:
+            from tensorflow import keras
+            members.append(keras.models.load_model(path, compile=False))
+        print(f"  - Yüklendi: {path}")
+    return members
+
+
+class EnsemblePredictor:
+    """
+    Birden fazla modelin olasılıklarını ağırlıklı ortalamayla birleştirir.
+
+    Parametreler:
+    ------------
+    members : list
+        Keras modelleri, predict_on_batch() metoduna sahip nesneler veya
+        checkpoint yolları (aynı giriş formatını beklemeliler)
+    weights : list of float, optional
+        Model ağırlıkları (toplamı 1 olacak şekilde normalize edilir; None ise eşit)
+    mode : str
+        'fused' (tek graph) veya 'threads' (thread havuzu)
+    batch_size : int
+        predict() çağrısında kullanılacak batch boyutu
+    """
+
+    def __init__(self, members, weights=None, mode='fused', batch_size=1024):
+        if mode not in ENSEMBLE_MODES:
+            raise ValueError(f"Geçersiz ensemble modu: {mode} (seçenekler: {', '.join(ENSEMBLE_MODES)})")
+        if any(isinstance(member, str) for member in members):
+            members = load_ensemble_members(members)
+        if not members:
+            raise ValueError("Ensemble için en az bir model gerekli")
+        weights = np.ones(len(members)) if weights is None else np.asarray(weights, dtype=np.float64)
+        if len(weights) != len(members) or np.any(weights < 0) or weights.sum() <= 0:
+            raise ValueError(f"Geçersiz ensemble ağırlıkları: {list(weights)}")
+
+        self.members = list(members)
+        self.weights = (weights / weights.sum()).astype(np.float32)
+        self.mode = mode
+        # TFLite üyeleri sabit batch boyutuyla çalışır; ensemble batch'i onu aşmamalı
+        fixed = [member.batch_size for member in self.members if hasattr(member, 'interpreter')]
+        self.batch_size = min(fixed) if fixed else None
+        self._predict_batch_size = min(fixed + [batch_size])
+        self._executor = None
+        self._fused = None
+        self._warm = False
+
+        if mode == 'fused':
+            if fixed:
+                raise ValueError("'fused' modu sadece Keras modelleriyle çalışır ('threads' kullanın)")
+            self._fused = self._build_fused()
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=len(self.members),
+                                                thread_name_prefix='ensemble')
+
+    def _build_fused(self):
+        import tensorflow as tf
+
+        members = self.members
+        weights = [float(w) for w in self.weights]
+
+        @tf.function(reduce_retracing=True)
+        def fused(batch):
+            outputs = [tf.cast(member(batch, training=False), tf.float32) for member in members]
+            return tf.add_n([w * output for w, output in zip(weights, outputs)])
+
+        return fused
+
+    def predict_on_batch(self, batch):
+        """Batch için ağırlıklı ortalama olasılıkları döndürür."""
+        if self.batch_size is not None and len(batch) > self.batch_size:
+            # TFLite üyelerinin sabit batch boyutu aşılmasın (ör. akış modundaki 1024'lük batch'ler)
+            return np.concatenate([self.predict_on_batch(batch[start:start + self.batch_size])
+                                   for start in range(0, len(batch), self.batch_size)])
+        if self._fused is not None:
+            return self._fused(np.asarray(batch)).numpy()
+        if not self._warm:
+            # İlk çağrıda her modelin predict fonksiyonu sırayla oluşturulur
+            # (Keras'ın tembel graph kurulumu thread'ler arasında yarışmasın)
+            outputs = [np.asarray(member.predict_on_batch(batch), dtype=np.float32)
+                       for member in self.members]
+            self._warm = True
+        else:
+            futures = [self._executor.submit(member.predict_on_batch, batch) for member in self.members]
+            outputs = [np.asarray(future.result(), dtype=np.float32) for future in futures]
+        return np.tensordot(self.weights, np.stack(outputs), axes=1)
+
+    def predict(self, X, batch_size=None, verbose=0):
+        """Keras model.predict() ile aynı şekilde tüm diziyi tahmin eder."""
+        size = min(batch_size or self._predict_batch_size, self._predict_batch_size)
+        return np.concatenate([self.predict_on_batch(X[start:start + size])
+                               for start in range(0, len(X), size)])
+
+    def close(self):
+        """Thread havuzunu kapatır."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def _sequential_predict(members, weights, X, batch_size):
+    """Bugünkü yaklaşım: her model X üzerinden ayrı bir geçiş yapar, sonra ortalanır."""
+    total = None
+    for member, weight in zip(members, weights):
+        probabilities = np.concatenate([np.asarray(member.predict_on_batch(X[start:start + batch_size]))
+                                        for start in range(0, len(X), batch_size)])
+        total = weight * probabilities if total is None else total + weight * probabilities
+    return total
+
+
+def compare_ensemble_latency(members, X, weights=None, batch_size=256, repeats=3, Y=None):
+    """
+    Sıralı (model başına ayrı geçiş), 'fused' ve 'threads' ensemble gecikmesini karşılaştırır.
+
+    Parametreler:
+    ------------
+    members : list
+        Keras modelleri
+    X : numpy array
+        Ölçümde kullanılacak görüntüler
+    weights : list of float, optional
+        Model ağırlıkları
+    batch_size : int
+        Tahmin batch boyutu
+    repeats : int
+        Ölçüm tekrarı (en iyisi alınır)
+    Y : numpy array, optional
+        Etiketler verilirse her yöntemin doğruluğu da raporlanır
+
+    Döndürür:
+    --------
+    dict
+        Yöntem adı -> {'seconds', 'ms_per_image', 'speedup', 'max_abs_diff', 'accuracy'}
+    """
+    from modules.data_loader import to_class_ids
+
+    print("\n" + "="*60)
+    print(f"MODÜL 17: ENSEMBLE GECİKME KARŞILAŞTIRMASI ({len(members)} model)")
+    print("="*60)
+
+    ensembles = {mode: EnsemblePredictor(members, weights, mode, batch_size) for mode in ENSEMBLE_MODES}
+    normalized = ensembles['fused'].weights
+    methods = {
+        'sequential': lambda data: _sequential_predict(members, normalized, data, batch_size),
+        **{mode: (lambda data, e=ensemble: e.predict(data, batch_size)) for mode, ensemble in ensembles.items()},
+    }
+
+    results = {}
+    reference = None
+    for name, predict_fn in methods.items():
+        predict_fn(X[:batch_size])  # Isınma (graph izleme)
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            probabilities = predict_fn(X)
+            best = min(best, time.perf_counter() - start)
+        if reference is None:
+            reference = probabilities
+        results[name] = {
+            'seconds': best,
+            'ms_per_image': best / len(X) * 1000.0,
+            'max_abs_diff': float(np.max(np.abs(probabilities - reference))),
+            'accuracy': (float(np.mean(np.argmax(probabilities, axis=1) == to_class_ids(Y)))
+                         if Y is not None else None),
+        }
+    for ensemble in ensembles.values():
+        ensemble.close()
+    for result in results.values():
+        result['speedup'] = results['sequential']['seconds'] / result['seconds']
+
+    print(f"{'Yöntem':<12}{'Süre':>10}{'ms/görüntü':>12}{'Hızlanma':>10}{'Fark':>10}"
+          + (f"{'Accuracy':>10}" if Y is not None else ""))
+    for name, r in results.items():
+        print(f"{name:<12}{r['seconds']:>9.3f}s{r['ms_per_image']:>12.4f}{r['speedup']:>9.2f}x"
+              f"{r['max_abs_diff']:>10.1e}" + (f"{r['accuracy']:>10.4f}" if Y is not None else ""))
+    return results
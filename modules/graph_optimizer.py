@@ -0,0 +1,389 @@
+# ============================================================================
+# MODÜL 19: ÇIKARIM GRAPH'I OPTİMİZASYONU (BN KATLAMA, DROPOUT, BUDAMA)
+# ============================================================================
+# Eğitilmiş bir Sequential modelden sunum için daha ince bir model üretir:
+#   1. Dropout katmanları çıkarılır (çıkarımda zaten birim fonksiyondur)
+#   2. BatchNormalization kanal bazında bir afin dönüşümdür (a * x + b).
+#      Önceki Conv2D/Dense aktivasyonsuzsa ağırlıklarına, değilse (bu
+#      repodaki modellerde BN ReLU'dan sonra gelir) araya giren
+#      MaxPooling2D (a > 0 iken), Dropout ve Flatten üzerinden bir sonraki
+#      Conv2D/Dense'in ağırlıklarına katlanır. Katlanamayan durumda eşdeğer
+#      tek bir BN katmanı bırakılır.
+#   3. İsteğe bağlı budama: 'magnitude' (katman başına en küçük |w|'ler
+#      sıfırlanır, ince ayar boyunca maske korunur) veya 'channel' (L1 normu
+#      en küçük filtre/nöronlar ve sonraki katmandaki karşılık gelen girişler
+#      tamamen çıkarılır) + kısa ince ayar.
+#
+# Sonuç modelin X_val doğruluğu orijinalle karşılaştırılır; FLOPs, parametre
+# sayısı ve gecikme önce/sonra raporlanır.
+# ============================================================================
+
+import math
+
+import numpy as np
+
+PRUNING_METHODS = ('none', 'magnitude', 'channel')
+_LINEAR_LAYERS = ('Conv2D', 'Dense')
+_DROPOUT_LAYERS = ('Dropout', 'SpatialDropout2D', 'GaussianDropout', 'GaussianNoise', 'AlphaDropout')
+
+
+def _shape(tensor):
+    return tuple(tensor.shape[1:])
+
+
+def _affine_of(layer):
+    """BatchNormalization katmanının (a, b) çarpan ve kaymasını döndürür."""
+    config = layer.get_config()
+    weights = [np.asarray(w, dtype=np.float64) for w in layer.get_weights()]
+    gamma = weights.pop(0) if config.get('scale', True) else 1.0
+    beta = weights.pop(0) if config.get('center', True) else 0.0
+    mean, variance = weights
+    a = gamma / np.sqrt(variance + config['epsilon'])
+    return a, beta - mean * a
+
+
+def _affine_layer_entry(a, b, channels, name):
+    """Katlanamayan afin dönüşümü tek bir BatchNormalization katmanı olarak ifade eder."""
+    from tensorflow.keras import layers
+
+    epsilon = 1e-3
+    config = layers.BatchNormalization(epsilon=epsilon, name=name).get_config()
+    weights = [np.broadcast_to(a, (channels,)).astype(np.float32),
+               np.broadcast_to(b, (channels,)).astype(np.float32),
+               np.zeros(channels, np.float32),
+               np.full(channels, 1.0 - epsilon, np.float32)]
+    return [layers.BatchNormalization, config, weights]
+
+
+def _fold_into_next(entry, a, b):
+    """Girişine a * x + b uygulanan Conv2D/Dense'in ağırlıklarını bu dönüşümü içerecek şekilde günceller."""
+    layer_class, config, weights = entry
+    kernel = np.asarray(weights[0], dtype=np.float64)
+    bias = np.asarray(weights[1], dtype=np.float64) if config.get('use_bias', True) else np.zeros(kernel.shape[-1])
+    channels = kernel.shape[-2]
+    a = np.broadcast_to(a, (channels,))
+    b = np.broadcast_to(b, (channels,))
+    if kernel.ndim == 4:
+        bias = bias + np.einsum('hwio,i->o', kernel, b)
+        kernel = kernel * a[None, None, :, None]
+    else:
+        bias = bias + b @ kernel
+        kernel = kernel * a[:, None]
+    config = dict(config, use_bias=True)
+    return [layer_class, config, [kernel.astype(np.float32), bias.astype(np.float32)]]
+
+
+def _fold_into_previous(entry, a, b):
+    """Aktivasyonsuz Conv2D/Dense'in çıkışına uygulanan a * x + b'yi ağırlıklarına katlar."""
+    layer_class, config, weights = entry
+    kernel = np.asarray(weights[0], dtype=np.float64)
+    bias = np.asarray(weights[1], dtype=np.float64) if config.get('use_bias', True) else np.zeros(kernel.shape[-1])
+    config = dict(config, use_bias=True)
+    return [layer_class, config, [(kernel * a).astype(np.float32), (bias * a + b).astype(np.float32)]]
+
+
+def fold_model_plan(model):
+    """
+    Modeli Dropout'suz, BN'leri katlanmış bir katman planına dönüştürür.
+
+    Döndürür:
+    --------
+    tuple
+        (plan, istatistik) - plan: [katman_sınıfı, config, ağırlıklar] listesi
+    """
+    plan = []
+    pending = None              # Henüz katlanmamış (a, b) afin dönüşümü
+    previous_linear = False     # Planın son elemanı aktivasyonsuz Conv2D/Dense mi?
+    stats = {'dropout_removed': 0, 'folded': 0, 'kept_affine': 0}
+
+    def materialize(layer):
+        nonlocal pending
+        stats['kept_affine'] += 1
+        plan.append(_affine_layer_entry(pending[0], pending[1], _shape(layer.input)[-1],
+                                        f'folded_affine_{len(plan)}'))
+        pending = None
+
+    for layer in model.layers:
+        kind = layer.__class__.__name__
+        if kind in _DROPOUT_LAYERS:
+            stats['dropout_removed'] += 1
+            continue
+
+        if kind == 'BatchNormalization':
+            if layer.get_config().get('axis', -1) not in (-1, [-1], [3], 3):
+                raise ValueError(f"Sadece son eksende BatchNormalization katlanabilir: {layer.name}")
+            a, b = _affine_of(layer)
+            if pending is None and previous_linear:
+                plan[-1] = _fold_into_previous(plan[-1], a, b)
+                stats['folded'] += 1
+            else:
+                pending = (a, b) if pending is None else (pending[0] * a, pending[1] * a + b)
+            continue
+
+        entry = [layer.__class__, layer.get_config(), layer.get_weights()]
+        if pending is not None:
+            if kind == 'MaxPooling2D' and np.all(np.asarray(pending[0]) > 0):
+                pass    # max(a * x + b) = a * max(x) + b (a > 0)
+            elif kind == 'Flatten':
+                height_width = int(np.prod(_shape(layer.input)[:-1]))
+                channels = _shape(layer.input)[-1]
+                pending = tuple(np.tile(np.broadcast_to(v, (channels,)), height_width) for v in pending)
+            elif kind in _LINEAR_LAYERS and not (
+                    kind == 'Conv2D' and entry[1].get('padding') != 'valid' and np.any(pending[1] != 0)):
+                # 'same' dolgusunda sınırdaki sıfırlar kaymayı almaz; o durumda katlanmaz
+                entry = _fold_into_next(entry, *pending)
+                stats['folded'] += 1
+                pending = None
+            else:
+                materialize(layer)
+        plan.append(entry)
+        previous_linear = kind in _LINEAR_LAYERS and entry[1].get('activation') == 'linear'
+
+    if pending is not None:
+        channels = _shape(model.layers[-1].output)[-1]
+        plan.append(_affine_layer_entry(pending[0], pending[1], channels, f'folded_affine_{len(plan)}'))
+        stats['kept_affine'] += 1
+    return plan, stats
+
+
+def build_from_plan(plan, input_shape):
+    """Katman planından Sequential model kurar ve ağırlıkları yükler."""
+    from tensorflow.keras import layers, models
+
+    model = models.Sequential()
+    model.add(layers.Input(shape=input_shape))
+    for layer_class, config, _ in plan:
+        model.add(layer_class.from_config(config))
+    for layer, (_, _, weights) in zip(model.layers, plan):
+        if weights:
+            layer.set_weights(weights)
+    return model
+
+
+def prune_channels(plan, sparsity):
+    """
+    Çıkış katmanı hariç her Conv2D/Dense'in L1 normu en küçük filtre/nöronlarını
+    ve sonraki linear katmandaki karşılık gelen girişleri plandan çıkarır.
+
+    Döndürür:
+    --------
+    list
+        Budanmış plan
+    """
+    plan = [[cls, dict(config), list(weights)] for cls, config, weights in plan]
+    linear = [i for i, (cls, _, _) in enumerate(plan) if cls.__name__ in _LINEAR_LAYERS]
+    for index, next_index in zip(linear, linear[1:]):
+        between = [plan[j][0].__name__ for j in range(index + 1, next_index)]
+        if any(kind not in ('MaxPooling2D', 'Flatten', 'BatchNormalization', 'Activation', 'ReLU')
+               for kind in between):
+            continue
+        _, config, weights = plan[index]
+        kernel = weights[0]
+        channels = kernel.shape[-1]
+        keep_count = max(1, math.ceil(channels * (1.0 - sparsity)))
+        if keep_count >= channels:
+            continue
+        norms = np.abs(kernel).reshape(-1, channels).sum(axis=0)
+        keep = np.sort(np.argsort(norms)[::-1][:keep_count])
+
+        config[('filters' if kernel.ndim == 4 else 'units')] = keep_count
+        plan[index][2] = [w[..., keep] for w in weights]
+        for j in range(index + 1, next_index):
+            if plan[j][0].__name__ == 'BatchNormalization':
+                plan[j][2] = [w[keep] for w in plan[j][2]]
+
+        next_weights = plan[next_index][2]
+        next_kernel = next_weights[0]
+        if next_kernel.ndim == 4:
+            next_kernel = next_kernel[:, :, keep, :]
+        else:
+            # Flatten'dan sonra satırlar (konum, kanal) sırasındadır
+            positions = next_kernel.shape[0] // channels
+            rows = (np.arange(positions)[:, None] * channels + keep[None, :]).ravel()
+            next_kernel = next_kernel[rows]
+        plan[next_index][2] = [next_kernel] + list(next_weights[1:])
+    return plan
+
+
+def _magnitude_masks(model, sparsity):
+    """Çıkış katmanı hariç Conv2D/Dense çekirdeklerinde en küçük |w|'leri sıfırlayan maskeler."""
+    linear = [layer for layer in model.layers if layer.__class__.__name__ in _LINEAR_LAYERS]
+    masks = {}
+    for layer in linear[:-1]:
+        kernel = np.asarray(layer.get_weights()[0])
+        threshold = np.quantile(np.abs(kernel), sparsity)
+        masks[layer.name] = (np.abs(kernel) > threshold).astype(kernel.dtype)
+    return masks
+
+
+def _apply_masks(model, masks):
+    for layer in model.layers:
+        if layer.name in masks:
+            kernel = layer.kernel
+            kernel.assign(np.asarray(kernel) * masks[layer.name])
+
+
+def count_flops(model):
+    """
+    Tek görüntü için çarpma-toplama işlemlerinden FLOPs (2 x MAC) ve parametre sayılarını hesaplar.
+
+    Parametreler:
+    ------------
+    model : keras.Model
+        Sequential model ('magnitude' budamada sıfırlanan ağırlıklar efektif
+        FLOPs'a dahil edilmez)
+
+    Döndürür:
+    --------
+    dict
+        flops, params, nonzero_params
+    """
+    flops = 0
+    for layer in model.layers:
+        kind = layer.__class__.__name__
+        output_shape = _shape(layer.output)
+        outputs = int(np.prod(output_shape))
+        if kind in _LINEAR_LAYERS:
+            kernel = np.asarray(layer.get_weights()[0])
+            nonzero = int(np.count_nonzero(kernel))
+            positions = outputs // kernel.shape[-1]    # Conv2D: çıkış konumu sayısı, Dense: 1
+            flops += 2 * nonzero * positions + (outputs if len(layer.get_weights()) > 1 else 0)
+        elif kind in ('BatchNormalization', 'Rescaling'):
+            flops += 2 * outputs
+        elif kind == 'MaxPooling2D':
+            pool = layer.get_config()['pool_size']
+            flops += outputs * int(np.prod(pool))
+        elif kind in ('Activation', 'ReLU'):
+            flops += outputs
+        if kind in _LINEAR_LAYERS and layer.get_config().get('activation') not in (None, 'linear'):
+            flops += outputs
+    params = int(model.count_params())
+    nonzero_params = int(sum(np.count_nonzero(w) for w in model.get_weights()))
+    return {'flops': int(flops), 'params': params, 'nonzero_params': nonzero_params}
+
+
+def _predict(model, X, batch_size):
+    return np.concatenate([np.asarray(model.predict_on_batch(X[start:start + batch_size]))
+                           for start in range(0, len(X), batch_size)])
+
+
+def optimize_for_inference(model, X_val, Y_val, pruning='none', sparsity=0.5,
+                           X_train=None, Y_train=None, fine_tune_epochs=1, batch_size=32,
+                           learning_rate=1e-4, prediction_batch_size=1024, output_path=None):
+    """
+    Eğitilmiş modeli sunum için inceltir ve önce/sonra raporu üretir.
+
+    Parametreler:
+    ------------
+    model : keras.Model
+        Eğitilmiş Sequential model
+    X_val, Y_val : numpy arrays
+        Doğruluk karşılaştırması ve gecikme ölçümü için doğrulama verisi
+    pruning : str
+        'none', 'magnitude' veya 'channel'
+    sparsity : float
+        Budanacak ağırlık ('magnitude') veya filtre/nöron ('channel') oranı
+    X_train, Y_train : numpy arrays, optional
+        Budamadan sonraki ince ayar verisi (None ise ince ayar yapılmaz)
+    fine_tune_epochs : int
+        İnce ayar epoch sayısı
+    batch_size : int
+        İnce ayar batch boyutu
+    learning_rate : float
+        İnce ayar öğrenme oranı
+    prediction_batch_size : int
+        Doğruluk ve gecikme ölçümünde batch boyutu
+    output_path : str, optional
+        Optimize edilmiş modelin kaydedileceği yol
+
+    Döndürür:
+    --------
+    tuple
+        (optimize edilmiş model, rapor sözlüğü)
+    """
+    from tensorflow import keras
+    from modules.data_loader import to_class_ids
+    from modules.model_trainer import train_model
+    from modules.model_exporter import measure_latency
+
+    if pruning not in PRUNING_METHODS:
+        raise ValueError(f"Geçersiz budama yöntemi: {pruning} (seçenekler: {', '.join(PRUNING_METHODS)})")
+    if not isinstance(model, keras.Sequential):
+        raise ValueError("Sadece Sequential modeller optimize edilebilir")
+
+    print("\n" + "="*60)
+    print("MODÜL 19: ÇIKARIM GRAPH'I OPTİMİZASYONU")
+    print("="*60)
+
+    plan, stats = fold_model_plan(model)
+    print(f"✓ {stats['dropout_removed']} Dropout çıkarıldı, {stats['folded']} BatchNormalization katlandı"
+          + (f", {stats['kept_affine']} afin katman kaldı" if stats['kept_affine'] else ""))
+    if pruning == 'channel':
+        plan = prune_channels(plan, sparsity)
+        print(f"✓ Kanal budama: filtre/nöronların %{sparsity * 100:.0f}'i çıkarıldı")
+    optimized = build_from_plan(plan, model.input_shape[1:])
+
+    masks = None
+    if pruning == 'magnitude':
+        masks = _magnitude_masks(optimized, sparsity)
+        _apply_masks(optimized, masks)
+        print(f"✓ Büyüklük budama: ağırlıkların %{sparsity * 100:.0f}'i sıfırlandı")
+
+    fine_tuned = False
+    if pruning != 'none' and X_train is not None and fine_tune_epochs > 0:
+        print(f"\nİnce ayar ({fine_tune_epochs} epoch, lr={learning_rate})...")
+        sparse_labels = np.asarray(Y_train).ndim == 1
+        optimized.compile(optimizer=keras.optimizers.Adam(learning_rate),
+                          loss='sparse_categorical_crossentropy' if sparse_labels else 'categorical_crossentropy',
+                          metrics=['accuracy'])
+        callbacks = []
+        if masks:
+            callbacks.append(keras.callbacks.LambdaCallback(
+                on_train_batch_end=lambda batch, logs: _apply_masks(optimized, masks)))
+        train_model(optimized, X_train, Y_train, X_val, Y_val, epochs=fine_tune_epochs,
+                    batch_size=batch_size, use_augmentation=False, callbacks=callbacks)
+        fine_tuned = True
+
+    true_classes = to_class_ids(Y_val)
+    original_probabilities = _predict(model, X_val, prediction_batch_size)
+    optimized_probabilities = _predict(optimized, X_val, prediction_batch_size)
+    original_accuracy = float(np.mean(np.argmax(original_probabilities, axis=1) == true_classes))
+    optimized_accuracy = float(np.mean(np.argmax(optimized_probabilities, axis=1) == true_classes))
+
+    before = count_flops(model)
+    after = count_flops(optimized)
+    before['ms_per_image'], before['single_ms'] = measure_latency(model, X_val, prediction_batch_size)
+    after['ms_per_image'], after['single_ms'] = measure_latency(optimized, X_val, prediction_batch_size)
+    before['accuracy'], after['accuracy'] = original_accuracy, optimized_accuracy
+
+    report = {
+        'pruning': pruning,
+        'sparsity': sparsity if pruning != 'none' else 0.0,
+        'fine_tuned': fine_tuned,
+        **stats,
+        'before': before,
+        'after': after,
+        'accuracy_delta': optimized_accuracy - original_accuracy,
+        'max_abs_diff': float(np.max(np.abs(optimized_probabilities - original_probabilities))),
+        'prediction_agreement': float(np.mean(np.argmax(optimized_probabilities, axis=1)
+                                              == np.argmax(original_probabilities, axis=1))),
+    }
+
+    print("\n" + "="*60)
+    print("OPTİMİZASYON RAPORU")
+    print("="*60)
+    print(f"{'':<8}{'FLOPs':>14}{'Parametre':>12}{'Sıfır olmayan':>15}{'ms/görüntü':>12}"
+          f"{'Tek görüntü':>13}{'Accuracy':>10}")
+    for name, r in (('Önce', before), ('Sonra', after)):
+        print(f"{name:<8}{r['flops']:>14,}{r['params']:>12,}{r['nonzero_params']:>15,}"
+              f"{r['ms_per_image']:>12.4f}{r['single_ms']:>11.2f}ms{r['accuracy']:>10.4f}")
+    print(f"  - FLOPs: {after['flops'] / before['flops']:.2f}x, "
+          f"gecikme: {before['ms_per_image'] / after['ms_per_image']:.2f}x hızlanma")
+    print(f"  - Doğruluk farkı: {report['accuracy_delta']*100:+.2f} puan, "
+          f"tahmin uyumu: {report['prediction_agreement']*100:.2f}%, "
+          f"en büyük olasılık farkı: {report['max_abs_diff']:.2e}")
+
+    if output_path:
+        optimized.save(output_path)
+        print(f"✓ Optimize edilmiş model kaydedildi: {output_path}")
+    return optimized, report
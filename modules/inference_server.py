@@ -0,0 +1,326 @@
+# ============================================================================
+# MODÜL 11: TAHMİN SUNUCUSU (BATCH-INFERENCE MİKROSERVİSİ)
+# ============================================================================
+# Eğitilmiş modeli (config.MODEL_SAVE_PATH) bir kez yükler ve HTTP üzerinden
+# tahmin sunar. Eş zamanlı istekler dinamik bir mikro-batch'leyici ile
+# birleştirilir: en fazla max_batch_size görüntü veya max_wait_ms süre
+# dolduğunda tek bir model.predict çağrısı yapılır.
+#
+# Uç noktalar:
+#   POST /predict   application/json: {"instances": [[784 piksel], ...]}
+#                   image/png:        tek bir rakam görüntüsü
+#   GET  /stats     gecikme yüzdelikleri ve throughput sayaçları
+#   GET  /health    sağlık kontrolü
+#
+# Çalıştırma:
+#   python -m modules.inference_server --port 8080
+# ============================================================================
+
+import json
+import time
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+
+class MicroBatcher:
+    """
+    Eş zamanlı tahmin isteklerini tek bir model çağrısında birleştirir.
+
+    Parametreler:
+    ------------
+    predict_fn : callable
+        (n, 28, 28, 1) dizisi alıp (n, sınıf) olasılık döndüren fonksiyon
+    max_batch_size : int
+        Bir model çağrısındaki en fazla görüntü sayısı (daha büyük istekler
+        birden fazla çağrıya bölünür)
+    max_wait_ms : float
+        İlk istek geldikten sonra batch'in dolması için beklenecek en uzun süre
+    stats : ServerStats, optional
+        Batch boyutlarının kaydedileceği istatistik nesnesi
+    """
+
+    def __init__(self, predict_fn, max_batch_size=64, max_wait_ms=5.0, stats=None):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.stats = stats
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name='micro-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, images):
+        """Görüntüleri kuyruğa ekler; sonucu taşıyan bir Future döndürür."""
+        future = Future()
+        self._queue.put((images, future))
+        return future
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _collect(self):
+        first = self._queue.get()
+        if first is None:
+            return None
+        requests = [first]
+        rows = len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            requests.append(item)
+            rows += len(item[0])
+        return requests
+
+    def _loop(self):
+        while True:
+            requests = self._collect()
+            if requests is None:
+                break
+            batch = np.concatenate([images for images, _ in requests])
+            try:
+                # Tek bir büyük istek (veya son eklenen istek) sınırı aşabilir;
+                # model hiçbir zaman max_batch_size'dan büyük batch görmez
+                outputs = []
+                for start in range(0, len(batch), self.max_batch_size):
+                    chunk = batch[start:start + self.max_batch_size]
+                    outputs.append(np.asarray(self.predict_fn(chunk)))
+                    if self.stats is not None:
+                        self.stats.record_batch(len(chunk))
+                probabilities = np.concatenate(outputs)
+            except Exception as exc:
+                for _, future in requests:
+                    future.set_exception(exc)
+                continue
+            offset = 0
+            for images, future in requests:
+                future.set_result(probabilities[offset:offset + len(images)])
+                offset += len(images)
+
+
+class ServerStats:
+    """İstek gecikmeleri ve throughput sayaçları (thread-safe)."""
+
+    def __init__(self, window=10000):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.started = time.time()
+        self.requests = 0
+        self.images = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_images = 0
+
+    def record_request(self, latency, num_images):
+        with self._lock:
+            self._latencies.append(latency)
+            self.requests += 1
+            self.images += num_images
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def record_batch(self, size):
+        with self._lock:
+            self.batches += 1
+            self.batched_images += size
+
+    def snapshot(self):
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000.0
+            uptime = time.time() - self.started
+            result = {
+                'uptime_s': uptime,
+                'requests': self.requests,
+                'images': self.images,
+                'errors': self.errors,
+                'batches': self.batches,
+                'mean_batch_size': self.batched_images / self.batches if self.batches else 0.0,
+                'requests_per_s': self.requests / uptime if uptime else 0.0,
+                'images_per_s': self.images / uptime if uptime else 0.0,
+            }
+        for p in (50, 90, 95, 99):
+            result[f'latency_p{p}_ms'] = float(np.percentile(latencies, p)) if len(latencies) else 0.0
+        return result
+
+
+def decode_png(data):
+    """PNG baytlarını (28, 28, 1) uint8 diziye çevirir (gerekirse yeniden boyutlandırır)."""
+    import tensorflow as tf
+    image = tf.io.decode_png(data, channels=1)
+    if image.shape[0] != 28 or image.shape[1] != 28:
+        image = tf.image.resize(image, (28, 28))
+    return np.asarray(image, dtype=np.float32).clip(0, 255).astype(np.uint8)[np.newaxis]
+
+
+def parse_instances(payload):
+    """JSON içeriğindeki 784 piksellik satırları (n, 28, 28, 1) diziye çevirir."""
+    instances = payload.get('instances', payload.get('pixels'))
+    if instances is None:
+        raise ValueError("'instances' alanı bulunamadı")
+    array = np.asarray(instances, dtype=np.float32)
+    if array.ndim == 1:
+        array = array[np.newaxis]
+    if array.shape[-1] != 784 and array.shape[1:] != (28, 28, 1):
+        raise ValueError(f"Her satır 784 piksel olmalı, gelen şekil: {array.shape}")
+    if not np.isfinite(array).all() or array.min() < 0 or array.max() > 255:
+        # uint8'e dönüşümde taşan değerler (ör. 256 -> 0) sessizce yanlış tahmin verir
+        raise ValueError("Piksel değerleri 0-255 aralığında olmalı")
+    return array.reshape(-1, 28, 28, 1)
+
+
+def make_handler(batcher, stats, compact_dtypes, request_timeout=30.0):
+    """Mikro-batch'leyiciye bağlı HTTP istek işleyicisi sınıfı oluşturur."""
+
+    class InferenceHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass  # Her istek için konsola yazmayı kapat (gecikmeyi etkiler)
+
+        def _send_json(self, status, body):
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send_json(200, {'status': 'ok'})
+            elif self.path == '/stats':
+                self._send_json(200, stats.snapshot())
+            else:
+                self._send_json(404, {'error': 'bulunamadı'})
+
+        def do_POST(self):
+            if self.path != '/predict':
+                self._send_json(404, {'error': 'bulunamadı'})
+                return
+            start = time.perf_counter()
+            try:
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if self.headers.get('Content-Type', '').startswith('image/png'):
+                    images = decode_png(body)
+                else:
+                    images = parse_instances(json.loads(body))
+                if compact_dtypes:
+                    images = np.rint(images).astype(np.uint8)
+                else:
+                    images = images.astype(np.float32) / 255.0
+            except Exception as exc:
+                # Geçersiz istek (istemci hatası)
+                stats.record_error()
+                self._send_json(400, {'error': str(exc)})
+                return
+            try:
+                probabilities = batcher.submit(images).result(timeout=request_timeout)
+            except FutureTimeoutError:
+                stats.record_error()
+                self._send_json(504, {'error': f'tahmin {request_timeout} sn içinde tamamlanmadı'})
+                return
+            except Exception as exc:
+                # Model hatası (sunucu hatası)
+                stats.record_error()
+                self._send_json(500, {'error': str(exc)})
+                return
+            stats.record_request(time.perf_counter() - start, len(images))
+            self._send_json(200, {
+                'labels': np.argmax(probabilities, axis=1).tolist(),
+                'probabilities': np.round(probabilities, 6).tolist()
+            })
+
+    return InferenceHandler
+
+
+def create_server(model, host='127.0.0.1', port=8080, max_batch_size=64, max_wait_ms=5.0,
+                  compact_dtypes=True):
+    """
+    Verilen model için tahmin sunucusu oluşturur (başlatmaz).
+
+    Parametreler:
+    ------------
+    model : keras.Model
+        predict_on_batch() metoduna sahip model
+    host, port : str, int
+        Dinlenecek adres (port=0 ise boş bir port seçilir)
+    max_batch_size : int
+        Mikro-batch'teki en fazla görüntü sayısı
+    max_wait_ms : float
+        Mikro-batch için en uzun bekleme süresi (milisaniye)
+    compact_dtypes : bool
+        Model uint8 (0-255) giriş mi bekliyor? False ise pikseller 255'e bölünür
+
+    Döndürür:
+    --------
+    ThreadingHTTPServer
+        server.batcher ve server.stats özelliklerine sahip sunucu
+    """
+    stats = ServerStats()
+    batcher = MicroBatcher(model.predict_on_batch, max_batch_size=max_batch_size,
+                           max_wait_ms=max_wait_ms, stats=stats)
+    server = ThreadingHTTPServer((host, port), make_handler(batcher, stats, compact_dtypes))
+    server.daemon_threads = True
+    server.batcher = batcher
+    server.stats = stats
+    return server
+
+
+def run_server(model_path, host='127.0.0.1', port=8080, max_batch_size=64, max_wait_ms=5.0,
+               compact_dtypes=True):
+    """
+    Model checkpoint'ini bir kez yükler ve tahmin sunucusunu çalıştırır.
+    """
+    from tensorflow import keras
+
+    print("\n" + "="*60)
+    print("MODÜL 11: TAHMİN SUNUCUSU")
+    print("="*60)
+
+    model = keras.models.load_model(model_path)
+    server = create_server(model, host, port, max_batch_size, max_wait_ms, compact_dtypes)
+
+    print(f"✓ Model yüklendi: {model_path}")
+    print(f"✓ Sunucu dinliyor: http://{host}:{server.server_address[1]}")
+    print(f"  - Mikro-batch: en fazla {max_batch_size} görüntü / {max_wait_ms} ms")
+    print(f"  - Uç noktalar: POST /predict, GET /stats, GET /health")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.close()
+        print("\n✓ Sunucu durduruldu")
+        print(json.dumps(server.stats.snapshot(), indent=2))
+
+
+if __name__ == "__main__":
+    import argparse
+    import config
+
+    parser = argparse.ArgumentParser(description="CNN tahmin sunucusu")
+    parser.add_argument("--model", default=config.MODEL_SAVE_PATH)
+    parser.add_argument("--host", default=config.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=config.SERVER_PORT)
+    parser.add_argument("--max-batch-size", type=int, default=config.SERVER_MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=config.SERVER_MAX_WAIT_MS)
+    args = parser.parse_args()
+    run_server(args.model, args.host, args.port, args.max_batch_size, args.max_wait_ms,
+               compact_dtypes=config.COMPACT_DTYPES)
@@ -1,11 +1,257 @@
 # ============================================================================
 # MODÜL 5: CNN MODELİ OLUŞTURMA
 # ============================================================================
+# Mimariler bildirimsel spec'ler olarak tanımlanır (MODEL_SPECS veya bir
+# YAML/JSON dosyası): her katman {KatmanAdı: {argümanlar}} biçiminde
+# keras.layers sınıfına karşılık gelir, son softmax katmanı otomatik eklenir.
+#
+# use_cache=True ile derlenmiş modeller spec hash'ine göre süreç içinde
+# saklanır; aynı mimari tekrar istendiğinde graph yeniden kurulmaz, önbellekteki
+# modelin ağırlıkları ve optimizer durumu ilk hallerine döndürülür ve izlenmiş
+# (traced) tf.function'lar yeniden kullanılır.
+# ============================================================================
+
+import os
+import json
+import hashlib
 
+import numpy as np
+import tensorflow as tf
 from tensorflow.keras import layers, models
+from tensorflow.keras import mixed_precision as keras_mixed_precision
+
+# Hazır mimariler (create_cnn_model(model_type=...) adları)
+MODEL_SPECS = {
+    'simple': {
+        'description': 'Basit CNN modeli',
+        'layers': [
+            {'Conv2D': {'filters': 32, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Conv2D': {'filters': 64, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Flatten': {}},
+            {'Dense': {'units': 128, 'activation': 'relu'}},
+            {'Dropout': {'rate': 0.5}},
+        ],
+    },
+    'narrow': {
+        'description': 'Dar CNN modeli (damıtma öğrencisi)',
+        'layers': [
+            {'Conv2D': {'filters': 16, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Conv2D': {'filters': 32, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Flatten': {}},
+            {'Dense': {'units': 64, 'activation': 'relu'}},
+        ],
+    },
+    'semih': {
+        'description': "Semih'in CNN modeli",
+        'layers': [
+            {'Conv2D': {'filters': 32, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Conv2D': {'filters': 64, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Dropout': {'rate': 0.3}},
+            {'Conv2D': {'filters': 128, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Dropout': {'rate': 0.5}},
+            {'Flatten': {}},
+            {'Dense': {'units': 128, 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Dropout': {'rate': 0.5}},
+            {'Dense': {'units': 256, 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Dropout': {'rate': 0.5}},
+            {'Dense': {'units': 128, 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Dropout': {'rate': 0.5}},
+            {'Dense': {'units': 64, 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Dropout': {'rate': 0.5}},
+        ],
+    },
+    'deep': {
+        'description': 'Derin CNN modeli',
+        'layers': [
+            {'Conv2D': {'filters': 32, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Conv2D': {'filters': 32, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Dropout': {'rate': 0.25}},
+            {'Conv2D': {'filters': 64, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Conv2D': {'filters': 64, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Dropout': {'rate': 0.25}},
+            {'Conv2D': {'filters': 128, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Dropout': {'rate': 0.25}},
+            {'Flatten': {}},
+            {'Dense': {'units': 512, 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Dropout': {'rate': 0.5}},
+            {'Dense': {'units': 256, 'activation': 'relu'}},
+            {'Dropout': {'rate': 0.5}},
+        ],
+    },
+    'standard': {
+        'description': 'Standart CNN modeli',
+        'layers': [
+            {'Conv2D': {'filters': 32, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Conv2D': {'filters': 32, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Dropout': {'rate': 0.25}},
+            {'Conv2D': {'filters': 64, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Conv2D': {'filters': 64, 'kernel_size': [3, 3], 'activation': 'relu'}},
+            {'MaxPooling2D': {'pool_size': [2, 2]}},
+            {'Dropout': {'rate': 0.25}},
+            {'Flatten': {}},
+            {'Dense': {'units': 256, 'activation': 'relu'}},
+            {'BatchNormalization': {}},
+            {'Dropout': {'rate': 0.5}},
+        ],
+    },
+}
+
+# Derlenmiş model önbelleği: spec hash -> (model, ilk ağırlıklar, optimizer durumu)
+_BUILD_CACHE = {}
+
+
+def resolve_precision_policy(mixed_precision=False):
+    """
+    İstenen karışık hassasiyet ayarına göre kullanılacak dtype politikasını seçer.
+    
+    mixed_float16 sadece Tensor Core'lu GPU'larda (compute capability >= 7.0)
+    hızlandırma sağladığı için True verildiğinde bu kontrol yapılır; diğer
+    cihazlarda float32'ye dönülür. 'force' ise cihazdan bağımsız olarak
+    mixed_float16 kullanılır (ör. CPU'da ölçüm yapmak için).
+    
+    Parametreler:
+    ------------
+    mixed_precision : bool veya str
+        False, True veya 'force'
+    
+    Döndürür:
+    --------
+    str
+        'mixed_float16' veya 'float32'
+    """
+    if not mixed_precision:
+        return 'float32'
+    if mixed_precision == 'force':
+        return 'mixed_float16'
+    for gpu in tf.config.list_physical_devices('GPU'):
+        capability = tf.config.experimental.get_device_details(gpu).get('compute_capability')
+        if capability and capability >= (7, 0):
+            return 'mixed_float16'
+    print("  ! mixed_float16 bu cihazda desteklenmiyor (GPU compute capability < 7.0), "
+          "float32 kullanılıyor")
+    return 'float32'
+
+
+def load_model_spec(model_type):
+    """
+    Model tipini bildirimsel spec sözlüğüne çözer.
+
+    Parametreler:
+    ------------
+    model_type : str veya dict
+        MODEL_SPECS adı ('simple', 'narrow', 'standard', 'deep', 'semih'), .yaml/.yml/.json
+        spec dosyası yolu ya da doğrudan spec sözlüğü
+
+    Döndürür:
+    --------
+    dict
+        'layers' listesi (ve isteğe bağlı 'description') içeren spec
+    """
+    if isinstance(model_type, dict):
+        spec = model_type
+    elif model_type in MODEL_SPECS:
+        spec = MODEL_SPECS[model_type]
+    elif str(model_type).endswith(('.yaml', '.yml', '.json')):
+        with open(model_type) as f:
+            if model_type.endswith('.json'):
+                spec = json.load(f)
+            else:
+                try:
+                    import yaml
+                except ImportError as exc:
+                    raise ImportError("YAML model spec'i için PyYAML kurulu olmalı "
+                                      "(pip install pyyaml)") from exc
+                spec = yaml.safe_load(f)
+    else:
+        # Eski davranış: bilinmeyen tip standart model olarak kurulur
+        spec = MODEL_SPECS['standard']
+
+    if not isinstance(spec.get('layers'), list):
+        raise ValueError(f"Model spec'inde 'layers' listesi yok: {model_type}")
+    for entry in spec['layers']:
+        if not isinstance(entry, dict) or len(entry) != 1:
+            raise ValueError(f"Katman spec'i {{KatmanAdı: {{argümanlar}}}} biçiminde olmalı: {entry}")
+    return spec
+
+
+def model_spec_hash(spec):
+    """Spec sözlüğünün (anahtar sırasından bağımsız) SHA-256 özeti."""
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+
+def _build_layer(entry):
+    """{KatmanAdı: {argümanlar}} girdisinden keras katmanı oluşturur."""
+    (name, kwargs), = entry.items()
+    layer_class = getattr(layers, name, None)
+    if layer_class is None:
+        raise ValueError(f"Bilinmeyen katman tipi: {name}")
+    return layer_class(**(kwargs or {}))
+
+
+def _optimizer_variables(optimizer):
+    """Optimizer değişkenlerini döndürür (eski ve yeni Keras API'leri için)."""
+    variables = optimizer.variables
+    return list(variables() if callable(variables) else variables)
 
 
-def create_cnn_model(input_shape=(28, 28, 1), num_classes=10, model_type='standard'):
+def _snapshot(model):
+    """Önbellek için modelin ilk ağırlıklarını ve optimizer durumunu kaydeder."""
+    optimizer = getattr(model, 'optimizer', None)
+    optimizer_state = None
+    learning_rate = None
+    if optimizer is not None:
+        if hasattr(optimizer, 'build'):
+            # Slot değişkenleri ilk eğitim adımından önce oluşturulur
+            optimizer.build(model.trainable_variables)
+        optimizer_state = [np.array(v) for v in _optimizer_variables(optimizer)]
+        learning_rate = float(tf.keras.backend.get_value(optimizer.learning_rate))
+    return model, model.get_weights(), optimizer_state, learning_rate
+
+
+def _restore(entry):
+    """Önbellekteki modeli ilk haline döndürür (graph ve tf.function'lar korunur)."""
+    model, weights, optimizer_state, learning_rate = entry
+    model.set_weights(weights)
+    if optimizer_state is not None:
+        for variable, value in zip(_optimizer_variables(model.optimizer), optimizer_state):
+            variable.assign(value)
+        # ReduceLROnPlateau gibi callback'lerin değiştirdiği öğrenme oranı da sıfırlanır
+        model.optimizer.learning_rate = learning_rate
+        model.reset_metrics()
+    model.stop_training = False
+    return model
+
+
+def clear_model_cache():
+    """Süreç içindeki derlenmiş model önbelleğini boşaltır."""
+    _BUILD_CACHE.clear()
+
+
+def create_cnn_model(input_shape=(28, 28, 1), num_classes=10, model_type='standard',
+                     compact_dtypes=False, mixed_precision=False, jit_compile=False,
+                     steps_per_execution=1, summary=True, compile=True, use_cache=False):
     """
     CNN modeli oluşturur.
     
@@ -15,125 +261,92 @@ def create_cnn_model(input_shape=(28, 28, 1), num_classes=10, model_type='standa
         Giriş görüntü boyutu (yükseklik, genişlik, kanal)
     num_classes : int
         Sınıf sayısı
-    model_type : str
-        Model tipi: 'standard', 'deep', 'simple'
+    model_type : str veya dict
+        Model tipi: 'standard', 'deep', 'simple', 'semih', bir .yaml/.json spec
+        dosyası ya da spec sözlüğü (bkz. load_model_spec)
+    compact_dtypes : bool
+        True ise model uint8 (0-255) piksel alır ve ilk katmanda Rescaling ile
+        normalize eder; etiketler tamsayı sınıf numarası olduğu için
+        sparse_categorical_crossentropy ile derlenir.
+    mixed_precision : bool veya str
+        True ise destekleniyorsa mixed_float16 politikası kullanılır ('force'
+        ile her cihazda); çıkış softmax katmanı her zaman float32 kalır
+    jit_compile : bool
+        model.compile içinde XLA derlemesi açılsın mı?
+    steps_per_execution : int
+        Her tf.function çağrısında çalıştırılacak batch sayısı
+    summary : bool
+        Model özeti yazdırılsın mı?
+    compile : bool
+        Model derlensin mi? (sadece ağırlık yükleyip tahmin yapılacaksa False)
+    use_cache : bool
+        True ise aynı spec ve ayarlarla daha önce kurulmuş model süreç içi
+        önbellekten, ilk ağırlıklarına ve optimizer durumuna döndürülerek
+        verilir. Aynı nesne döndüğü için önceki çağrının modeli artık
+        kullanılmamalıdır
     
     Döndürür:
     --------
     keras.Model
         Oluşturulmuş CNN modeli
     """
+    spec = load_model_spec(model_type)
+    name = model_type if isinstance(model_type, str) else spec.get('description', 'spec')
     print("\n" + "="*60)
-    print(f"MODÜL 5: CNN MODELİ OLUŞTURMA ({model_type.upper()})")
+    print(f"MODÜL 5: CNN MODELİ OLUŞTURMA ({os.path.basename(name).upper()})")
     print("="*60)
     
-    model = models.Sequential()
+    policy = resolve_precision_policy(mixed_precision)
+    cache_key = None
+    if use_cache:
+        cache_key = model_spec_hash({
+            'spec': spec, 'input_shape': list(input_shape), 'num_classes': num_classes,
+            'compact_dtypes': compact_dtypes, 'policy': policy, 'jit_compile': jit_compile,
+            'steps_per_execution': steps_per_execution, 'compile': compile,
+        })
+        if cache_key in _BUILD_CACHE:
+            print(f"✓ Model önbellekten alındı (spec {cache_key[:12]}), ağırlıklar sıfırlandı")
+            return _restore(_BUILD_CACHE[cache_key])
+    
+    # Hassasiyet politikası sadece bu modelin katmanları için ayarlanır
+    previous_policy = keras_mixed_precision.global_policy()
+    keras_mixed_precision.set_global_policy(policy)
+    output_dtype = 'float32' if policy == 'mixed_float16' else None
     
-    if model_type == 'simple':
-        # Basit model
-        print("\nBasit CNN modeli oluşturuluyor...")
-        model.add(layers.Conv2D(32, (3, 3), activation='relu', input_shape=input_shape))
-        model.add(layers.MaxPooling2D((2, 2)))
-        model.add(layers.Conv2D(64, (3, 3), activation='relu'))
-        model.add(layers.MaxPooling2D((2, 2)))
-        model.add(layers.Flatten())
-        model.add(layers.Dense(128, activation='relu'))
-        model.add(layers.Dropout(0.5))
-        model.add(layers.Dense(num_classes, activation='softmax'))
-        
-    elif model_type == 'semih':
-        print("\nSemih'in CNN modeli oluşturuluyor...")
-        model.add(layers.Conv2D(32, (3, 3), activation='relu', input_shape=input_shape))
-        model.add(layers.BatchNormalization())
-        model.add(layers.MaxPooling2D((2, 2)))
-        
-        model.add(layers.Conv2D(64, (3, 3), activation='relu'))
-        model.add(layers.MaxPooling2D((2, 2)))
-        model.add(layers.Dropout(0.3))
-        
-        model.add(layers.Conv2D(128, (3, 3), activation='relu'))
-        model.add(layers.BatchNormalization())
-        model.add(layers.MaxPooling2D((2, 2)))
-        model.add(layers.Dropout(0.5))
-        
-        
-        model.add(layers.Flatten())
-        model.add(layers.Dense(128, activation='relu'))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Dropout(0.5))
-        model.add(layers.Dense(256, activation='relu'))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Dropout(0.5))
-        model.add(layers.Dense(128, activation='relu'))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Dropout(0.5))
-        model.add(layers.Dense(64, activation='relu'))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Dropout(0.5))
-        model.add(layers.Dense(num_classes, activation='softmax'))
-        
-        
-    elif model_type == 'deep':
-        # Derin model
-        print("\nDerin CNN modeli oluşturuluyor...")
-        model.add(layers.Conv2D(32, (3, 3), activation='relu', input_shape=input_shape))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Conv2D(32, (3, 3), activation='relu'))
-        model.add(layers.MaxPooling2D((2, 2)))
-        model.add(layers.Dropout(0.25))
-        
-        model.add(layers.Conv2D(64, (3, 3), activation='relu'))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Conv2D(64, (3, 3), activation='relu'))
-        model.add(layers.MaxPooling2D((2, 2)))
-        model.add(layers.Dropout(0.25))
-        
-        model.add(layers.Conv2D(128, (3, 3), activation='relu'))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Dropout(0.25))
-        
-        model.add(layers.Flatten())
-        model.add(layers.Dense(512, activation='relu'))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Dropout(0.5))
-        model.add(layers.Dense(256, activation='relu'))
-        model.add(layers.Dropout(0.5))
-        model.add(layers.Dense(num_classes, activation='softmax'))
-        
-    else:  # standard
-        # Standart model
-        print("\nStandart CNN modeli oluşturuluyor...")
-        model.add(layers.Conv2D(32, (3, 3), activation='relu', input_shape=input_shape))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Conv2D(32, (3, 3), activation='relu'))
-        model.add(layers.MaxPooling2D((2, 2)))
-        model.add(layers.Dropout(0.25))
-        
-        model.add(layers.Conv2D(64, (3, 3), activation='relu'))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Conv2D(64, (3, 3), activation='relu'))
-        model.add(layers.MaxPooling2D((2, 2)))
-        model.add(layers.Dropout(0.25))
-        
-        model.add(layers.Flatten())
-        model.add(layers.Dense(256, activation='relu'))
-        model.add(layers.BatchNormalization())
-        model.add(layers.Dropout(0.5))
-        model.add(layers.Dense(num_classes, activation='softmax'))
+    print(f"\n{spec.get('description', 'CNN modeli')} oluşturuluyor...")
+    try:
+        model = models.Sequential()
+        model.add(layers.Input(shape=input_shape))
+        if compact_dtypes:
+            # Pikseller uint8 olarak gelir, normalizasyon modelin içinde yapılır
+            model.add(layers.Rescaling(1.0 / 255))
+        for entry in spec['layers']:
+            model.add(_build_layer(entry))
+        model.add(layers.Dense(num_classes, activation='softmax', dtype=output_dtype))
+    finally:
+        # Hatalı bir spec katmanı süreci mixed_float16'da bırakmasın
+        keras_mixed_precision.set_global_policy(previous_policy)
     
-    # Model özeti
-    print("\nModel Özeti:")
-    model.summary()
+    if summary:
+        print("\nModel Özeti:")
+        model.summary()
     
-    # Model derleme
-    print("\nModel derleniyor...")
-    model.compile(
-        optimizer='adam',
-        loss='categorical_crossentropy',
-        metrics=['accuracy']
-    )
+    if compile:
+        print("\nModel derleniyor...")
+        model.compile(
+            optimizer='adam',
+            loss='sparse_categorical_crossentropy' if compact_dtypes else 'categorical_crossentropy',
+            metrics=['accuracy'],
+            jit_compile=jit_compile,
+            steps_per_execution=steps_per_execution
+        )
     
-    print("✓ Model oluşturuldu ve derlendi!")
+    if cache_key is not None:
+        _BUILD_CACHE[cache_key] = _snapshot(model)
+    
+    print(f"✓ Model oluşturuldu{' ve derlendi' if compile else ''}!")
+    print(f"  - Hassasiyet politikası: {policy}")
+    print(f"  - XLA (jit_compile): {'Açık' if jit_compile else 'Kapalı'}")
+    print(f"  - steps_per_execution: {steps_per_execution}")
     
     return model
-
@@ -1,72 +1,199 @@
 # ============================================================================
 # MODÜL 9: MODEL DEĞERLENDİRME
 # ============================================================================
+# Doğrulama seti tek bir ileri geçişle değerlendirilir: her batch'in
+# olasılıklarından loss, accuracy, confusion matrix ve sınıf bazında
+# precision/recall/F1 artımlı olarak biriktirilir. Girdi dizi (memmap dahil)
+# veya (X, Y) batch'leri üreten bir generator/tf.data.Dataset olabilir;
+# bellek kullanımı doğrulama seti boyutundan bağımsızdır.
+# ============================================================================
+
+import time
 
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.metrics import confusion_matrix, classification_report
+
+from modules.data_loader import to_class_ids
+from modules.plotting import submit_figure
+
+# Keras'ın crossentropy hesabında kullandığı kırpma değeri
+_EPSILON = 1e-7
+
+
+def _draw_confusion_matrix(fig, cm):
+    import seaborn as sns
+    ax = fig.subplots()
+    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', ax=ax,
+                xticklabels=range(len(cm)), yticklabels=range(len(cm)))
+    ax.set_title('Confusion Matrix', fontsize=16)
+    ax.set_ylabel('Gerçek Etiket', fontsize=12)
+    ax.set_xlabel('Tahmin Edilen Etiket', fontsize=12)
 
 
-def evaluate_model(model, X_val, Y_val):
+class EvaluationAccumulator:
     """
-    Modeli değerlendirir.
+    Batch olasılıklarından değerlendirme metriklerini artımlı olarak biriktirir.
+    
+    Parametreler:
+    ------------
+    num_classes : int, optional
+        Sınıf sayısı (None ise ilk batch'in olasılık sütun sayısı kullanılır)
+    """
+    
+    def __init__(self, num_classes=None):
+        self.num_classes = num_classes
+        self.confusion = None if num_classes is None else np.zeros((num_classes, num_classes), np.int64)
+        self.loss_sum = 0.0
+        self.count = 0
+    
+    def update(self, probabilities, true_classes):
+        """
+        Bir batch'in sonuçlarını ekler ve tahmin edilen sınıfları döndürür.
+        
+        Parametreler:
+        ------------
+        probabilities : numpy array
+            (batch, sınıf) softmax çıktıları
+        true_classes : numpy array
+            (batch,) gerçek sınıf numaraları
+        """
+        probabilities = np.asarray(probabilities, dtype=np.float32)
+        true_classes = np.asarray(true_classes, dtype=np.int64)
+        if self.confusion is None:
+            self.num_classes = probabilities.shape[1]
+            self.confusion = np.zeros((self.num_classes, self.num_classes), np.int64)
+        
+        predicted_classes = np.argmax(probabilities, axis=1)
+        true_probabilities = probabilities[np.arange(len(true_classes)), true_classes]
+        self.loss_sum += float(-np.log(np.clip(true_probabilities, _EPSILON, 1.0 - _EPSILON)).sum())
+        self.count += len(true_classes)
+        self.confusion += np.bincount(true_classes * self.num_classes + predicted_classes,
+                                      minlength=self.num_classes ** 2
+                                      ).reshape(self.num_classes, self.num_classes)
+        return predicted_classes
+    
+    def result(self):
+        """
+        Biriktirilen metrikleri döndürür.
+        
+        Döndürür:
+        --------
+        dict
+            loss, accuracy, confusion_matrix, precision, recall, f1, support,
+            macro_f1, weighted_f1, num_samples
+        """
+        if self.count == 0:
+            raise ValueError("Değerlendirme için hiç örnek verilmedi (boş doğrulama verisi)")
+        cm = self.confusion
+        true_positives = np.diag(cm).astype(np.float64)
+        support = cm.sum(axis=1)
+        predicted = cm.sum(axis=0)
+        # Sıfıra bölme durumunda metrik 0 kabul edilir (sklearn zero_division=0 ile aynı)
+        precision = np.divide(true_positives, predicted, out=np.zeros_like(true_positives),
+                              where=predicted > 0)
+        recall = np.divide(true_positives, support, out=np.zeros_like(true_positives),
+                           where=support > 0)
+        denominator = precision + recall
+        f1 = np.divide(2 * precision * recall, denominator, out=np.zeros_like(true_positives),
+                       where=denominator > 0)
+        count = max(self.count, 1)
+        return {
+            'loss': self.loss_sum / count,
+            'accuracy': float(true_positives.sum() / count),
+            'confusion_matrix': cm,
+            'precision': precision,
+            'recall': recall,
+            'f1': f1,
+            'support': support,
+            'macro_f1': float(f1.mean()),
+            'weighted_f1': float((f1 * support).sum() / count),
+            'num_samples': self.count,
+        }
+
+
+def _iter_labeled_batches(X_val, Y_val, batch_size):
+    """Dizileri batch'lere böler; Y_val None ise X_val'in (X, Y) batch'lerini üretir."""
+    if Y_val is not None:
+        for start in range(0, len(X_val), batch_size):
+            yield X_val[start:start + batch_size], Y_val[start:start + batch_size]
+    else:
+        for images, labels in X_val:
+            yield images, labels
+
+
+def _print_classification_report(metrics):
+    """sklearn classification_report ile aynı düzende sınıf bazında rapor yazar."""
+    print(f"{'':>12}{'precision':>10}{'recall':>10}{'f1-score':>10}{'support':>10}\n")
+    for c in range(len(metrics['support'])):
+        print(f"{c:>12}{metrics['precision'][c]:>10.2f}{metrics['recall'][c]:>10.2f}"
+              f"{metrics['f1'][c]:>10.2f}{metrics['support'][c]:>10}")
+    total = metrics['num_samples']
+    weights = metrics['support'] / max(total, 1)
+    print(f"\n{'accuracy':>12}{'':>20}{metrics['accuracy']:>10.2f}{total:>10}")
+    print(f"{'macro avg':>12}{metrics['precision'].mean():>10.2f}{metrics['recall'].mean():>10.2f}"
+          f"{metrics['macro_f1']:>10.2f}{total:>10}")
+    print(f"{'weighted avg':>12}{(metrics['precision'] * weights).sum():>10.2f}"
+          f"{(metrics['recall'] * weights).sum():>10.2f}{metrics['weighted_f1']:>10.2f}{total:>10}")
+
+
+def evaluate_model(model, X_val, Y_val, batch_size=1024, return_predictions=True):
+    """
+    Modeli tek bir ileri geçişle değerlendirir.
     
     Parametreler:
     ------------
     model : keras.Model
-        Değerlendirilecek model
-    X_val : numpy array
-        Doğrulama görüntüleri
-    Y_val : numpy array
-        Doğrulama etiketleri
+        Değerlendirilecek model (predict_on_batch() metoduna sahip herhangi bir nesne)
+    X_val : numpy array veya iterable
+        Doğrulama görüntüleri; Y_val None ise (X, Y) batch'leri üreten bir
+        generator veya tf.data.Dataset (ör. stream_csv_batches(..., subset='validation'))
+    Y_val : numpy array veya None
+        Doğrulama etiketleri (one-hot veya tamsayı sınıf numarası)
+    batch_size : int
+        Değerlendirme batch boyutu (X_val dizi ise)
+    return_predictions : bool
+        True ise olasılıklar ve sınıf numaraları da döndürülür; False ise
+        bellek kullanımı doğrulama seti boyutundan bağımsızdır (büyük veya
+        akış halindeki doğrulama verisi için)
     
     Döndürür:
     --------
     dict
-        Değerlendirme metrikleri
+        Değerlendirme metrikleri (EvaluationAccumulator.result()) ve
+        return_predictions=True ise 'predictions', 'predicted_classes' ve
+        'true_classes'
     """
     print("\n" + "="*60)
     print("MODÜL 9: MODEL DEĞERLENDİRME")
     print("="*60)
     
-    # Model değerlendirme
-    print("\nModel değerlendiriliyor...")
-    loss, accuracy = model.evaluate(X_val, Y_val, verbose=0)
+    print("\nModel değerlendiriliyor (tek geçiş)...")
+    start_time = time.perf_counter()
+    accumulator = EvaluationAccumulator()
+    predictions, predicted_batches, true_batches = [], [], []
+    for images, labels in _iter_labeled_batches(X_val, Y_val, batch_size):
+        probabilities = np.asarray(model.predict_on_batch(images))
+        true_classes = to_class_ids(np.asarray(labels))
+        predicted_classes = accumulator.update(probabilities, true_classes)
+        if return_predictions:
+            predictions.append(probabilities)
+            predicted_batches.append(predicted_classes)
+            true_batches.append(true_classes)
+    elapsed = time.perf_counter() - start_time
+    results = accumulator.result()
     
     print(f"\n✓ Model Değerlendirme Sonuçları:")
-    print(f"  - Loss: {loss:.4f}")
-    print(f"  - Accuracy: {accuracy:.4f} ({accuracy*100:.2f}%)")
-    
-    # Tahmin yapma
-    print("\nTahminler yapılıyor...")
-    Y_pred = model.predict(X_val)
-    Y_pred_classes = np.argmax(Y_pred, axis=1)
-    Y_true_classes = np.argmax(Y_val, axis=1)
+    print(f"  - Loss: {results['loss']:.4f}")
+    print(f"  - Accuracy: {results['accuracy']:.4f} ({results['accuracy']*100:.2f}%)")
+    print(f"  - Süre: {elapsed:.2f} sn ({results['num_samples'] / max(elapsed, 1e-9):,.0f} görüntü/sn)")
     
-    # Confusion Matrix
-    print("\nConfusion Matrix oluşturuluyor...")
-    cm = confusion_matrix(Y_true_classes, Y_pred_classes)
+    submit_figure('confusion_matrix', (10, 8), _draw_confusion_matrix,
+                  results['confusion_matrix'].copy())
     
-    plt.figure(figsize=(10, 8))
-    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', 
-                xticklabels=range(10), yticklabels=range(10))
-    plt.title('Confusion Matrix', fontsize=16)
-    plt.ylabel('Gerçek Etiket', fontsize=12)
-    plt.xlabel('Tahmin Edilen Etiket', fontsize=12)
-    plt.show()
-    
-    # Classification Report
     print("\nClassification Report:")
-    print(classification_report(Y_true_classes, Y_pred_classes, 
-                              target_names=[str(i) for i in range(10)]))
+    _print_classification_report(results)
     
-    return {
-        'loss': loss,
-        'accuracy': accuracy,
-        'confusion_matrix': cm,
-        'predictions': Y_pred,
-        'predicted_classes': Y_pred_classes,
-        'true_classes': Y_true_classes
-    }
-
+    if return_predictions:
+        results['predictions'] = np.concatenate(predictions)
+        results['predicted_classes'] = np.concatenate(predicted_batches)
+        results['true_classes'] = np.concatenate(true_batches)
+    return results
@@ -0,0 +1,268 @@
+# ============================================================================
+# MODÜL 12: MODEL DIŞA AKTARMA (TFLite / ONNX) VE CPU TAHMİNİ
+# ============================================================================
+# Eğitilmiş Keras modelini CPU'da hızlı çalışan formatlara dönüştürür:
+#   - 'float16'  : ağırlıklar float16 (boyut ~yarıya iner)
+#   - 'dynamic'  : dinamik aralık nicemleme (ağırlıklar int8)
+#   - 'int8'     : tam tamsayı nicemleme (X_train örnekleriyle kalibre edilir)
+#   - 'none'     : float32 TFLite
+# TFLitePredictor, çok thread'li TFLite interpreter'ını Keras modeli gibi
+# (predict / predict_on_batch) kullanılabilir hale getirir; böylece
+# make_predictions() ve stream_predictions() doğrudan onunla çalışır.
+# ============================================================================
+
+import os
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from modules.data_loader import to_class_ids
+
+
+def export_tflite(model, output_path, quantization='dynamic', calibration_data=None,
+                  num_calibration_samples=200, seed=13):
+    """
+    Keras modelini TFLite formatına dönüştürür ve kaydeder.
+
+    Parametreler:
+    ------------
+    model : keras.Model
+        Dönüştürülecek model
+    output_path : str
+        .tflite dosya yolu
+    quantization : str
+        'none', 'float16', 'dynamic' veya 'int8'
+    calibration_data : numpy array, optional
+        'int8' için kalibrasyon görüntüleri (ör. X_train)
+    num_calibration_samples : int
+        Kalibrasyonda kullanılacak örnek sayısı
+    seed : int
+        Kalibrasyon örneklerini seçmek için seed değeri
+
+    Döndürür:
+    --------
+    str
+        Kaydedilen dosyanın yolu
+    """
+    print("\n" + "="*60)
+    print(f"MODÜL 12: TFLite DIŞA AKTARMA ({quantization})")
+    print("="*60)
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if quantization == 'float16':
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == 'dynamic':
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    elif quantization == 'int8':
+        if calibration_data is None:
+            raise ValueError("'int8' nicemleme için calibration_data gerekli")
+        rng = np.random.default_rng(seed)
+        count = min(num_calibration_samples, len(calibration_data))
+        indices = np.sort(rng.choice(len(calibration_data), size=count, replace=False))
+        samples = np.asarray(calibration_data[indices], dtype=np.float32)
+
+        def representative_dataset():
+            for sample in samples:
+                yield [sample[np.newaxis]]
+
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        print(f"  - Kalibrasyon: {count} eğitim örneği")
+    elif quantization != 'none':
+        raise ValueError(f"Geçersiz nicemleme tipi: {quantization}")
+
+    tflite_model = converter.convert()
+    with open(output_path, 'wb') as f:
+        f.write(tflite_model)
+
+    print(f"✓ TFLite modeli kaydedildi: {output_path} ({len(tflite_model) / 1024:.1f} KB)")
+    return output_path
+
+
+def export_onnx(model, output_path, opset=13):
+    """
+    Keras modelini ONNX formatına dönüştürür (tf2onnx kurulu olmalıdır).
+
+    Döndürür:
+    --------
+    str
+        Kaydedilen dosyanın yolu
+    """
+    try:
+        import tf2onnx
+    except ImportError as exc:
+        raise ImportError("ONNX dışa aktarma için tf2onnx kurulu olmalı "
+                          "(pip install tf2onnx)") from exc
+
+    spec = (tf.TensorSpec((None,) + tuple(model.input_shape[1:]), tf.float32, name='input'),)
+    tf2onnx.convert.from_keras(model, input_signature=spec, opset=opset, output_path=output_path)
+    print(f"✓ ONNX modeli kaydedildi: {output_path}")
+    return output_path
+
+
+class TFLitePredictor:
+    """
+    TFLite interpreter'ını Keras modeli gibi kullanılabilir hale getirir.
+
+    Parametreler:
+    ------------
+    model_path : str
+        .tflite dosya yolu
+    num_threads : int
+        Interpreter'ın kullanacağı CPU thread sayısı
+    batch_size : int
+        Interpreter girişinin sabitlendiği batch boyutu (son eksik batch
+        doldurulur, böylece tensörler yeniden boyutlandırılmaz)
+    """
+
+    def __init__(self, model_path, num_threads=4, batch_size=256):
+        self.model_path = model_path
+        self.batch_size = batch_size
+        self.interpreter = tf.lite.Interpreter(model_path=model_path, num_threads=num_threads)
+        input_details = self.interpreter.get_input_details()[0]
+        self._input_index = input_details['index']
+        self._input_dtype = input_details['dtype']
+        self._input_quant = input_details.get('quantization', (0.0, 0))
+        output_details = self.interpreter.get_output_details()[0]
+        self._output_index = output_details['index']
+        self._output_quant = output_details.get('quantization', (0.0, 0))
+        shape = list(input_details['shape'])
+        shape[0] = batch_size
+        self.interpreter.resize_tensor_input(self._input_index, shape)
+        self.interpreter.allocate_tensors()
+
+    def _prepare(self, batch):
+        scale, zero_point = self._input_quant
+        if np.issubdtype(self._input_dtype, np.integer) and scale:
+            batch = np.round(np.asarray(batch, dtype=np.float32) / scale + zero_point)
+        return np.asarray(batch, dtype=self._input_dtype)
+
+    def _dequantize(self, output):
+        scale, zero_point = self._output_quant
+        if np.issubdtype(output.dtype, np.integer) and scale:
+            return (output.astype(np.float32) - zero_point) * scale
+        return output
+
+    def predict_on_batch(self, batch):
+        """Batch için olasılıkları döndürür (batch_size'dan büyük batch'ler parçalara bölünür)."""
+        count = len(batch)
+        if count > self.batch_size:
+            return np.concatenate([self.predict_on_batch(batch[start:start + self.batch_size])
+                                   for start in range(0, count, self.batch_size)])
+        batch = self._prepare(batch)
+        if count < self.batch_size:
+            padding = np.zeros((self.batch_size - count,) + batch.shape[1:], dtype=batch.dtype)
+            batch = np.concatenate([batch, padding])
+        self.interpreter.set_tensor(self._input_index, batch)
+        self.interpreter.invoke()
+        output = self.interpreter.get_tensor(self._output_index)[:count]
+        return self._dequantize(output)
+
+    def predict(self, X, batch_size=None, verbose=0):
+        """Keras model.predict() ile aynı şekilde tüm diziyi tahmin eder."""
+        outputs = [self.predict_on_batch(X[start:start + self.batch_size])
+                   for start in range(0, len(X), self.batch_size)]
+        return np.concatenate(outputs)
+
+
+def measure_latency(model, X, batch_size, repeats=3, single_samples=20):
+    """
+    predict_on_batch() ile görüntü başına ve tek görüntü gecikmesini ölçer.
+
+    Parametreler:
+    ------------
+    model : keras.Model veya TFLitePredictor
+        predict_on_batch() metoduna sahip herhangi bir nesne
+    X : numpy array
+        Ölçümde kullanılacak görüntüler
+    batch_size : int
+        Tahmin batch boyutu
+    repeats : int
+        X üzerinden tam geçiş tekrarı (en iyisi alınır)
+    single_samples : int
+        Tek görüntü gecikmesi için denenecek görüntü sayısı (en iyisi alınır)
+
+    Döndürür:
+    --------
+    ms_per_image, single_ms : float, float
+        Batch'li tahminde görüntü başına gecikme ve tek görüntü gecikmesi (ms)
+    """
+    model.predict_on_batch(X[:batch_size])  # Isınma
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for offset in range(0, len(X), batch_size):
+            model.predict_on_batch(X[offset:offset + batch_size])
+        best = min(best, time.perf_counter() - start)
+    single = float('inf')
+    for i in range(min(len(X), single_samples)):
+        start = time.perf_counter()
+        model.predict_on_batch(X[i:i + 1])
+        single = min(single, time.perf_counter() - start)
+    return best / len(X) * 1000.0, single * 1000.0
+
+
+def compare_tflite_with_keras(model, tflite_path, X_val, Y_val, keras_model_path=None,
+                              num_threads=4, batch_size=256):
+    """
+    TFLite modelini Keras modeliyle doğrulama seti üzerinde karşılaştırır.
+
+    Parametreler:
+    ------------
+    model : keras.Model
+        Referans Keras modeli
+    tflite_path : str
+        .tflite dosya yolu
+    X_val, Y_val : numpy arrays
+        Doğrulama görüntüleri ve etiketleri (one-hot veya tamsayı)
+    keras_model_path : str, optional
+        Boyut karşılaştırması için Keras checkpoint'i (None ise parametre
+        sayısından float32 boyutu tahmin edilir)
+    num_threads : int
+        TFLite interpreter thread sayısı
+    batch_size : int
+        Tahmin batch boyutu
+
+    Döndürür:
+    --------
+    dict
+        Doğruluk, doğruluk farkı, gecikme ve model boyutu değerleri
+    """
+    print("\n" + "="*60)
+    print("MODÜL 12: TFLite - KERAS KARŞILAŞTIRMASI")
+    print("="*60)
+
+    predictor = TFLitePredictor(tflite_path, num_threads=num_threads, batch_size=batch_size)
+    y_true = to_class_ids(Y_val)
+
+    keras_predict = lambda X: model.predict(X, batch_size=batch_size, verbose=0)
+    keras_accuracy = float(np.mean(np.argmax(keras_predict(X_val), axis=1) == y_true))
+    tflite_accuracy = float(np.mean(np.argmax(predictor.predict(X_val), axis=1) == y_true))
+
+    if keras_model_path and os.path.exists(keras_model_path):
+        keras_size = os.path.getsize(keras_model_path)
+    else:
+        keras_size = model.count_params() * 4
+
+    results = {
+        'keras_accuracy': keras_accuracy,
+        'tflite_accuracy': tflite_accuracy,
+        'accuracy_delta': tflite_accuracy - keras_accuracy,
+        'keras_latency_ms': measure_latency(model, X_val, batch_size)[0],
+        'tflite_latency_ms': measure_latency(predictor, X_val, batch_size)[0],
+        'keras_size_bytes': keras_size,
+        'tflite_size_bytes': os.path.getsize(tflite_path),
+    }
+
+    print(f"✓ Karşılaştırma sonuçları ({len(X_val)} doğrulama örneği):")
+    print(f"  - Keras accuracy:  {keras_accuracy:.4f}")
+    print(f"  - TFLite accuracy: {tflite_accuracy:.4f} (fark: {results['accuracy_delta']*100:+.2f} puan)")
+    print(f"  - Gecikme (görüntü başına): Keras {results['keras_latency_ms']:.4f} ms, "
+          f"TFLite {results['tflite_latency_ms']:.4f} ms ({num_threads} thread)")
+    print(f"  - Model boyutu: Keras {keras_size / 1024:.1f} KB, "
+          f"TFLite {results['tflite_size_bytes'] / 1024:.1f} KB")
+
+    return results
@@ -6,7 +6,7 @@
 def train_model(model, X_train, Y_train, X_val, Y_val,
                 train_generator=None, 
                 epochs=50, steps_per_epoch=None, batch_size=32,
-                use_augmentation=True, callbacks=None):
+                use_augmentation=True, callbacks=None, initial_epoch=0, verbose=1):
     """
     Modeli eğitir.
     
@@ -18,12 +18,12 @@ def train_model(model, X_train, Y_train, X_val, Y_val,
         Eğitim görüntüleri
     Y_train : numpy array
         Eğitim etiketleri
-    X_val : numpy array
-        Doğrulama görüntüleri
+    X_val : numpy array veya tf.data.Dataset
+        Doğrulama görüntüleri (Y_val None ise (X, Y) üreten doğrulama dataset'i)
     Y_val : numpy array
         Doğrulama etiketleri
-    train_generator : NumpyArrayIterator, optional
-        Eğitim veri generator'ı (augmentation ile)
+    train_generator : NumpyArrayIterator veya tf.data.Dataset, optional
+        Eğitim veri generator'ı (augmentation veya akış veri kaynağı ile)
     epochs : int
         Epoch sayısı
     steps_per_epoch : int
@@ -34,6 +34,12 @@ def train_model(model, X_train, Y_train, X_val, Y_val,
         Veri artırma kullanılsın mı?
     callbacks : list
         Callback listesi
+    initial_epoch : int
+        Eğitime devam edilecek epoch (epochs, toplam epoch sayısıdır; ör.
+        kaydedilmiş bir modelle 3. epoch'tan 9. epoch'a kadar devam etmek için
+        initial_epoch=3, epochs=9)
+    verbose : int
+        model.fit() ilerleme çıktısı (0: sessiz, 1: ilerleme çubuğu)
     
     Döndürür:
     --------
@@ -44,8 +50,12 @@ def train_model(model, X_train, Y_train, X_val, Y_val,
     print("MODÜL 7: MODEL EĞİTİMİ")
     print("="*60)
     
-    if steps_per_epoch is None:
+    is_dataset = hasattr(train_generator, 'element_spec')
+    validation_data = X_val if Y_val is None else (X_val, Y_val)
+    
+    if steps_per_epoch is None and not is_dataset:
         # Eğitim verisi boyutundan steps_per_epoch hesapla
+        # (tf.data dataset'lerinde fit, dataset bitene kadar bir epoch sayar)
         if use_augmentation and train_generator is not None:
             steps_per_epoch = len(train_generator) if hasattr(train_generator, '__len__') else X_train.shape[0] // batch_size
         else:
@@ -57,16 +67,32 @@ def train_model(model, X_train, Y_train, X_val, Y_val,
     print(f"  - Steps per epoch: {steps_per_epoch}")
     print(f"  - Veri artırma: {'Evet' if use_augmentation else 'Hayır'}")
     
-    if use_augmentation and train_generator is not None:
+    if is_dataset:
+        # tf.data veri kaynağı ile eğitim (akış veya tf.data augmentation)
+        print("\ntf.data veri kaynağı ile eğitim başlatılıyor...")
+        history = model.fit(
+            train_generator,
+            steps_per_epoch=steps_per_epoch,
+            epochs=epochs,
+            validation_data=validation_data,
+            callbacks=callbacks,
+            initial_epoch=initial_epoch,
+            verbose=verbose
+        )
+    elif use_augmentation and train_generator is not None:
         # Veri artırma ile eğitim
         print("\nVeri artırma ile eğitim başlatılıyor...")
+        # Generator'lar sırayı kendileri karıştırır; fit batch indekslerini
+        # sırayla istemeli (NumPy halka tamponu sıradaki batch'leri hazırlar)
         history = model.fit(
             train_generator,
             steps_per_epoch=steps_per_epoch,
             epochs=epochs,
-            validation_data=(X_val, Y_val),
+            shuffle=False,
+            validation_data=validation_data,
             callbacks=callbacks,
-            verbose=1
+            initial_epoch=initial_epoch,
+            verbose=verbose
         )
     else:
         # Normal eğitim (veri artırma olmadan)
@@ -75,9 +101,10 @@ def train_model(model, X_train, Y_train, X_val, Y_val,
             X_train, Y_train,
             batch_size=batch_size,
             epochs=epochs,
-            validation_data=(X_val, Y_val),
+            validation_data=validation_data,
             callbacks=callbacks,
-            verbose=1
+            initial_epoch=initial_epoch,
+            verbose=verbose
         )
     
     print("\n✓ Model eğitimi tamamlandı!")
@@ -0,0 +1,331 @@
+# ============================================================================
+# MODÜL 4b: NUMPY/SCIPY TABANLI VERİ ARTIRMA (ÇOK SÜREÇLİ)
+# ============================================================================
+# tf.data kullanılamayan veya ayarlanamayan ortamlar için ImageDataGenerator
+# yerine geçen veri artırma motoru:
+#   - Her örnek için bir afin matris üretilir ve tüm batch tek bir
+#     scipy.ndimage.map_coordinates çağrısıyla dönüştürülür
+#   - multiprocessing işçileri, augment edilmiş batch'leri paylaşımlı bellekte
+#     (shared memory) tutulan bir halka tampona (ring buffer) önceden doldurur
+#   - create_data_generator(backend='numpy') ile seçilir
+# ============================================================================
+
+import math
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+from scipy import ndimage
+from tensorflow.keras.utils import Sequence
+
+
+def random_affine_matrices(batch_size, height, width, rotation_range=5, width_shift_range=0.1,
+                           height_shift_range=0.1, zoom_range=0.1, rng=None):
+    """
+    Batch'teki her örnek için rastgele bir afin matris üretir.
+
+    Matrisler çıkış pikselinin (satır, sütun) koordinatını giriş görüntüsündeki
+    koordinata eşler. Parametrelerin anlamı ImageDataGenerator ile aynıdır.
+
+    Döndürür:
+    --------
+    numpy array
+        (batch_size, 2, 3) boyutunda afin matrisler
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+
+    theta = np.deg2rad(rng.uniform(-rotation_range, rotation_range, batch_size))
+    tx = rng.uniform(-1, 1, batch_size) * (width_shift_range * width if width_shift_range < 1
+                                           else width_shift_range)
+    ty = rng.uniform(-1, 1, batch_size) * (height_shift_range * height if height_shift_range < 1
+                                           else height_shift_range)
+    zx = rng.uniform(1 - zoom_range, 1 + zoom_range, batch_size)
+    zy = rng.uniform(1 - zoom_range, 1 + zoom_range, batch_size)
+
+    cos, sin = np.cos(theta), np.sin(theta)
+    matrices = np.empty((batch_size, 2, 3))
+    # (satır, sütun) düzeninde döndürme @ yakınlaştırma
+    matrices[:, 0, 0] = cos * zy
+    matrices[:, 0, 1] = sin * zx
+    matrices[:, 1, 0] = -sin * zy
+    matrices[:, 1, 1] = cos * zx
+
+    # Dönüşüm görüntü merkezi etrafında uygulanır, ardından kaydırma eklenir
+    cy, cx = (height - 1) / 2.0, (width - 1) / 2.0
+    matrices[:, 0, 2] = cy + ty - matrices[:, 0, 0] * cy - matrices[:, 0, 1] * cx
+    matrices[:, 1, 2] = cx + tx - matrices[:, 1, 0] * cy - matrices[:, 1, 1] * cx
+    return matrices
+
+
+def warp_batch(images, matrices, order=1, mode='nearest', output=None):
+    """
+    Tüm batch'i tek bir map_coordinates çağrısıyla afin olarak dönüştürür.
+
+    Parametreler:
+    ------------
+    images : numpy array
+        (batch, yükseklik, genişlik, kanal) görüntüler
+    matrices : numpy array
+        random_affine_matrices() ile üretilmiş (batch, 2, 3) matrisler
+    order : int
+        İnterpolasyon derecesi (1 = bilinear)
+    mode : str
+        Görüntü dışına düşen pikseller için doldurma modu
+    output : numpy array, optional
+        Sonucun yazılacağı float32 dizi (ör. paylaşımlı bellek görünümü)
+
+    Döndürür:
+    --------
+    numpy array
+        Dönüştürülmüş float32 görüntüler
+    """
+    batch, height, width, channels = images.shape
+    rows, cols = np.meshgrid(np.arange(height), np.arange(width), indexing='ij')
+
+    src_rows = (matrices[:, 0, 0, None, None] * rows + matrices[:, 0, 1, None, None] * cols
+                + matrices[:, 0, 2, None, None])
+    src_cols = (matrices[:, 1, 0, None, None] * rows + matrices[:, 1, 1, None, None] * cols
+                + matrices[:, 1, 2, None, None])
+
+    shape = (batch, height, width, channels)
+    coords = np.empty((4,) + shape)
+    coords[0] = np.arange(batch)[:, None, None, None]
+    coords[1] = src_rows[..., None]
+    coords[2] = src_cols[..., None]
+    coords[3] = np.arange(channels)
+
+    if output is None:
+        output = np.empty(shape, dtype=np.float32)
+    ndimage.map_coordinates(images.astype(np.float32, copy=False), coords,
+                            output=output.reshape(shape), order=order, mode=mode)
+    return output
+
+
+def _augmentation_worker(x_name, x_shape, x_dtype, ring_name, ring_shape, params, tasks, done):
+    """
+    İşçi süreç döngüsü: görevleri alır, batch'i augment edip halka tampondaki
+    yuvaya yazar ve tamamlandığını bildirir.
+    """
+    x_shm = shared_memory.SharedMemory(name=x_name)
+    ring_shm = shared_memory.SharedMemory(name=ring_name)
+    X = np.ndarray(x_shape, dtype=x_dtype, buffer=x_shm.buf)
+    ring = np.ndarray(ring_shape, dtype=np.float32, buffer=ring_shm.buf)
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            epoch, index, slot, indices, seed = task
+            images = X[indices]
+            rng = np.random.default_rng(seed)
+            matrices = random_affine_matrices(len(images), x_shape[1], x_shape[2], rng=rng, **params)
+            warp_batch(images, matrices, output=ring[slot, :len(images)])
+            done.put((epoch, index, slot, len(images)))
+    finally:
+        del X, ring
+        x_shm.close()
+        ring_shm.close()
+
+
+class NumpyAugmenter:
+    """
+    ImageDataGenerator ile aynı arayüze (fit/flow) sahip NumPy/SciPy veri
+    artırma motoru.
+
+    Parametreler:
+    ------------
+    rotation_range, width_shift_range, height_shift_range, zoom_range : float
+        ImageDataGenerator ile aynı veri artırma ayarları
+    num_workers : int
+        Arka planda batch hazırlayan süreç sayısı (0 = ana süreçte senkron)
+    prefetch_batches : int
+        Halka tampondaki yuva sayısı (önceden hazırlanacak batch sayısı)
+    seed : int, optional
+        Rastgelelik için seed değeri
+    """
+
+    def __init__(self, rotation_range=5, width_shift_range=0.1, height_shift_range=0.1,
+                 zoom_range=0.1, num_workers=0, prefetch_batches=8, seed=None):
+        self.params = dict(rotation_range=rotation_range,
+                           width_shift_range=width_shift_range,
+                           height_shift_range=height_shift_range,
+                           zoom_range=zoom_range)
+        self.num_workers = num_workers
+        self.prefetch_batches = prefetch_batches
+        self.seed = seed
+
+    def fit(self, X):
+        """Veri seti istatistiği gerektiren bir ayar olmadığı için hiçbir şey yapmaz."""
+        return self
+
+    def random_transform_batch(self, images, rng=None):
+        """Bir batch görüntüyü rastgele dönüştürür (ana süreçte, senkron)."""
+        matrices = random_affine_matrices(len(images), images.shape[1], images.shape[2],
+                                          rng=rng, **self.params)
+        return warp_batch(images, matrices)
+
+    def flow(self, X, Y, batch_size=32, shuffle=True):
+        """
+        Augment edilmiş (X, Y) batch'leri üreten bir Sequence döndürür.
+
+        Döndürür:
+        --------
+        NumpyAugmentationIterator
+            model.fit() ile doğrudan kullanılabilen batch kaynağı
+        """
+        return NumpyAugmentationIterator(self, X, Y, batch_size=batch_size, shuffle=shuffle)
+
+
+class NumpyAugmentationIterator(Sequence):
+    """
+    NumpyAugmenter.flow() tarafından döndürülen batch kaynağı.
+
+    num_workers > 0 ise X paylaşımlı belleğe bir kez kopyalanır ve işçiler
+    sıradaki batch'leri halka tampona önceden yazar; __getitem__ sadece hazır
+    yuvayı kopyalar. Karıştırma Sequence içinde yapılır (batch indeksleri sırayla
+    istenmeli, fit(shuffle=False)); sıra dışı bir indeks istenirse batch ana
+    süreçte hesaplanır ve o indeks için işçi sonucu beklenmeden atılır.
+    """
+
+    def __init__(self, augmenter, X, Y, batch_size=32, shuffle=True):
+        super().__init__()
+        self.augmenter = augmenter
+        self.X = X
+        self.Y = Y
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.epoch = 0
+        self._base_seed = augmenter.seed if augmenter.seed is not None else np.random.SeedSequence().entropy
+        self._order = self._make_order()
+        self._workers = []
+        if augmenter.num_workers > 0:
+            self._start_workers()
+
+    def __len__(self):
+        return math.ceil(len(self.X) / self.batch_size)
+
+    def _make_order(self):
+        if not self.shuffle:
+            return np.arange(len(self.X))
+        return np.random.default_rng([self._base_seed % (1 << 63), self.epoch]).permutation(len(self.X))
+
+    def _batch_indices(self, index):
+        return np.sort(self._order[index * self.batch_size:(index + 1) * self.batch_size])
+
+    def _batch_seed(self, index):
+        return [self._base_seed % (1 << 63), self.epoch, index]
+
+    # --- Çok süreçli halka tampon ------------------------------------------
+
+    def _start_workers(self):
+        X = np.ascontiguousarray(self.X)
+        self._x_shm = shared_memory.SharedMemory(create=True, size=max(X.nbytes, 1))
+        np.ndarray(X.shape, dtype=X.dtype, buffer=self._x_shm.buf)[...] = X
+
+        slots = max(1, self.augmenter.prefetch_batches)
+        self._ring_shape = (slots, self.batch_size) + X.shape[1:]
+        ring_bytes = int(np.prod(self._ring_shape)) * np.dtype(np.float32).itemsize
+        self._ring_shm = shared_memory.SharedMemory(create=True, size=ring_bytes)
+        self._ring = np.ndarray(self._ring_shape, dtype=np.float32, buffer=self._ring_shm.buf)
+
+        ctx = mp.get_context()
+        self._tasks = ctx.Queue()
+        self._done = ctx.Queue()
+        for _ in range(self.augmenter.num_workers):
+            worker = ctx.Process(
+                target=_augmentation_worker,
+                args=(self._x_shm.name, X.shape, X.dtype.str, self._ring_shm.name,
+                      self._ring_shape, self.augmenter.params, self._tasks, self._done),
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        self._free_slots = list(range(slots))
+        self._pending = {}    # batch indeksi -> yuva
+        self._ready = {}      # batch indeksi -> (yuva, örnek sayısı)
+        self._served = set()  # Ana süreçte (senkron) hesaplanmış batch indeksleri
+        self._next_submit = 0
+        self._fill_ring()
+
+    def _fill_ring(self):
+        while self._free_slots and self._next_submit < len(self):
+            index = self._next_submit
+            if index in self._served:
+                self._next_submit += 1
+                continue
+            slot = self._free_slots.pop()
+            self._tasks.put((self.epoch, index, slot, self._batch_indices(index),
+                             self._batch_seed(index)))
+            self._pending[index] = slot
+            self._next_submit += 1
+
+    def _wait_for(self, index):
+        while index not in self._ready:
+            epoch, done_index, slot, count = self._done.get()
+            if epoch != self.epoch:
+                # Önceki epoch'tan kalan görev: yuvayı serbest bırak
+                self._free_slots.append(slot)
+                continue
+            self._pending.pop(done_index, None)
+            if done_index in self._served:
+                # Bu batch zaten ana süreçte üretildi; yuva tüketilmeyecek
+                self._free_slots.append(slot)
+                continue
+            self._ready[done_index] = (slot, count)
+        return self._ready.pop(index)
+
+    # --- Sequence arayüzü ---------------------------------------------------
+
+    def __getitem__(self, index):
+        indices = self._batch_indices(index)
+        if self._workers and (index in self._pending or index in self._ready):
+            slot, count = self._wait_for(index)
+            X_batch = self._ring[slot, :count].copy()
+            self._free_slots.append(slot)
+            self._fill_ring()
+        else:
+            rng = np.random.default_rng(self._batch_seed(index))
+            X_batch = self.augmenter.random_transform_batch(self.X[indices], rng=rng)
+            if self._workers:
+                self._served.add(index)
+        return X_batch, self.Y[indices]
+
+    def on_epoch_end(self):
+        if self._workers:
+            # Bu epoch'a ait bekleyen görevlerin yuvalarını geri topla
+            while self._pending:
+                epoch, done_index, slot, _ = self._done.get()
+                self._pending.pop(done_index, None)
+                self._free_slots.append(slot)
+            for slot, _ in self._ready.values():
+                self._free_slots.append(slot)
+            self._ready.clear()
+            self._served.clear()
+        self.epoch += 1
+        self._order = self._make_order()
+        if self._workers:
+            self._next_submit = 0
+            self._fill_ring()
+
+    def close(self):
+        """İşçi süreçleri durdurur ve paylaşımlı belleği serbest bırakır."""
+        if not self._workers:
+            return
+        for _ in self._workers:
+            self._tasks.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self._workers = []
+        del self._ring
+        for shm in (self._x_shm, self._ring_shm):
+            shm.close()
+            shm.unlink()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,205 @@
+# ============================================================================
+# MODÜL 13: AŞAMA ÖNBELLEĞİ (İÇERİK ADRESLİ ARTEFAKTLAR)
+# ============================================================================
+# run_complete_pipeline() aşamalarının (veri, eğitim, değerlendirme, tahmin)
+# çıktılarını diske kaydeder. Her artefakt, aşamayı etkileyen config
+# değerleri, girdi dosyalarının hash'leri ve önceki aşamanın çıktı özetinden
+# (digest) türetilen bir anahtarla saklanır:
+#
+#   artifacts/<aşama>/<anahtar>/
+#       meta.json        anahtar girdileri, çıktı özeti, oluşturulma zamanı
+#       ...              aşamanın dosyaları (.npy, model, .json, .csv)
+#
+# Girdileri değişmeyen aşama atlanıp önbellekten yüklenir. Bir aşama yeniden
+# çalıştırılırsa çıktı özeti değişir ve ona bağlı aşamalar da otomatik olarak
+# yeniden çalışır.
+# ============================================================================
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+from contextlib import contextmanager
+
+STAGES = ('data', 'train', 'eval', 'predict')
+
+
+def hash_inputs(inputs):
+    """Girdi sözlüğünden kararlı (sıralı JSON) bir SHA-256 anahtarı üretir."""
+    payload = json.dumps(inputs, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:20]
+
+
+def hash_directory(path, exclude=('meta.json',)):
+    """Klasördeki dosyaların (isim + içerik) birleşik SHA-256 özetini hesaplar."""
+    digest = hashlib.sha256()
+    for root, _, files in sorted(os.walk(path)):
+        for name in sorted(files):
+            if name in exclude:
+                continue
+            file_path = os.path.join(root, name)
+            digest.update(os.path.relpath(file_path, path).encode('utf-8'))
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+    return digest.hexdigest()[:20]
+
+
+class ArtifactStore:
+    """
+    Aşama artefaktlarını içerik adresli klasörlerde saklar.
+
+    Parametreler:
+    ------------
+    root : str
+        Artefaktların kök klasörü
+    """
+
+    def __init__(self, root='artifacts'):
+        self.root = root
+        self._fingerprints_path = os.path.join(root, 'file_hashes.json')
+        self._fingerprints = None
+
+    def file_hash(self, path):
+        """
+        Dosyanın SHA-256 özetini döndürür.
+
+        Özetler boyut ve mtime ile birlikte saklanır; dosya değişmediyse
+        tekrar okunmaz.
+        """
+        if self._fingerprints is None:
+            try:
+                with open(self._fingerprints_path) as f:
+                    self._fingerprints = json.load(f)
+            except (OSError, ValueError):
+                self._fingerprints = {}
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        cached = self._fingerprints.get(key)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        self._fingerprints[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                                   'sha256': digest.hexdigest()}
+        os.makedirs(self.root, exist_ok=True)
+        with open(self._fingerprints_path, 'w') as f:
+            json.dump(self._fingerprints, f, indent=2)
+        return digest.hexdigest()
+
+    def path(self, stage, key):
+        return os.path.join(self.root, stage, key)
+
+    def load_meta(self, stage, key):
+        """Artefakt tamamlanmışsa meta bilgisini, yoksa None döndürür."""
+        try:
+            with open(os.path.join(self.path(stage, key), 'meta.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @contextmanager
+    def writing(self, stage, key, inputs):
+        """
+        Artefaktı geçici bir klasöre yazdırır; blok hatasız biterse özetini
+        hesaplayıp klasörü atomik olarak yerine taşır.
+
+        Kullanım:
+        --------
+        >>> with store.writing('eval', key, inputs) as directory:
+        ...     np.save(os.path.join(directory, 'cm.npy'), cm)
+        """
+        stage_dir = os.path.join(self.root, stage)
+        os.makedirs(stage_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f'.{key}.', dir=stage_dir)
+        try:
+            yield tmp_dir
+            meta = {'stage': stage, 'key': key, 'inputs': inputs,
+                    'digest': hash_directory(tmp_dir), 'created': time.time()}
+            with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+                json.dump(meta, f, indent=2, default=str)
+            final_dir = self.path(stage, key)
+            if os.path.exists(final_dir):
+                shutil.rmtree(final_dir)
+            os.replace(tmp_dir, final_dir)
+        finally:
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir)
+
+    def invalidate(self, stage):
+        """Aşamanın tüm artefaktlarını siler."""
+        stage_dir = os.path.join(self.root, stage)
+        if os.path.exists(stage_dir):
+            shutil.rmtree(stage_dir)
+            print(f"  ✓ '{stage}' aşamasının önbelleği silindi")
+
+
+def save_results(directory, results):
+    """Sözlükteki dizileri .npy, diğer değerleri results.json olarak kaydeder."""
+    import numpy as np
+
+    scalars = {}
+    for name, value in results.items():
+        if isinstance(value, np.ndarray):
+            np.save(os.path.join(directory, f'{name}.npy'), value)
+        elif isinstance(value, np.generic):
+            scalars[name] = value.item()
+        else:
+            scalars[name] = value
+    with open(os.path.join(directory, 'results.json'), 'w') as f:
+        json.dump(scalars, f, indent=2)
+
+
+def load_results(directory, mmap_mode=None):
+    """save_results() ile kaydedilmiş sözlüğü geri yükler."""
+    import numpy as np
+
+    with open(os.path.join(directory, 'results.json')) as f:
+        results = json.load(f)
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.npy'):
+            results[name[:-4]] = np.load(os.path.join(directory, name), mmap_mode=mmap_mode)
+    return results
+
+
+def run_stage(store, stage, inputs, compute, save, load):
+    """
+    Aşamayı önbellekli olarak çalıştırır.
+
+    Parametreler:
+    ------------
+    store : ArtifactStore
+        Artefakt deposu
+    stage : str
+        Aşama adı ('data', 'train', 'eval', 'predict')
+    inputs : dict
+        Aşamanın sonucunu belirleyen girdiler (config değerleri, dosya
+        hash'leri, önceki aşamanın özeti)
+    compute : callable
+        compute() -> sonuç; önbellekte yoksa çağrılır
+    save : callable
+        save(klasör, sonuç); sonucu artefakt klasörüne yazar
+    load : callable
+        load(klasör) -> sonuç; artefakttan sonucu yükler
+
+    Döndürür:
+    --------
+    result, digest : any, str
+        Aşamanın sonucu ve çıktı özeti (sonraki aşamaların girdisi)
+    """
+    key = hash_inputs(inputs)
+    meta = store.load_meta(stage, key)
+    if meta is not None:
+        print(f"\n✓ '{stage}' aşaması önbellekten yüklendi ({store.path(stage, key)})")
+        return load(store.path(stage, key)), meta['digest']
+
+    result = compute()
+    with store.writing(stage, key, inputs) as directory:
+        save(directory, result)
+    print(f"\n✓ '{stage}' aşamasının çıktısı önbelleğe kaydedildi ({store.path(stage, key)})")
+    return result, store.load_meta(stage, key)['digest']
@@ -0,0 +1,264 @@
+# ============================================================================
+# MODÜL 14: GRAFİK ÇIKTISI (HEADLESS / ARKA PLAN ÇİZİMİ)
+# ============================================================================
+# Görselleştirme modülleri (3, 8, 9) grafiklerini bu modül üzerinden üretir.
+# Çizim modları:
+#   'show'     : figür plt.show() ile ekranda gösterilir (akış pencere
+#                kapanana kadar bekler - önceki davranış)
+#   'headless' : figür Agg backend ile arka plan thread'inde PNG/SVG olarak
+#                kaydedilir; eğitim akışı beklemeden devam eder
+#   'off'      : hiç çizim yapılmaz
+#   'auto'     : ekran varsa 'show', yoksa 'headless'
+#
+# Her çalıştırmanın sonunda finish_plotting() çizim sürelerini ve akışın
+# grafikler için beklemediği (kazanılan) süreyi raporlar.
+# ============================================================================
+
+import os
+import sys
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+PLOT_MODES = ('auto', 'show', 'headless', 'off')
+TIMINGS_FILE = 'plot_timings.json'
+
+
+def _has_display():
+    """Linux'ta X11/Wayland ekranı var mı? (diğer platformlarda her zaman True)"""
+    if sys.platform.startswith('linux'):
+        return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return True
+
+
+def resolve_plot_mode(mode):
+    """'auto' modunu ortama göre 'show' veya 'headless' olarak çözer."""
+    if mode not in PLOT_MODES:
+        raise ValueError(f"Geçersiz çizim modu: {mode} (seçenekler: {', '.join(PLOT_MODES)})")
+    if mode == 'auto':
+        return 'show' if _has_display() else 'headless'
+    return mode
+
+
+class PlotRenderer:
+    """
+    Figürleri seçilen moda göre gösterir, arka planda dosyaya yazar veya atlar.
+
+    Parametreler:
+    ------------
+    mode : str
+        'auto', 'show', 'headless' veya 'off'
+    output_dir : str
+        'headless' modunda figürlerin kaydedileceği klasör
+    fmt : str
+        Dosya formatı ('png' veya 'svg')
+    dpi : int
+        Kayıt çözünürlüğü
+    """
+
+    def __init__(self, mode='auto', output_dir='plots', fmt='png', dpi=100):
+        self.mode = resolve_plot_mode(mode)
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.dpi = dpi
+        self._executor = None
+        self._futures = []
+        self._records = {}
+        self._lock = threading.Lock()
+
+        if self.mode == 'headless':
+            # Etkileşimsiz backend: gözden kaçan bir plt.show() bile akışı bloklamaz
+            import matplotlib
+            matplotlib.use('Agg', force=True)
+
+    def _record(self, name, **values):
+        with self._lock:
+            self._records.setdefault(name, {'blocked': 0.0, 'render': None, 'path': None})
+            self._records[name].update(values)
+
+    def submit(self, name, figsize, draw, *args):
+        """
+        Bir figürü çizdirir.
+
+        Parametreler:
+        ------------
+        name : str
+            Figür adı (dosya adı olarak da kullanılır)
+        figsize : tuple
+            Figür boyutu (inç)
+        draw : callable
+            draw(fig, *args); verilen matplotlib Figure üzerine çizim yapar.
+            Arka plan thread'inde çalışabileceği için pyplot kullanmamalıdır
+        *args
+            draw fonksiyonuna aktarılacak veriler (çağıran taraf değişmeyecek
+            kopyalar vermelidir)
+
+        Döndürür:
+        --------
+        concurrent.futures.Future veya None
+            'headless' modunda kaydedilen dosya yolunu taşıyan Future
+        """
+        start = time.perf_counter()
+        if self.mode == 'off':
+            self._record(name)
+            print(f"  - Grafik atlandı: {name}")
+            return None
+
+        if self.mode == 'show':
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=figsize)
+            draw(fig, *args)
+            plt.show()
+            elapsed = time.perf_counter() - start
+            self._record(name, blocked=elapsed, render=elapsed)
+            return None
+
+        if self._executor is None:
+            os.makedirs(self.output_dir, exist_ok=True)
+            # Tek işçi: seaborn/matplotlib durumu thread'ler arasında paylaşılmaz
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='plot')
+        path = os.path.join(self.output_dir, f'{name}.{self.fmt}')
+        future = self._executor.submit(self._render, name, path, figsize, draw, args)
+        self._futures.append(future)
+        self._record(name, blocked=time.perf_counter() - start, path=path)
+        print(f"  → {path} (arka planda çiziliyor)")
+        return future
+
+    def _render(self, name, path, figsize, draw, args):
+        from matplotlib.figure import Figure
+
+        start = time.perf_counter()
+        fig = Figure(figsize=figsize)
+        draw(fig, *args)
+        fig.savefig(path, format=self.fmt, dpi=self.dpi)
+        self._record(name, render=time.perf_counter() - start)
+        return path
+
+    def _timings_path(self):
+        return os.path.join(self.output_dir, TIMINGS_FILE)
+
+    def _load_previous_timings(self):
+        try:
+            with open(self._timings_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def finish(self, verbose=True):
+        """
+        Bekleyen çizimlerin bitmesini bekler ve süre raporu döndürür.
+
+        'headless' modunda kazanılan süre, senkron çizimde akışın bekleyeceği
+        toplam çizim süresinden akışın fiilen beklediği süre çıkarılarak
+        hesaplanır. 'off' modunda önceki 'headless' çalıştırmasında ölçülen
+        çizim süreleri kullanılır.
+
+        Döndürür:
+        --------
+        dict
+            mode, figures, render_seconds, blocked_seconds, saved_seconds
+        """
+        start = time.perf_counter()
+        for future in self._futures:
+            future.result()
+        final_wait = time.perf_counter() - start
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._futures = []
+
+        with self._lock:
+            records = {name: dict(record) for name, record in self._records.items()}
+        blocked = sum(record['blocked'] for record in records.values()) + final_wait
+
+        if self.mode == 'headless':
+            render = sum(record['render'] or 0.0 for record in records.values())
+            timings = self._load_previous_timings()
+            timings.update({name: record['render'] for name, record in records.items()})
+            with open(self._timings_path(), 'w') as f:
+                json.dump(timings, f, indent=2)
+            saved = render - blocked
+        elif self.mode == 'off':
+            timings = self._load_previous_timings()
+            known = [timings[name] for name in records if name in timings]
+            render = sum(known) if known else None
+            saved = render
+        else:
+            render = blocked
+            saved = 0.0
+
+        report = {
+            'mode': self.mode,
+            'figures': records,
+            'render_seconds': render,
+            'blocked_seconds': blocked,
+            'saved_seconds': saved,
+        }
+        if verbose and records:
+            self._print_report(report)
+        return report
+
+    def _print_report(self, report):
+        print("\n" + "="*60)
+        print(f"MODÜL 14: GRAFİK RAPORU (mod: {report['mode']})")
+        print("="*60)
+        for name, record in report['figures'].items():
+            if report['mode'] == 'off':
+                print(f"  - {name}: atlandı")
+                continue
+            print(f"  - {name}: çizim {record['render'] or 0.0:.3f} s, "
+                  f"akışta bekleme {record['blocked']:.3f} s"
+                  + (f" → {record['path']}" if record['path'] else ""))
+        if report['saved_seconds'] is None:
+            print("✓ Kazanılan süre bilinmiyor (önceki 'headless' ölçümü yok)")
+        elif report['mode'] == 'off':
+            print(f"✓ Kazanılan süre: ~{report['saved_seconds']:.3f} s "
+                  f"(son 'headless' çalıştırmadaki çizim sürelerine göre)")
+        elif report['mode'] == 'headless':
+            print(f"✓ Kazanılan süre: {report['saved_seconds']:.3f} s "
+                  f"(çizim {report['render_seconds']:.3f} s, "
+                  f"akışta toplam bekleme {report['blocked_seconds']:.3f} s)")
+        else:
+            print(f"✓ Grafikler için akışta toplam bekleme: {report['blocked_seconds']:.3f} s")
+
+
+_renderer = None
+
+
+def configure_plotting(mode='auto', output_dir='plots', fmt='png', dpi=100):
+    """
+    Tüm görselleştirme modüllerinin kullanacağı çizim modunu ayarlar.
+
+    Döndürür:
+    --------
+    PlotRenderer
+    """
+    global _renderer
+    if _renderer is not None:
+        _renderer.finish(verbose=False)
+    _renderer = PlotRenderer(mode, output_dir, fmt, dpi)
+    return _renderer
+
+
+def get_renderer():
+    """Ayarlanmış PlotRenderer'ı döndürür (ayarlanmadıysa 'auto' modunda oluşturur)."""
+    global _renderer
+    if _renderer is None:
+        _renderer = PlotRenderer()
+    return _renderer
+
+
+def submit_figure(name, figsize, draw, *args):
+    """get_renderer().submit() kısayolu."""
+    return get_renderer().submit(name, figsize, draw, *args)
+
+
+def finish_plotting(verbose=True):
+    """Bekleyen çizimleri tamamlar ve raporu döndürür (hiç çizim yoksa None)."""
+    global _renderer
+    if _renderer is None:
+        return None
+    report = _renderer.finish(verbose=verbose)
+    _renderer = None
+    return report
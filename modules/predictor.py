@@ -2,28 +2,66 @@
 # MODÜL 10: TAHMİN VE SUBMISSION
 # ============================================================================
 
+import os
+import time
+import queue
+import threading
+
 import numpy as np
 import pandas as pd
 
 
-def make_predictions(model, X_test, submission_path='submission.csv'):
+def make_predictions(model, X_test, submission_path='submission.csv',
+                     streaming=False, batch_size=1024, probabilities_path=None,
+                     tta_variants=1, tta_params=None, return_classes=False):
     """
     Test verisi üzerinde tahmin yapar ve submission dosyası oluşturur.
     
     Parametreler:
     ------------
-    model : keras.Model
-        Tahmin yapacak model
+    model : keras.Model veya TFLitePredictor
+        Tahmin yapacak model (predict/predict_on_batch metodlarına sahip nesne)
     X_test : numpy array
-        Test görüntüleri
+        Test görüntüleri (float 0-1 veya compact_dtypes modunda uint8 0-255)
     submission_path : str
         Submission dosyası kayıt yolu
+    streaming : bool
+        True ise tahminler sabit boyutlu batch'lerle yapılır ve submission
+        satırları arka plan thread'inde artımlı olarak yazılır
+        (bkz. stream_predictions)
+    batch_size : int
+        Akış modunda batch boyutu
+    probabilities_path : str, optional
+        Olasılıkların da yazılacağı .npy veya .parquet dosyası (her iki modda)
+    tta_variants : int
+        Test zamanı veri artırma varyant sayısı (1 ise TTA kapalı; bkz. TTAPredictor)
+    tta_params : dict, optional
+        TTAPredictor'a aktarılacak veri artırma ayarları (rotation_range, ...)
+    return_classes : bool
+        Akış modunda tahmin edilen sınıflar da biriktirilip döndürülsün mü?
+        (görüntü başına bir tamsayı; False ise bellek test seti boyutundan bağımsızdır)
     
     Döndürür:
     --------
-    numpy array
-        Tahmin edilen sınıflar
+    numpy array veya dict
+        Tahmin edilen sınıflar; akış modunda return_classes=False ise
+        stream_predictions() özeti (sınıflar submission dosyasından okunabilir)
     """
+    if tta_variants > 1:
+        # TFLitePredictor sabit batch boyutuyla çalışır; varyant batch'i onu aşmamalı
+        max_batch_size = getattr(model, 'batch_size', None) or batch_size
+        model = TTAPredictor(model, tta_variants, max_batch_size=max_batch_size,
+                             **(tta_params or {}))
+        print(f"\nTest zamanı veri artırma: {tta_variants} varyant "
+              f"(batch başına {model.chunk_size} görüntü x {tta_variants})")
+    
+    if streaming:
+        summary = stream_predictions(model, X_test, submission_path,
+                                     batch_size=batch_size,
+                                     probabilities_path=probabilities_path,
+                                     return_classes=return_classes)
+        return summary['predicted_classes'] if return_classes else summary
+    
     print("\n" + "="*60)
     print("MODÜL 10: TAHMİN VE SUBMISSION")
     print("="*60)
@@ -52,5 +90,256 @@ def make_predictions(model, X_test, submission_path='submission.csv'):
     
     print(f"✓ Submission dosyası kaydedildi: {submission_path}")
     
+    if probabilities_path:
+        prob_writer = _ProbabilityWriter(probabilities_path, len(predictions))
+        prob_writer.write(0, np.asarray(predictions, dtype=np.float32), predicted_classes)
+        prob_writer.close()
+        print(f"✓ Olasılıklar kaydedildi: {probabilities_path}")
+    
     return predicted_classes
 
+
+class TTAPredictor:
+    """
+    Test zamanı veri artırma (TTA) ile tahmin yapan model sarmalayıcısı.
+    
+    Her görüntünün orijinali ve num_variants - 1 rastgele döndürülmüş /
+    kaydırılmış / yakınlaştırılmış kopyası tek bir vektörel augment_batch()
+    çağrısıyla üretilir ve hepsi tek büyük batch olarak modele verilir;
+    olasılıklar varyantlar üzerinden ortalanır. Modelin gördüğü batch boyutu
+    max_batch_size ile sınırlıdır, yani bir çağrıda max_batch_size //
+    num_variants görüntü işlenir. Maliyet yaklaşık num_variants katıdır;
+    num_variants gecikme/doğruluk dengesini ayarlar.
+    
+    Parametreler:
+    ------------
+    model : keras.Model veya TFLitePredictor
+        Sarmalanan model (predict_on_batch() metoduna sahip herhangi bir nesne)
+    num_variants : int
+        Görüntü başına varyant sayısı (orijinal dahil)
+    rotation_range, width_shift_range, height_shift_range, zoom_range : float
+        create_data_generator() ile aynı veri artırma ayarları
+    max_batch_size : int
+        Modele tek seferde verilecek en fazla görüntü sayısı (varyantlar dahil)
+    seed : int, optional
+        Varyantlar için seed değeri
+    """
+    
+    def __init__(self, model, num_variants=4, rotation_range=5, width_shift_range=0.1,
+                 height_shift_range=0.1, zoom_range=0.1, max_batch_size=1024, seed=None):
+        if num_variants < 1:
+            raise ValueError(f"num_variants en az 1 olmalı: {num_variants}")
+        self.model = model
+        self.num_variants = num_variants
+        self.augmentation = dict(rotation_range=rotation_range,
+                                 width_shift_range=width_shift_range,
+                                 height_shift_range=height_shift_range,
+                                 zoom_range=zoom_range)
+        self.chunk_size = max(1, max_batch_size // num_variants)
+        self.seed = seed
+    
+    def _variants(self, batch):
+        """(num_variants * batch, ...) boyutunda orijinal + artırılmış görüntüleri üretir."""
+        from modules.data_augmentation_module import augment_batch
+        
+        batch = np.asarray(batch)
+        tiled = np.concatenate([batch] * (self.num_variants - 1))
+        augmented = augment_batch(tiled, **self.augmentation, seed=self.seed).numpy()
+        if np.issubdtype(batch.dtype, np.integer):
+            # compact_dtypes (uint8) girdisinde orijinal veri tipi korunur
+            augmented = np.clip(np.round(augmented), 0, 255)
+        return np.concatenate([batch, augmented.astype(batch.dtype)])
+    
+    def predict_on_batch(self, batch):
+        """Batch'teki her görüntü için varyantlar üzerinden ortalanmış olasılıkları döndürür."""
+        outputs = []
+        for start in range(0, len(batch), self.chunk_size):
+            chunk = batch[start:start + self.chunk_size]
+            if self.num_variants == 1:
+                outputs.append(np.asarray(self.model.predict_on_batch(chunk)))
+                continue
+            probabilities = np.asarray(self.model.predict_on_batch(self._variants(chunk)))
+            outputs.append(probabilities.reshape(self.num_variants, len(chunk), -1).mean(axis=0))
+        return np.concatenate(outputs)
+    
+    def predict(self, X, batch_size=None, verbose=0):
+        """Keras model.predict() ile aynı şekilde tüm diziyi tahmin eder."""
+        return self.predict_on_batch(X)
+
+
+def _iter_batches(X_test, batch_size):
+    """Dizi ise batch'lere böler, değilse (generator) batch'leri olduğu gibi üretir."""
+    if hasattr(X_test, 'shape'):
+        for start in range(0, len(X_test), batch_size):
+            yield X_test[start:start + batch_size]
+    else:
+        for batch in X_test:
+            yield batch[0] if isinstance(batch, tuple) else batch
+
+
+class _ProbabilityWriter:
+    """Olasılıkları .npy (memmap) veya .parquet (pyarrow) dosyasına artımlı yazar."""
+    
+    def __init__(self, path, total_rows=None):
+        self.path = path
+        self.total_rows = total_rows
+        self.format = os.path.splitext(path)[1].lower()
+        self._array = None
+        self._parquet = None
+        if self.format == '.npy' and total_rows is None:
+            raise ValueError(".npy çıktısı için toplam satır sayısı bilinmeli "
+                             "(generator girdisinde .parquet kullanın)")
+        if self.format not in ('.npy', '.parquet'):
+            raise ValueError(f"Desteklenmeyen olasılık dosyası formatı: {self.format}")
+    
+    def write(self, offset, probabilities, labels):
+        if self.format == '.npy':
+            if self._array is None:
+                self._array = np.lib.format.open_memmap(
+                    self.path, mode='w+', dtype=np.float32,
+                    shape=(self.total_rows, probabilities.shape[1]))
+            self._array[offset:offset + len(probabilities)] = probabilities
+            return
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(".parquet çıktısı için pyarrow kurulu olmalı "
+                              "(pip install pyarrow)") from exc
+        columns = {
+            'ImageId': pa.array(np.arange(offset + 1, offset + len(labels) + 1, dtype=np.int64)),
+            'Label': pa.array(labels.astype(np.int64)),
+        }
+        for c in range(probabilities.shape[1]):
+            columns[f'prob_{c}'] = pa.array(probabilities[:, c].astype(np.float32))
+        table = pa.table(columns)
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(self.path, table.schema)
+        self._parquet.write_table(table)
+    
+    def close(self):
+        if self._array is not None:
+            self._array.flush()
+            self._array = None
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+
+
+def stream_predictions(model, X_test, submission_path='submission.csv', batch_size=1024,
+                       probabilities_path=None, write_buffer_size=1 << 20, queue_size=8,
+                       return_classes=False):
+    """
+    Test verisini sabit boyutlu batch'lerle tahmin eder ve submission
+    dosyasını artımlı olarak yazar.
+    
+    Her batch için argmax hemen alınır ve ImageId,Label satırları bir kuyruk
+    üzerinden yazıcı thread'ine gönderilir; böylece disk yazımı bir sonraki
+    batch'in tahminiyle eş zamanlı yürür. Bellek kullanımı test seti
+    boyutundan bağımsızdır ve ilk satırlar tüm tahminler bitmeden diske düşer.
+    
+    Parametreler:
+    ------------
+    model : keras.Model
+        Tahmin yapacak model (predict_on_batch() metoduna sahip herhangi bir nesne)
+    X_test : numpy array veya iterable
+        Test görüntüleri; dizi (memmap dahil) ya da batch üreten bir generator
+        (ör. stream_csv_batches(..., subset='all', shuffle=False))
+    submission_path : str
+        Submission dosyası kayıt yolu
+    batch_size : int
+        Tahmin batch boyutu (X_test dizi ise)
+    probabilities_path : str, optional
+        Olasılıkların yazılacağı .npy (sadece dizi girdisi) veya .parquet dosyası
+    write_buffer_size : int
+        Submission dosyası yazma tamponu (bayt)
+    queue_size : int
+        Yazıcı thread'inde bekleyebilecek en fazla batch sayısı
+    return_classes : bool
+        True ise tahmin edilen sınıflar da biriktirilip döndürülür (görüntü
+        başına tek tamsayı; olasılıklar bellekte tutulmaz)
+    
+    Döndürür:
+    --------
+    dict
+        'num_predictions', 'class_counts', 'elapsed' (saniye) ve
+        return_classes=True ise 'predicted_classes'
+    """
+    print("\n" + "="*60)
+    print("MODÜL 10: TAHMİN VE SUBMISSION (AKIŞ MODU)")
+    print("="*60)
+    
+    total_rows = len(X_test) if hasattr(X_test, 'shape') else None
+    prob_writer = _ProbabilityWriter(probabilities_path, total_rows) if probabilities_path else None
+    write_queue = queue.Queue(maxsize=queue_size)
+    errors = []
+    
+    def _writer():
+        try:
+            with open(submission_path, 'w', buffering=write_buffer_size, newline='') as f:
+                f.write('ImageId,Label\n')
+                while True:
+                    item = write_queue.get()
+                    if item is None:
+                        break
+                    offset, probabilities, labels = item
+                    ids = np.arange(offset + 1, offset + len(labels) + 1)
+                    np.savetxt(f, np.column_stack([ids, labels]), fmt='%d', delimiter=',')
+                    if prob_writer is not None:
+                        prob_writer.write(offset, probabilities, labels)
+        except Exception as exc:  # Hata ana thread'de yeniden yükseltilir
+            errors.append(exc)
+            while write_queue.get() is not None:
+                pass
+        finally:
+            if prob_writer is not None:
+                prob_writer.close()
+    
+    writer = threading.Thread(target=_writer, name='submission-writer', daemon=True)
+    writer.start()
+    
+    print(f"\nTest verisi üzerinde akış modunda tahmin yapılıyor (batch_size={batch_size})...")
+    start_time = time.perf_counter()
+    offset = 0
+    class_counts = None
+    predicted_batches = []
+    try:
+        for batch in _iter_batches(X_test, batch_size):
+            probabilities = np.asarray(model.predict_on_batch(batch))
+            labels = np.argmax(probabilities, axis=1)
+            counts = np.bincount(labels, minlength=probabilities.shape[1])
+            class_counts = counts if class_counts is None else class_counts + counts
+            if return_classes:
+                predicted_batches.append(labels)
+            write_queue.put((offset, probabilities if prob_writer is not None else None, labels))
+            offset += len(labels)
+            if errors:
+                break
+    finally:
+        write_queue.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
+    elapsed = time.perf_counter() - start_time
+    
+    print(f"\n✓ Tahminler tamamlandı!")
+    print(f"  - Toplam tahmin sayısı: {offset}")
+    print(f"  - Süre: {elapsed:.2f} sn ({offset / max(elapsed, 1e-9):,.0f} görüntü/sn)")
+    if class_counts is not None:
+        print(f"  - Tahmin dağılımı:")
+        for label, count in enumerate(class_counts):
+            print(f"    Rakam {label}: {count} örnek ({count/max(offset, 1)*100:.2f}%)")
+    print(f"✓ Submission dosyası kaydedildi: {submission_path}")
+    if probabilities_path:
+        print(f"✓ Olasılıklar kaydedildi: {probabilities_path}")
+    
+    summary = {
+        'num_predictions': offset,
+        'class_counts': class_counts,
+        'elapsed': elapsed
+    }
+    if return_classes:
+        summary['predicted_classes'] = (np.concatenate(predicted_batches) if predicted_batches
+                                        else np.zeros(0, dtype=np.int64))
+    return summary
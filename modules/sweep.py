@@ -0,0 +1,447 @@
+# ============================================================================
+# MODÜL 15: HİPERPARAMETRE / MİMARİ TARAMASI (SWEEP)
+# ============================================================================
+# config.py anahtarları (MODEL_TYPE, BATCH_SIZE, veri artırma aralıkları,
+# patience değerleri) üzerinde grid veya rastgele arama yapar. Denemeler
+# süreç havuzunda paralel çalışır; her süreç thread sayısı sınırlanarak
+# başlatılır, böylece CPU çekirdekleri aşırı paylaştırılmaz.
+#
+# Zayıf denemeler successive halving ile erken durdurulur: tüm denemeler
+# min_epochs ile başlar, her basamakta (rung) en iyi 1/eta kısmı eta kat
+# daha fazla epoch'a terfi eder. 'asha' terfileri beklemeden (asenkron),
+# 'sha' her basamağın tamamlanmasını bekleyerek yapar.
+#
+# Tüm sonuçlar tek bir tabloya yazılır:
+#   <output_dir>/results.csv     deneme x basamak başına bir satır
+#   <output_dir>/trials/<id>/    deneme checkpoint'leri ve logları
+# ============================================================================
+
+import os
+import csv
+import json
+import math
+import time
+import random
+import itertools
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+# Taramada değiştirilebilen config anahtarları
+SWEEP_KEYS = ('MODEL_TYPE', 'BATCH_SIZE', 'USE_AUGMENTATION', 'ROTATION_RANGE',
+              'WIDTH_SHIFT_RANGE', 'HEIGHT_SHIFT_RANGE', 'ZOOM_RANGE',
+              'EARLY_STOPPING_PATIENCE', 'REDUCE_LR_PATIENCE')
+THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS',
+                   'TF_NUM_INTRAOP_THREADS', 'TF_NUM_INTEROP_THREADS')
+
+
+def _validate_space(space):
+    unknown = sorted(set(space) - set(SWEEP_KEYS))
+    if unknown:
+        raise ValueError(f"Taranamayan config anahtarları: {', '.join(unknown)} "
+                         f"(desteklenenler: {', '.join(SWEEP_KEYS)})")
+
+
+def grid_search_space(space):
+    """
+    Arama uzayındaki tüm kombinasyonları döndürür.
+
+    Parametreler:
+    ------------
+    space : dict
+        config anahtarı -> değer listesi
+
+    Döndürür:
+    --------
+    list of dict
+    """
+    _validate_space(space)
+    for key, values in space.items():
+        if not isinstance(values, (list, tuple)):
+            raise ValueError(f"Grid aramada '{key}' için değer listesi gerekli")
+    keys = list(space)
+    return [dict(zip(keys, combination))
+            for combination in itertools.product(*(space[key] for key in keys))]
+
+
+def _sample_value(rng, spec):
+    if isinstance(spec, (list, tuple)):
+        return spec[rng.randrange(len(spec))]
+    low, high = spec['low'], spec['high']
+    if spec.get('log', False):
+        value = math.exp(rng.uniform(math.log(low), math.log(high)))
+    else:
+        value = rng.uniform(low, high)
+    return int(round(value)) if spec.get('type') == 'int' else value
+
+
+def random_search_space(space, num_trials, seed=13):
+    """
+    Arama uzayından rastgele num_trials deneme örnekler.
+
+    Parametreler:
+    ------------
+    space : dict
+        config anahtarı -> değer listesi veya dağılım
+        ({'low': 0, 'high': 15, 'type': 'int'} veya {'low':..., 'high':..., 'log': True})
+    num_trials : int
+        Deneme sayısı
+    seed : int
+        Örnekleme seed değeri
+
+    Döndürür:
+    --------
+    list of dict
+    """
+    _validate_space(space)
+    rng = random.Random(seed)
+    return [{key: _sample_value(rng, spec) for key, spec in space.items()}
+            for _ in range(num_trials)]
+
+
+class SuccessiveHalvingScheduler:
+    """
+    Successive halving / ASHA deneme zamanlayıcısı.
+
+    Parametreler:
+    ------------
+    min_epochs : int
+        İlk basamağın epoch bütçesi
+    max_epochs : int
+        Son basamağın epoch bütçesi
+    eta : int
+        Her basamakta terfi edenlerin oranı 1/eta, bütçe artışı eta kat
+    asynchronous : bool
+        True ise ASHA (basamak tamamlanmadan terfi), False ise senkron
+        successive halving
+    """
+
+    def __init__(self, min_epochs=1, max_epochs=9, eta=3, asynchronous=True):
+        budgets = []
+        budget = min_epochs
+        while budget < max_epochs:
+            budgets.append(budget)
+            budget *= eta
+        budgets.append(max_epochs)
+        self.budgets = budgets
+        self.eta = eta
+        self.asynchronous = asynchronous
+        self._results = [{} for _ in budgets]
+        self._promoted = [set() for _ in budgets]
+        self._running = [set() for _ in budgets]
+        self._exhausted = False
+
+    def _rung_complete(self, rung):
+        if self._running[rung]:
+            return False
+        if rung == 0:
+            return self._exhausted
+        # Alt basamak bitmiş, terfi edecek aday kalmamış ve terfi edenlerin hepsi raporlanmış
+        return (self._rung_complete(rung - 1) and not self._promotable(rung - 1)
+                and len(self._results[rung]) == len(self._promoted[rung - 1]))
+
+    def _promotable(self, rung):
+        results = self._results[rung]
+        count = len(results) // self.eta
+        if count == 0 or (not self.asynchronous and not self._rung_complete(rung)):
+            return []
+        top = sorted(results, key=results.get, reverse=True)[:count]
+        # Hatayla biten denemeler (-inf) terfi etmez
+        return [trial_id for trial_id in top
+                if trial_id not in self._promoted[rung] and results[trial_id] > float('-inf')]
+
+    def next_job(self, new_trial_id=None):
+        """
+        Çalıştırılacak sonraki işi seçer: önce terfi, yoksa yeni deneme.
+
+        Parametreler:
+        ------------
+        new_trial_id : int, optional
+            Başlatılabilecek yeni denemenin numarası (None ise yeni deneme kalmadı)
+
+        Döndürür:
+        --------
+        (trial_id, rung) veya None
+        """
+        self._exhausted = new_trial_id is None
+        for rung in reversed(range(len(self.budgets) - 1)):
+            candidates = self._promotable(rung)
+            if candidates:
+                trial_id = candidates[0]
+                self._promoted[rung].add(trial_id)
+                self._running[rung + 1].add(trial_id)
+                return trial_id, rung + 1
+        if new_trial_id is not None:
+            self._running[0].add(new_trial_id)
+            return new_trial_id, 0
+        return None
+
+    def report(self, trial_id, rung, score):
+        """Denemenin basamaktaki skorunu (yüksek daha iyi) kaydeder."""
+        self._running[rung].discard(trial_id)
+        self._results[rung][trial_id] = score
+
+
+def _init_worker(num_threads, use_gpu):
+    """Süreç havuzu başlatıcısı: thread sayısını TensorFlow import edilmeden sınırlar."""
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(num_threads)
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+    if not use_gpu:
+        os.environ['CUDA_VISIBLE_DEVICES'] = ''
+
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(num_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(min(2, num_threads))
+
+
+def _run_trial(job):
+    """
+    Bir denemeyi bir basamak boyunca eğitir (süreç havuzunda çalışır).
+
+    Önceki basamağın checkpoint'i varsa eğitim oradan (optimizer durumu ile
+    birlikte) devam eder.
+    """
+    import numpy as np
+    import config
+
+    for key, value in job['params'].items():
+        setattr(config, key, value)
+
+    os.makedirs(job['trial_dir'], exist_ok=True)
+    log_path = os.path.join(job['trial_dir'], 'log.txt')
+    start = time.perf_counter()
+    with open(log_path, 'a') as log, contextlib.redirect_stdout(log):
+        from tensorflow import keras
+        from modules.model_builder import create_cnn_model
+        from modules.callbacks import create_callbacks
+        from modules.model_trainer import train_model
+        from modules.data_augmentation_module import create_tf_dataset
+
+        data = {name: np.load(os.path.join(job['data_dir'], f'{name}.npy'), mmap_mode='r')
+                for name in ('X_train', 'Y_train', 'X_val', 'Y_val')}
+        last_path = os.path.join(job['trial_dir'], 'last.keras')
+        if job['initial_epoch'] > 0:
+            model = keras.models.load_model(last_path)
+        else:
+            # Aynı süreçte sıradaki denemeler derlenmiş graph'ı yeniden kullanır
+            model = create_cnn_model(config.INPUT_SHAPE, config.NUM_CLASSES, config.MODEL_TYPE,
+                                     compact_dtypes=job['compact_dtypes'],
+                                     summary=False, use_cache=True)
+
+        train_generator = None
+        if config.USE_AUGMENTATION:
+            # Süreç içinde ikinci bir süreç havuzu açmamak için tf.data motoru kullanılır
+            train_generator = create_tf_dataset(
+                data['X_train'], data['Y_train'], config.BATCH_SIZE,
+                rotation_range=config.ROTATION_RANGE,
+                width_shift_range=config.WIDTH_SHIFT_RANGE,
+                height_shift_range=config.HEIGHT_SHIFT_RANGE,
+                zoom_range=config.ZOOM_RANGE,
+                seed=job['seed']
+            )
+        callbacks = create_callbacks(
+            patience=config.EARLY_STOPPING_PATIENCE,
+            reduce_lr_patience=config.REDUCE_LR_PATIENCE,
+            model_save_path=os.path.join(job['trial_dir'], 'best.keras'),
+            # last.keras sonraki basamağın devam noktasıdır: son epoch'un ağırlıkları
+            # optimizer durumuyla birlikte kalmalı (en iyisi best.keras'ta)
+            restore_best_weights=False
+        )
+        history = train_model(
+            model, data['X_train'], data['Y_train'], data['X_val'], data['Y_val'],
+            train_generator=train_generator,
+            epochs=job['epochs'],
+            batch_size=config.BATCH_SIZE,
+            use_augmentation=config.USE_AUGMENTATION,
+            callbacks=callbacks,
+            initial_epoch=job['initial_epoch'],
+            verbose=0
+        )
+        model.save(last_path)
+
+    return {
+        'val_accuracy': float(max(history.history['val_accuracy'])),
+        'val_loss': float(min(history.history['val_loss'])),
+        'epochs_run': len(history.history['val_loss']),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _prepare_data(data_dir, synthetic_samples, compact_dtypes, seed):
+    """Veriyi bir kez .npy olarak kaydeder; işçiler memmap ile paylaşır."""
+    import numpy as np
+    import config
+
+    if synthetic_samples:
+        from benchmarks.synthetic import make_synthetic_mnist
+        X, Y = make_synthetic_mnist(synthetic_samples, config.NUM_CLASSES,
+                                    compact_dtypes=compact_dtypes, seed=seed)
+        split = int(len(X) * (1 - config.VALIDATION_SPLIT))
+        arrays = {'X_train': X[:split], 'Y_train': Y[:split], 'X_val': X[split:], 'Y_val': Y[split:]}
+    else:
+        from modules.data_loader import load_and_preprocess_data
+        X_train, X_val, Y_train, Y_val, _ = load_and_preprocess_data(
+            config.TRAIN_PATH, config.TEST_PATH,
+            validation_split=config.VALIDATION_SPLIT,
+            random_state=config.RANDOM_STATE,
+            use_cache=config.USE_DATA_CACHE,
+            cache_dir=config.DATA_CACHE_DIR,
+            compact_dtypes=compact_dtypes
+        )
+        arrays = {'X_train': X_train, 'Y_train': Y_train, 'X_val': X_val, 'Y_val': Y_val}
+
+    os.makedirs(data_dir, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(os.path.join(data_dir, f'{name}.npy'), array)
+
+
+def _write_results(path, rows, keys):
+    fields = (['trial_id', 'rung', 'epochs'] + list(keys)
+              + ['val_accuracy', 'val_loss', 'epochs_run', 'seconds', 'status'])
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, path)
+
+
+def run_sweep(space, mode='random', num_trials=16, scheduler='asha', min_epochs=1,
+              max_epochs=9, eta=3, num_workers=4, threads_per_trial=None,
+              output_dir='sweeps/latest', synthetic_samples=None, compact_dtypes=True,
+              use_gpu=False, seed=13):
+    """
+    Hiperparametre / mimari taramasını çalıştırır.
+
+    Parametreler:
+    ------------
+    space : dict
+        config anahtarı -> değer listesi (grid) veya dağılım (random)
+    mode : str
+        'grid' veya 'random'
+    num_trials : int
+        'random' modunda deneme sayısı
+    scheduler : str
+        'asha' (asenkron successive halving), 'sha' (senkron) veya 'none'
+        (her deneme max_epochs boyunca eğitilir)
+    min_epochs, max_epochs, eta : int
+        Successive halving basamak bütçeleri
+    num_workers : int
+        Paralel deneme (süreç) sayısı
+    threads_per_trial : int, optional
+        Süreç başına CPU thread sayısı (None ise çekirdekler işçilere bölünür)
+    output_dir : str
+        Sonuç tablosu, veri ve deneme checkpoint'lerinin klasörü
+    synthetic_samples : int, optional
+        Verilirse data/train.csv yerine bu kadar sentetik örnek kullanılır
+    compact_dtypes : bool
+        uint8 piksel / tamsayı etiket kullanılsın mı?
+    use_gpu : bool
+        False ise işçi süreçlerinde GPU gizlenir
+    seed : int
+        Örnekleme ve veri artırma seed değeri
+
+    Döndürür:
+    --------
+    list of dict
+        Sonuç tablosunun satırları
+    """
+    print("\n" + "="*60)
+    print("MODÜL 15: HİPERPARAMETRE TARAMASI")
+    print("="*60)
+
+    if mode == 'grid':
+        trials = grid_search_space(space)
+    elif mode == 'random':
+        trials = random_search_space(space, num_trials, seed)
+    else:
+        raise ValueError(f"Geçersiz arama modu: {mode}")
+    if scheduler == 'none':
+        min_epochs = max_epochs
+    elif scheduler not in ('asha', 'sha'):
+        raise ValueError(f"Geçersiz zamanlayıcı: {scheduler}")
+    halving = SuccessiveHalvingScheduler(min_epochs, max_epochs, eta,
+                                         asynchronous=(scheduler != 'sha'))
+    threads_per_trial = threads_per_trial or max(1, (os.cpu_count() or 1) // num_workers)
+
+    data_dir = os.path.join(output_dir, 'data')
+    results_path = os.path.join(output_dir, 'results.csv')
+    _prepare_data(data_dir, synthetic_samples, compact_dtypes, seed)
+    with open(os.path.join(output_dir, 'space.json'), 'w') as f:
+        json.dump({'mode': mode, 'space': space, 'trials': trials,
+                   'budgets': halving.budgets}, f, indent=2)
+
+    print(f"  - {len(trials)} deneme ({mode}), zamanlayıcı: {scheduler}, "
+          f"basamak bütçeleri (epoch): {halving.budgets}")
+    print(f"  - {num_workers} süreç x {threads_per_trial} thread")
+
+    keys = list(space)
+    rows = []
+    running = {}
+    next_trial = 0
+    start = time.perf_counter()
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=context,
+                             initializer=_init_worker,
+                             initargs=(threads_per_trial, use_gpu)) as pool:
+        while True:
+            while len(running) < num_workers:
+                job = halving.next_job(next_trial if next_trial < len(trials) else None)
+                if job is None:
+                    break
+                trial_id, rung = job
+                if rung == 0:
+                    next_trial += 1
+                payload = {
+                    'params': trials[trial_id],
+                    'data_dir': data_dir,
+                    'trial_dir': os.path.join(output_dir, 'trials', f'{trial_id:03d}'),
+                    'initial_epoch': halving.budgets[rung - 1] if rung else 0,
+                    'epochs': halving.budgets[rung],
+                    'compact_dtypes': compact_dtypes,
+                    'seed': seed + trial_id,
+                }
+                running[pool.submit(_run_trial, payload)] = (trial_id, rung)
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                trial_id, rung = running.pop(future)
+                row = {'trial_id': trial_id, 'rung': rung, 'epochs': halving.budgets[rung],
+                       **trials[trial_id]}
+                try:
+                    row.update(future.result(), status='ok')
+                    score = row['val_accuracy']
+                except Exception as exc:
+                    row['status'] = f'hata: {exc}'
+                    score = float('-inf')
+                halving.report(trial_id, rung, score)
+                rows.append(row)
+                _write_results(results_path, rows, keys)
+                print(f"  [{time.perf_counter() - start:7.1f}s] deneme {trial_id:3d} "
+                      f"basamak {rung} ({row['epochs']} epoch): "
+                      + (f"val_acc={row['val_accuracy']:.4f}" if row['status'] == 'ok'
+                         else row['status']))
+
+    # Her denemenin ulaştığı en yüksek basamaktaki sonucu
+    final = {}
+    for row in rows:
+        if row['trial_id'] not in final or row['rung'] >= final[row['trial_id']]['rung']:
+            final[row['trial_id']] = row
+    leaderboard = sorted(final.values(),
+                         key=lambda r: (r['rung'], r.get('val_accuracy', float('-inf'))),
+                         reverse=True)
+
+    print("\n✓ Tarama tamamlandı "
+          f"({time.perf_counter() - start:.1f} s, {sum(r['epochs_run'] for r in rows if r['status'] == 'ok')} epoch)")
+    print(f"  - Sonuç tablosu: {results_path}")
+    print("  - En iyi denemeler:")
+    for row in leaderboard[:5]:
+        params = ', '.join(f"{key}={row[key]}" for key in keys)
+        accuracy = row.get('val_accuracy')
+        print(f"    #{row['trial_id']:03d} ({row['epochs']} epoch) "
+              + (f"val_acc={accuracy:.4f}" if accuracy is not None else row['status'])
+              + f" | {params}")
+    return rows
@@ -2,27 +2,15 @@
 # MODÜL 8: EĞİTİM GEÇMİŞİNİ GÖRSELLEŞTİRME
 # ============================================================================
 
-import matplotlib.pyplot as plt
+from modules.plotting import submit_figure
 
 
-def plot_training_history(history):
-    """
-    Eğitim geçmişini görselleştirir.
-    
-    Parametreler:
-    ------------
-    history : keras.callbacks.History
-        Eğitim geçmişi
-    """
-    print("\n" + "="*60)
-    print("MODÜL 8: EĞİTİM GEÇMİŞİNİ GÖRSELLEŞTİRME")
-    print("="*60)
-    
-    fig, axes = plt.subplots(1, 2, figsize=(15, 5))
+def _draw_training_history(fig, history):
+    axes = fig.subplots(1, 2)
     
     # Accuracy grafiği
-    axes[0].plot(history.history['accuracy'], label='Eğitim Accuracy')
-    axes[0].plot(history.history['val_accuracy'], label='Doğrulama Accuracy')
+    axes[0].plot(history['accuracy'], label='Eğitim Accuracy')
+    axes[0].plot(history['val_accuracy'], label='Doğrulama Accuracy')
     axes[0].set_title('Model Accuracy', fontsize=14)
     axes[0].set_xlabel('Epoch', fontsize=12)
     axes[0].set_ylabel('Accuracy', fontsize=12)
@@ -30,16 +18,35 @@ def plot_training_history(history):
     axes[0].grid(True)
     
     # Loss grafiği
-    axes[1].plot(history.history['loss'], label='Eğitim Loss')
-    axes[1].plot(history.history['val_loss'], label='Doğrulama Loss')
+    axes[1].plot(history['loss'], label='Eğitim Loss')
+    axes[1].plot(history['val_loss'], label='Doğrulama Loss')
     axes[1].set_title('Model Loss', fontsize=14)
     axes[1].set_xlabel('Epoch', fontsize=12)
     axes[1].set_ylabel('Loss', fontsize=12)
     axes[1].legend()
     axes[1].grid(True)
     
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+
+
+def plot_training_history(history):
+    """
+    Eğitim geçmişini görselleştirir.
+    
+    Grafik modules.plotting ile ayarlanan moda göre gösterilir, arka planda
+    dosyaya kaydedilir veya atlanır.
+    
+    Parametreler:
+    ------------
+    history : keras.callbacks.History
+        Eğitim geçmişi
+    """
+    print("\n" + "="*60)
+    print("MODÜL 8: EĞİTİM GEÇMİŞİNİ GÖRSELLEŞTİRME")
+    print("="*60)
+    
+    values = {key: list(history.history[key])
+              for key in ('accuracy', 'val_accuracy', 'loss', 'val_loss')}
+    submit_figure('training_history', (15, 5), _draw_training_history, values)
     
     print("✓ Eğitim geçmişi görselleştirildi!")
-